@@ -0,0 +1,7 @@
+"""
+This package contains the micro-benchmarks of the Game library, which time each hot path of the engine on its own, and compare
+the results against a stored baseline.
+
+    python3 -m benchmarks run --output benchmarks.json
+    python3 -m benchmarks compare baseline.json benchmarks.json --threshold 10
+"""
@@ -0,0 +1,91 @@
+"""
+Micro-benchmarks of the Game library.
+
+Run the benchmarks and write the results as JSON, optionally only some of them:
+
+    python3 -m benchmarks run --output benchmarks.json
+    python3 -m benchmarks run --output benchmarks.json --only Wall.place_tile_onto_wall full_game
+
+Compare results against a baseline. The command exits with a status of 1 if any case got slower by more than the threshold:
+
+    python3 -m benchmarks compare baseline.json benchmarks.json --threshold 10
+"""
+
+import argparse
+import sys
+from typing import Any
+from .cases import CASES
+from .runner import (
+    Comparison,
+    compare_results,
+    find_regressions,
+    read_results,
+    run_benchmarks,
+    write_results,
+)
+
+
+def _format_seconds(seconds: float | None) -> str:
+    # Times are shown in microseconds, which suits every case but the full game, or as "-" if the case is missing.
+    return "-" if seconds is None else f"{seconds * 1e6:.2f}us"
+
+
+def _run(arguments: argparse.Namespace) -> int:
+    results: dict[str, Any] = run_benchmarks(arguments.only, arguments.repeat)
+    for name, result in results["results"].items():
+        print(f"{name:<42} {_format_seconds(result['seconds_per_call'])}")
+    if arguments.output is not None:
+        write_results(arguments.output, results)
+        print(f"Results written to {arguments.output}")
+    return 0
+
+
+def _compare(arguments: argparse.Namespace) -> int:
+    comparisons: list[Comparison] = compare_results(
+        read_results(arguments.baseline), read_results(arguments.current)
+    )
+    for comparison in comparisons:
+        change: str = (
+            "-" if comparison.change is None else f"{comparison.change:+.1f}%"
+        )
+        # A case missing from the current results is a regression, so it's marked as missing.
+        if comparison.baseline is not None and comparison.current is None:
+            change = "missing"
+        print(
+            f"{comparison.name:<42} {_format_seconds(comparison.baseline):>14} "
+            f"{_format_seconds(comparison.current):>14} {change:>8}"
+        )
+
+    regressions: list[Comparison] = find_regressions(
+        comparisons, arguments.threshold
+    )
+    if regressions:
+        print(
+            f"{len(regressions)} benchmark(s) got slower by more than {arguments.threshold}% or are missing: "
+            f"{', '.join(comparison.name for comparison in regressions)}"
+        )
+        return 1
+    print(f"No benchmark got slower by more than {arguments.threshold}%.")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--output", default=None)
+    run_parser.add_argument("--only", nargs="+", choices=list(CASES))
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.set_defaults(handler=_run)
+
+    compare_parser = commands.add_parser(
+        "compare", help="compare results against a baseline"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=10.0)
+    compare_parser.set_defaults(handler=_compare)
+
+    parsed_arguments: argparse.Namespace = parser.parse_args()
+    sys.exit(parsed_arguments.handler(parsed_arguments))
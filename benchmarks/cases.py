@@ -0,0 +1,206 @@
+"""
+Module containing the benchmark cases, one for each hot path of the engine, and one for a full game.
+
+Each case sets up its own objects from a fixed seed, and returns a function that calls the path a number of times, along with
+that number. Paths that change what they're called on (i.e. drawing from the bag) are reset, so every call times the same work.
+The case returns the reset along with the function, and the runner calls it after every call of the function, without timing it.
+"""
+
+from collections.abc import Callable
+from random import Random
+from game import Game, Move
+from game.bag import Bag
+from game.board import Board
+from game.board.pattern_line import PatternLine
+from game.board.wall import Wall
+from game.factory import Factory
+from game.simulate import play_game, random_policy
+from game.tile import Tile, TILES
+
+# The seed every case is set up with.
+SEED: int = 0
+
+# A case returns the function to time, and the number of calls of the path it makes, optionally followed by the reset to call
+# after the function, which isn't timed.
+Case = Callable[
+    [],
+    tuple[Callable[[], object], int]
+    | tuple[Callable[[], object], int, Callable[[], object]],
+]
+
+
+def bag_remove_tiles() -> (
+    tuple[Callable[[], object], int, Callable[[], object]]
+):
+    # Draw the tiles for 9 factories from a full bag. The bag is filled again by the reset.
+    bag: Bag = Bag(Random(SEED))
+    full_counts: tuple[int, ...] = bag.return_tile_counts()
+
+    def run() -> None:
+        bag.remove_tiles_from_bag(9)
+
+    def reset() -> None:
+        bag.restore_tile_counts(full_counts)
+
+    return run, 1, reset
+
+
+def bag_add_tiles() -> tuple[Callable[[], object], int, Callable[[], object]]:
+    # Put 20 tiles (a round's worth from the lid) back into an empty bag. The bag is emptied again by the reset.
+    bag: Bag = Bag(Random(SEED))
+    empty_counts: tuple[int, ...] = (0,) * len(TILES)
+    rng: Random = Random(SEED)
+    tiles: list[Tile] = [TILES[rng.randrange(len(TILES))] for _ in range(20)]
+
+    def run() -> None:
+        bag.add_tiles_to_bag(tiles)
+
+    def reset() -> None:
+        bag.restore_tile_counts(empty_counts)
+
+    reset()
+    return run, 1, reset
+
+
+def factory_remove_tiles() -> (
+    tuple[Callable[[], object], int, Callable[[], object]]
+):
+    # Take a tile type from each of 9 full factories. The factories are put back by the reset.
+    factory: Factory = Factory()
+    factory.add_tiles_to_factories(Bag(Random(SEED)).remove_tiles_from_bag(9))
+    selections: list[tuple[int, str, bytes]] = [
+        (
+            factory_index,
+            str(next(iter(tiles))),
+            factory.return_factory_counts(factory_index),
+        )
+        for factory_index, tiles in enumerate(factory)
+    ]
+
+    def run() -> None:
+        for factory_index, tile_type, _ in selections:
+            factory.remove_all_instances_of_tile(tile_type, factory_index)
+
+    def reset() -> None:
+        for factory_index, _, factory_counts in selections:
+            factory.restore_factory(factory_index, factory_counts)
+
+    return run, len(selections), reset
+
+
+def game_select_from_center() -> (
+    tuple[Callable[[], object], int, Callable[[], object]]
+):
+    # Take a tile type from the center of the table (along with the start marker). The selection is undone by the reset.
+    game: Game = Game(seed=SEED)
+    game.initialise_players(num_of_players=4)
+    game.initalise_factories()
+    # A few moves from the factories fill the center with their discarded tiles.
+    for factory_index in range(3):
+        game.apply_move(
+            next(
+                move
+                for move in game.legal_moves()
+                if move.source == factory_index
+            )
+        )
+    tile_type: str = str(
+        next(tile for tile in game.return_center() if tile != "start")
+    )
+    player_index: int = game.return_current_player()
+
+    def run() -> None:
+        game.select_from_center(tile_type=tile_type, player_index=player_index)
+
+    return run, 1, game.undo
+
+
+def game_end_round() -> tuple[Callable[[], object], int, Callable[[], object]]:
+    # Tile every wall at the end of a 4 player round. The end of the round is undone by the reset.
+    game: Game = Game(seed=SEED)
+    game.initialise_players(num_of_players=4)
+    game.initalise_factories()
+    rng: Random = Random(SEED)
+    moves: list[Move] = list(game.legal_moves())
+    while moves:
+        game.apply_move(rng.choice(moves))
+        moves = list(game.legal_moves())
+
+    def run() -> None:
+        game.end_round(refill=False)
+
+    return run, 1, game.undo
+
+
+def pattern_line_place_tiles() -> (
+    tuple[Callable[[], object], int, Callable[[], object]]
+):
+    # Place 3 tiles onto each of the last 3 pattern lines. The tiles are taken off again by the reset.
+    pattern_line: PatternLine = PatternLine()
+    tiles: list[Tile] = [TILES[0]] * 3
+
+    def run() -> None:
+        for line_index in range(2, 5):
+            pattern_line.place_tile_onto_pattern_line(
+                tiles, "blue", line_index
+            )
+
+    def reset() -> None:
+        for line_index in range(2, 5):
+            pattern_line.remove_tiles_from_pattern_line(line_index, 3)
+
+    return run, 3, reset
+
+
+def wall_place_tile() -> (
+    tuple[Callable[[], object], int, Callable[[], object]]
+):
+    # Fill a wall one tile at a time, in a fixed random order. The wall is cleared by the reset.
+    wall: Wall = Wall()
+    cells: list[tuple[int, int]] = [
+        divmod(cell, 5) for cell in Random(SEED).sample(range(25), 25)
+    ]
+
+    def run() -> None:
+        for row, column in cells:
+            wall.place_tile_onto_wall(row, column, "blue")
+
+    def reset() -> None:
+        wall.restore_occupancy(0)
+
+    return run, len(cells), reset
+
+
+def board_add_final_scores() -> tuple[Callable[[], object], int]:
+    # Add the final bonus of a board with a part-filled wall.
+    board: Board = Board()
+    occupancy: int = 0
+    for cell in Random(SEED).sample(range(25), 15):
+        occupancy |= 1 << cell
+    board.restore_state((-1, 0) * 5, (0,) * len(TILES), occupancy, 0, None)
+
+    def run() -> None:
+        board.add_final_scores()
+
+    return run, 1
+
+
+def full_game() -> tuple[Callable[[], object], int]:
+    # Play a whole 2 player game of random play, as game.simulate does.
+    def run() -> None:
+        play_game(2, random_policy, SEED)
+
+    return run, 1
+
+
+CASES: dict[str, Case] = {
+    "Bag.remove_tiles_from_bag": bag_remove_tiles,
+    "Bag.add_tiles_to_bag": bag_add_tiles,
+    "Factory.remove_all_instances_of_tile": factory_remove_tiles,
+    "Game.select_from_center": game_select_from_center,
+    "Game.end_round": game_end_round,
+    "PatternLine.place_tile_onto_pattern_line": pattern_line_place_tiles,
+    "Wall.place_tile_onto_wall": wall_place_tile,
+    "Board.add_final_scores": board_add_final_scores,
+    "full_game": full_game,
+}
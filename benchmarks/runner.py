@@ -0,0 +1,181 @@
+"""
+Module containing the benchmark runner, which times the cases with timeit (and a case with a reset call by call, leaving the reset
+out) and writes the results as JSON, and the comparison of two sets of results.
+"""
+
+import gc
+import json
+import platform
+import time
+import statistics
+import timeit
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple
+from .cases import CASES, SEED
+
+# The version of the results format, which is bumped whenever it changes.
+RESULTS_VERSION: int = 1
+
+
+class Comparison(NamedTuple):
+    """
+    Class that holds the comparison of a case between the baseline and the current results: the seconds per call of each (None
+    if the case is missing from one of them), and the change as a percentage of the baseline.
+    """
+
+    name: str
+    baseline: float | None
+    current: float | None
+    change: float | None
+
+
+def _time_with_reset(
+    run: Callable[[], object], reset: Callable[[], object], number: int
+) -> float:
+    """
+    Function that takes the function of a case, its reset and a number of calls, and returns the seconds spent in the function over
+    that many calls.
+
+    Each call is timed on its own, and the case is reset after it, outside of the timing. Garbage collection is turned off while
+    timing, as timeit does.
+    """
+    perf_counter: Callable[[], float] = time.perf_counter
+    seconds: float = 0.0
+    gc_enabled: bool = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(number):
+            start: float = perf_counter()
+            run()
+            seconds += perf_counter() - start
+            reset()
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return seconds
+
+
+def run_benchmarks(
+    names: Iterable[str] | None = None, repeat: int = 5
+) -> dict[str, Any]:
+    """
+    Function that takes the names of the cases to run (every case by default) and the number of times to repeat each one, and
+    returns the results, ready to be written as JSON.
+
+    Each case is called enough times to take at least 0.2 seconds, and that is repeated. The fastest repeat is the one compared,
+    as it's the least disturbed by anything else running on the machine. If the case returns its reset, it's called after every
+    call of the case, and left out of the time.
+    """
+    selected: list[str] = list(CASES) if names is None else list(names)
+    # Validation to ensure every case exists.
+    unknown: list[str] = [name for name in selected if name not in CASES]
+    if unknown:
+        raise ValueError(
+            {
+                "class": "runner",
+                "method": "run_benchmarks",
+                "message": f"Unknown benchmark(s): {', '.join(unknown)}. Please choose from {', '.join(CASES)}.",
+            }
+        )
+
+    results: dict[str, dict[str, float | int]] = {}
+    for name in selected:
+        run, calls, *reset = CASES[name]()
+        if reset:
+            # The number of calls is found with the reset included, so the repeats still take at least 0.2 seconds each.
+            number, _ = timeit.Timer(lambda: (run(), reset[0]())).autorange()
+            repeat_seconds: list[float] = [
+                _time_with_reset(run, reset[0], number) for _ in range(repeat)
+            ]
+        else:
+            timer: timeit.Timer = timeit.Timer(run)
+            number, _ = timer.autorange()
+            repeat_seconds = timer.repeat(repeat, number)
+        seconds_per_call: list[float] = [
+            seconds / (number * calls) for seconds in repeat_seconds
+        ]
+        results[name] = {
+            "seconds_per_call": min(seconds_per_call),
+            "median_seconds_per_call": statistics.median(seconds_per_call),
+            "calls": number * calls * repeat,
+        }
+
+    return {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": SEED,
+        "results": results,
+    }
+
+
+def write_results(path: str, results: dict[str, Any]) -> None:
+    """
+    Function that takes a path and the results of run_benchmarks, and writes them to the path as JSON.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+        file.write("\n")
+
+
+def read_results(path: str) -> dict[str, Any]:
+    """
+    Function that takes the path of results written by write_results, and reads them.
+    """
+    with open(path, encoding="utf-8") as file:
+        results: dict[str, Any] = json.load(file)
+    # Validation to ensure the results are in a format this runner understands.
+    if results.get("version") != RESULTS_VERSION:
+        raise ValueError(
+            {
+                "class": "runner",
+                "method": "read_results",
+                "message": f"{path} isn't a version {RESULTS_VERSION} benchmark results file.",
+            }
+        )
+    return results
+
+
+def compare_results(
+    baseline: dict[str, Any], current: dict[str, Any]
+) -> list[Comparison]:
+    """
+    Function that takes the baseline results and the current results, and compares the seconds per call of every case in
+    either of them.
+
+    A positive change means the case got slower.
+    """
+    baseline_results: dict[str, Any] = baseline["results"]
+    current_results: dict[str, Any] = current["results"]
+    comparisons: list[Comparison] = []
+    for name in dict.fromkeys([*baseline_results, *current_results]):
+        before: float | None = baseline_results.get(name, {}).get(
+            "seconds_per_call"
+        )
+        after: float | None = current_results.get(name, {}).get(
+            "seconds_per_call"
+        )
+        change: float | None = (
+            (after - before) / before * 100
+            if before and after is not None
+            else None
+        )
+        comparisons.append(Comparison(name, before, after, change))
+    return comparisons
+
+
+def find_regressions(
+    comparisons: Iterable[Comparison], threshold: float
+) -> list[Comparison]:
+    """
+    Function that takes the comparisons and a threshold percentage, and returns the cases that got slower by more than the
+    threshold, along with the cases of the baseline that are missing from the current results.
+
+    A case that's only in the current results is new, so it isn't a regression.
+    """
+    return [
+        comparison
+        for comparison in comparisons
+        if (comparison.baseline is not None and comparison.current is None)
+        or (comparison.change is not None and comparison.change > threshold)
+    ]
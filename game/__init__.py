@@ -5,5 +5,23 @@ This module contains the Game library.
 from .game import Game
 from .tile import Tile
 from .rule_error import RuleError
+from .move import Move, CENTER, FLOOR
+from .state import GameState
+from .view import GameView
+from .record import GameRecord
+from .instrumentation import Instrumentation
+from .summary import RoundSummary
 
-__all__ = ("Game", "Tile", "RuleError")
+__all__ = (
+    "Game",
+    "Tile",
+    "RuleError",
+    "Move",
+    "CENTER",
+    "FLOOR",
+    "GameState",
+    "GameView",
+    "GameRecord",
+    "Instrumentation",
+    "RoundSummary",
+)
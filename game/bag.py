@@ -2,107 +2,168 @@
 Module containing the Bag class implementation.
 """
 
-from random import randrange
-from typing import Any
-from collections.abc import Iterator, Mapping
-from .tile import Tile
+from array import array
+from collections import Counter
+from random import Random
+from typing import TYPE_CHECKING
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from .tile import Tile, TILES, TILE_TYPES
 from .rule_error import RuleError
 
+if TYPE_CHECKING:
+    from numpy.random import Generator
+
 
 class Bag:
     """
     Factory class responsible for the creation of Tiles.
+
+    The bag holds the count of each tile type in a fixed 5-slot array, in the order of TILE_TYPES.
     """
 
-    __tile_set: set[str] = {"black", "ice", "blue", "yellow", "red"}
-    __tile_bag: dict[Tile, int] = {}
+    __tile_types: tuple[str, ...] = TILE_TYPES
+    __tile_indexes: dict[str, int] = {
+        tile_type: index for index, tile_type in enumerate(TILE_TYPES)
+    }
+    __tile_counts: array
+    __rng: "Random | Generator"
+    __view: memoryview | None
 
-    def __init__(self: Any) -> None:
+    def __init__(self, rng: "Random | Generator | None" = None) -> None:
         """
-        Constructor method that iterates through each tile type in the tile set and adds 20 to the tile bag.
+        Constructor method that adds 20 tiles of each type to the tile bag.
 
-        This populates the tile bag with 20 tiles of each type.
+        It optionally takes a random.Random or NumPy Generator, which is used for every draw from this bag.
         """
+        self.__tile_counts = array("B", [20] * len(self.__tile_types))
+        self.__rng = rng if rng is not None else Random()
+        self.__view = None
 
-        for tile in self.__tile_set:
-            self.__tile_bag[tile] = 20
-
-    def __iter__(self: Any) -> Iterator[dict[Tile, int]]:
+    def __iter__(self) -> Iterator[Tile]:
         """
-        Iterator that loops through the bag, and for each item returns a 'count' number of tiles.
+        Iterator that loops through the bag, and for each tile type returns a 'count' number of tiles.
         """
-        tiles = self.__tile_bag
-        for item, count in tiles.items():
+        for tile, count in zip(TILES, self.__tile_counts):
             for _ in range(count):
-                yield item
-
-    def _list_to_mapping(self, tiles: list[Tile]) -> Mapping[Tile, int]:
-        """
-        This method takes a list and converts it to a mapping of Tile -> int.
-        """
-        tile_mapping: dict[Tile, int] = {}
-        # For each tile in tile list,
-        for tile in tiles:
-            tile_count: int = 0
-            # count each occurence of the tile,
-            for _, current_tile in enumerate(tiles):
-                if current_tile == tile:
-                    # increment the count of that tile
-                    tile_count += 1
-            # and then add the count to the tile_mapping with the tile as a key.
-            tile_mapping[tile] = tile_count
-
-        return tile_mapping
-
-    def _update(self, new_tile_counts: Mapping[Tile, int]) -> None:
-        """
-        Update method that provides a Mapping of tiles and their count to be updated.
-        """
-        tiles = self.__tile_bag
-        for (
-            tile,
-            count,
-        ) in new_tile_counts.items():  # It loops through the Mapping provided
-            new_count = (
-                tiles.get(tile, 0) + count
-            )  # If the tile already exists, it'll add the new count to it, otherwise it's set to 0
-            if new_count > 0:
-                tiles[
-                    tile
-                ] = new_count  # Updates the bag with the new tile count
-            elif (
-                tile in tiles
-            ):  # Otherwise if the count is negative, it will remove that many items from the bag.
-                del tiles[tile]
-
-    def _remove(self, *tiles_to_remove: Tile) -> None:
-        """
-        Remove method that provides Tile to be removed, and calls the _update method to remove it.
-        """
-        remove_tile_counts: dict[Tile, int] = {}
-        # For each tile to remove,
-        for tile in tiles_to_remove:
-            # Get the current count and subtract it by 1.
-            remove_tile_counts[tile] = remove_tile_counts.get(tile, 0) - 1
-        # Then update it with the new count.
-        self._update(remove_tile_counts)
+                yield tile
+
+    def _list_to_mapping(self, tiles: Iterable[Tile]) -> Mapping[str, int]:
+        """
+        This method takes a list and converts it to a mapping of tile type -> int, counting each tile in a single pass.
+        """
+        return Counter(str(tile) for tile in tiles)
+
+    def _update(self, new_tile_counts: Mapping[str, int]) -> None:
+        """
+        Update method that provides a Mapping of tile types and their count to be updated.
+        """
+        tile_counts: list[int] = [0] * len(self.__tile_types)
+        # It loops through the Mapping provided,
+        for tile_type, count in new_tile_counts.items():
+            tile_index: int | None = self.__tile_indexes.get(tile_type)
+            # Only the five tile types are kept in the bag, so anything else (i.e. the start marker) is skipped.
+            if tile_index is None:
+                continue
+            # and adds the count to the count of its tile type. If the count is negative, it will remove that many items from the bag.
+            tile_counts[tile_index] += count
+        self._update_counts(tile_counts)
+
+    def _update_counts(self, new_tile_counts: Sequence[int]) -> None:
+        """
+        Update method that provides the count of each tile type to be added, in the order of TILE_TYPES.
+        """
+        tiles = self.__tile_counts
+        # Validation to ensure more tiles aren't removed than there are in the bag, before any count is changed.
+        for tile_index, count in enumerate(new_tile_counts):
+            if tiles[tile_index] + count < 0:
+                raise ValueError(
+                    {
+                        "class": "Bag",
+                        "method": "_update_counts",
+                        "message": f"Cannot remove {-count} '{self.__tile_types[tile_index]}' tiles, as the bag only has {tiles[tile_index]}.",
+                    }
+                )
+        for tile_index, count in enumerate(new_tile_counts):
+            tiles[tile_index] += count
+
+    def _draw(self, num_of_tiles: int) -> list[int]:
+        """
+        Method that draws up to num_of_tiles tiles from the bag without replacement, weighted by the count of each tile type.
+
+        It returns the indexes of the drawn tile types, in the order they were drawn.
+        """
+        tiles = self.__tile_counts
+        total: int = sum(tiles)
+        # If there aren't enough tiles in the bag, the remaining tiles are drawn.
+        num_of_tiles = min(num_of_tiles, total)
+        drawn: list[int] = []
+
+        # A NumPy Generator draws the count of every tile type in one call, which is then shuffled into a random order.
+        if hasattr(self.__rng, "multivariate_hypergeometric"):
+            drawn_counts = self.__rng.multivariate_hypergeometric(
+                list(tiles), num_of_tiles
+            )
+            for tile_index, count in enumerate(drawn_counts):
+                tiles[tile_index] -= int(count)
+                drawn += [tile_index] * int(count)
+            self.__rng.shuffle(drawn)
+            return drawn
+
+        # Otherwise, for each tile a random number is generated below the total,
+        randrange = self.__rng.randrange
+        for _ in range(num_of_tiles):
+            pick: int = randrange(total)
+            tile_index = 0
+            # and the tile type whose count covers that number is drawn.
+            while pick >= tiles[tile_index]:
+                pick -= tiles[tile_index]
+                tile_index += 1
+            tiles[tile_index] -= 1
+            total -= 1
+            drawn.append(tile_index)
+
+        return drawn
 
     def __len__(self) -> int:
-        return sum(self.__tile_bag.values())
+        return sum(self.__tile_counts)
 
     def return_tile_bag(self) -> list[Tile]:
         """
         Method that returns the tiles in the bag as a list.
         """
         # For each tile in the tile bag, it's added to a list and returned.
-        tiles_list: list[Tile] = [tile for tile in self.__tile_bag]
+        tiles_list: list[Tile] = [tile for tile in self]
         return tiles_list
 
+    def view(self) -> memoryview:
+        """
+        Method that returns a read-only memoryview of the count of each tile type in the bag, in the order of TILE_TYPES.
+
+        The memoryview reads the counts as they are whenever it's accessed, so it's only created once.
+        """
+        if self.__view is None:
+            self.__view = memoryview(self.__tile_counts).toreadonly()
+        return self.__view
+
+    def return_tile_counts(self) -> tuple[int, ...]:
+        """
+        Method that returns the count of each tile type in the bag, in the order of TILE_TYPES.
+        """
+        return tuple(self.__tile_counts)
+
+    def restore_tile_counts(self, tile_counts: Sequence[int]) -> None:
+        """
+        Method that takes the count of each tile type, in the order of TILE_TYPES, and replaces the tiles in the bag with them.
+        """
+        # The counts are replaced in place, so any view of them stays valid.
+        self.__tile_counts[:] = array("B", tile_counts)
+
     def remove_tiles_from_bag(self, num_of_factories: int) -> list[Tile]:
         """
         This method takes in the number of Factories, and randomly removes 4 * the number of Factories and returns them.
 
-        For example, if there are 5 factories, 20 random tiles are removed from the bag and returned.
+        For example, if there are 5 factories, 20 random tiles are removed from the bag and returned. If there are fewer tiles left in
+        the bag, all of them are removed.
         """
         # Validation to ensure the number of factories is 5, 7, or 9.
         # Otherwise it throws a RuleError.
@@ -115,36 +176,39 @@ class Bag:
                 }
             )
 
-        tiles_to_remove: list[Tile] = []
-        tiles_list: list[Tile] = [
-            tile for tile in self.__tile_bag
-        ]  # A list is created of all the colours of the tile that exists in the bag.
-
-        if not tiles_list:
-            return []
-
-        for _ in range(0, num_of_factories * 4):  # For each Factory times 4...
-            tiles_to_remove.append(
-                tiles_list[randrange(0, len(tiles_list))]
-            )  # ...a random number is generated, and the tile at
-            # that index is appended to the list.
+        # 4 tiles are drawn for each Factory, and the whole list is returned, to be split into chunks of 4.
+        return [
+            TILES[tile_index]
+            for tile_index in self._draw(num_of_factories * 4)
+        ]
 
-        for (
-            tile
-        ) in (
-            tiles_to_remove
-        ):  # Then for each tile in that list, it's removed from the bag.
-            self._remove(tile)
+    def add_tiles_to_bag(
+        self, tiles: Iterable[Tile] | Mapping[str, int]
+    ) -> None:
+        """
+        Method that takes the tiles to be added to the bag, and adds them to the bag.
 
-        return list(
-            tiles_to_remove
-        )  # And the whole list is returned, in chunks of 4.
+        The tiles can be a list of tiles, or a mapping of tile type -> count.
+        """
+        # If the tiles are already counted by tile type, the bag is updated with them directly.
+        if isinstance(tiles, Mapping):
+            self._update(tiles)
+        # Otherwise, the list of tiles to be added is converted to a mapping, and the bag is updated with the mapped tiles.
+        else:
+            self._update(self._list_to_mapping(tiles))
 
-    def add_tiles_to_bag(self, tiles: list[Tile]) -> None:
+    def add_tile_counts(self, tile_counts: Sequence[int]) -> None:
         """
-        Method that takes a list of tiles to be added to the bag, and adds them to the bag.
+        Method that takes the count of each tile type to be added to the bag, in the order of TILE_TYPES (i.e. the lid), and adds
+        them to the bag.
         """
-        # Convert the list of tiles to be added to a mapping,
-        mapped_tiles: Mapping[Tile, int] = self._list_to_mapping(tiles)
-        # then update it with the mapped tiles.
-        self._update(mapped_tiles)
+        # Validation to ensure there's a count for each tile type.
+        if len(tile_counts) != len(self.__tile_types):
+            raise ValueError(
+                {
+                    "class": "Bag",
+                    "method": "add_tile_counts",
+                    "message": f"Expected {len(self.__tile_types)} tile counts, but got {len(tile_counts)}.",
+                }
+            )
+        self._update_counts(tile_counts)
@@ -0,0 +1,810 @@
+"""
+Module containing the BatchGame class implementation, which plays many games in lockstep with NumPy.
+
+Run it directly to report the positions per second of random play:
+
+    python3 -m game.batch --games 4096 --players 2 --steps 2000 --seed 0
+"""
+
+import argparse
+import time
+from collections.abc import Sequence
+import numpy as np
+from numpy.random import Generator
+from .move import CENTER, FLOOR
+from .observation import (
+    BAG_OFFSET,
+    BOARD_SIZE,
+    BOARDS_OFFSET,
+    CENTER_OFFSET,
+    CURRENT_PLAYER_OFFSET,
+    FACTORIES_OFFSET,
+    FLOOR_LINE_OFFSET,
+    LID_OFFSET,
+    OBSERVATION_SIZE,
+    PATTERN_LINES_OFFSET,
+    SCORE_OFFSET,
+    WALL_OFFSET,
+)
+from .rule_error import RuleError
+from .rules import (
+    COLOUR_BONUS,
+    COLOUR_MASKS,
+    COLUMN_BONUS,
+    COLUMN_MASKS,
+    MAX_ROUNDS,
+    PLACEMENT_SCORES,
+    ROW_BONUS,
+    ROW_MASKS,
+)
+from .state import GameState
+from .tile import TILE_TYPES
+
+# The floor line penalty for each number of tiles on it, from 0 to 7.
+_FLOOR_PENALTIES: np.ndarray = np.array(
+    [0, -1, -2, -4, -6, -8, -11, -14], dtype=np.int32
+)
+_FLOOR_LENGTH: int = 7
+
+_PLACEMENT_SCORE_TABLE: np.ndarray = np.frombuffer(
+    PLACEMENT_SCORES, dtype=np.uint8
+)
+_ROW_MASK_ARRAY: np.ndarray = np.array(ROW_MASKS, dtype=np.int32)
+_COLUMN_MASK_ARRAY: np.ndarray = np.array(COLUMN_MASKS, dtype=np.int32)
+_COLOUR_MASK_ARRAY: np.ndarray = np.array(COLOUR_MASKS, dtype=np.int32)
+
+
+class BatchGame:
+    """
+    Class that holds N games with the same number of players as arrays, one row per game, and plays a move in every game at once.
+
+    Tile types are stored as their index in TILE_TYPES, and counts of tiles in the same order:
+
+    - factories: N x F x 5 counts
+    - center: N x 5 counts (the start marker is tracked separately)
+    - pattern lines: N x P x 5 x 2, the tile type index (or -1 if it's empty) and the number of tiles on each line
+    - walls: N x P 25-bit integers, where bit (row * 5 + column) is set if a tile is on the wall
+    - floor lines: N x P x 5 counts (the start marker is tracked by its holder)
+    - scores: N x P
+
+    A game follows the same rules as Game played through legal_moves and apply_move. When a round ends, the walls are tiled, the
+    game is checked for its end, and the factories are refilled, all as part of the same step. When a game ends, its final
+    bonuses are added to the scores, and its later moves are ignored.
+    """
+
+    __num_of_games: int
+    __num_of_players: int
+    __num_of_factories: int
+    __max_rounds: int
+    __rng: Generator
+    __factories: np.ndarray
+    __center: np.ndarray
+    __start_in_center: np.ndarray
+    __start_marker_holder: np.ndarray
+    __pattern_lines: np.ndarray
+    __walls: np.ndarray
+    __floor_lines: np.ndarray
+    __scores: np.ndarray
+    __bag: np.ndarray
+    __lid: np.ndarray
+    __current_player: np.ndarray
+    __first_player: np.ndarray
+    __rounds: np.ndarray
+    __ended: np.ndarray
+
+    def __init__(
+        self,
+        num_of_games: int,
+        num_of_players: int = 2,
+        *,
+        rng: Generator | None = None,
+        max_rounds: int = MAX_ROUNDS,
+    ) -> None:
+        """
+        Constructor method that takes the number of games and players, sets up every game, and fills the factories for the first
+        round.
+
+        It optionally takes a NumPy Generator, which is used for every draw from the bags. Games that haven't ended after
+        max_rounds rounds are stopped and scored as they are.
+        """
+        # Validation to ensure the number of players is 2, 3, or 4.
+        if num_of_players not in (2, 3, 4):
+            raise RuleError(
+                {
+                    "class": "BatchGame",
+                    "method": "__init__",
+                    "message": "Azul is only designed for 2 - 4 players.",
+                }
+            )
+
+        self._allocate(num_of_games, num_of_players, rng, max_rounds)
+        self.__bag[:] = 20
+        self._fill_factories(np.arange(num_of_games))
+
+    def _allocate(
+        self,
+        num_of_games: int,
+        num_of_players: int,
+        rng: Generator | None,
+        max_rounds: int,
+    ) -> None:
+        # Every array is allocated once, with no tiles anywhere.
+        num_of_factories: int = {2: 5, 3: 7, 4: 9}[num_of_players]
+        self.__num_of_games = num_of_games
+        self.__num_of_players = num_of_players
+        self.__num_of_factories = num_of_factories
+        self.__max_rounds = max_rounds
+        self.__rng = rng if rng is not None else np.random.default_rng()
+
+        self.__factories = np.zeros(
+            (num_of_games, num_of_factories, len(TILE_TYPES)), dtype=np.uint8
+        )
+        self.__center = np.zeros(
+            (num_of_games, len(TILE_TYPES)), dtype=np.uint8
+        )
+        self.__start_in_center = np.zeros(num_of_games, dtype=bool)
+        self.__start_marker_holder = np.full(num_of_games, -1, dtype=np.int8)
+        self.__pattern_lines = np.zeros(
+            (num_of_games, num_of_players, 5, 2), dtype=np.int8
+        )
+        self.__pattern_lines[..., 0] = -1
+        self.__walls = np.zeros((num_of_games, num_of_players), dtype=np.int32)
+        self.__floor_lines = np.zeros(
+            (num_of_games, num_of_players, len(TILE_TYPES)), dtype=np.uint8
+        )
+        self.__scores = np.zeros(
+            (num_of_games, num_of_players), dtype=np.int32
+        )
+        self.__bag = np.zeros((num_of_games, len(TILE_TYPES)), dtype=np.uint8)
+        self.__lid = np.zeros((num_of_games, len(TILE_TYPES)), dtype=np.uint8)
+        self.__current_player = np.zeros(num_of_games, dtype=np.int8)
+        self.__first_player = np.zeros(num_of_games, dtype=np.int8)
+        self.__rounds = np.zeros(num_of_games, dtype=np.int32)
+        self.__ended = np.zeros(num_of_games, dtype=bool)
+
+    def _floor_lengths(self, games: np.ndarray) -> np.ndarray:
+        """
+        Method that takes the indexes of games, and returns the number of tiles on each player's floor line, including the start
+        marker.
+        """
+        return self.__floor_lines[games].sum(axis=2, dtype=np.int32) + (
+            self.__start_marker_holder[games, None]
+            == np.arange(self.__num_of_players)
+        )
+
+    def _fill_factories(self, games: np.ndarray) -> None:
+        """
+        Method that takes the indexes of games at the start of a round, and fills their factories from their bags.
+
+        If a bag doesn't have enough tiles, the lid is added to it first. Games with no tiles left to fill the factories with end.
+        """
+        # If the bag doesn't have enough tiles to be added to the factories, the tiles in the lid are added to the bag.
+        num_of_tiles: int = self.__num_of_factories * 4
+        short: np.ndarray = games[self.__bag[games].sum(axis=1) < num_of_tiles]
+        self.__bag[short] += self.__lid[short]
+        self.__lid[short] = 0
+
+        # The tiles are drawn one at a time in every game, weighted by the count of each tile type left in the bag, and 4 go into
+        # each factory.
+        bag: np.ndarray = self.__bag[games].astype(np.int32)
+        factories: np.ndarray = np.zeros(
+            (len(games), self.__num_of_factories, len(TILE_TYPES)),
+            dtype=np.uint8,
+        )
+        rows: np.ndarray = np.arange(len(games))
+        for tile_index in range(num_of_tiles):
+            totals: np.ndarray = bag.sum(axis=1)
+            picks: np.ndarray = self.__rng.integers(0, np.maximum(totals, 1))
+            tile_types: np.ndarray = (
+                bag.cumsum(axis=1) <= picks[:, None]
+            ).sum(axis=1)
+            # If a bag is empty, nothing is drawn.
+            drawn: np.ndarray = rows[totals > 0]
+            factories[drawn, tile_index // 4, tile_types[drawn]] += 1
+            bag[drawn, tile_types[drawn]] -= 1
+
+        self.__bag[games] = bag
+        self.__factories[games] = factories
+        # The player who took the start marker last round plays first, and the start marker goes back into the center.
+        self.__current_player[games] = self.__first_player[games]
+        self.__start_in_center[games] = True
+
+        # If there were no tiles left to fill the factories with, the game ends.
+        self._end_games(games[factories.sum(axis=(1, 2)) == 0])
+
+    def _tile_walls(self, games: np.ndarray) -> None:
+        """
+        Method that takes the indexes of games whose round has ended, and places the tiles from every player's full pattern lines
+        onto their wall, then scores their floor lines.
+        """
+        walls: np.ndarray = self.__walls[games]
+        scores: np.ndarray = self.__scores[games]
+        lid: np.ndarray = self.__lid[games].astype(np.int32)
+        lid_rows: np.ndarray = np.repeat(
+            np.arange(len(games)), self.__num_of_players
+        ).reshape(len(games), self.__num_of_players)
+
+        # Each pattern line is placed in order from the top, in every game and for every player at once.
+        for row in range(5):
+            pattern_lines: np.ndarray = self.__pattern_lines[games, :, row]
+            tile_types: np.ndarray = pattern_lines[..., 0].astype(np.int32)
+            full: np.ndarray = pattern_lines[..., 1] == row + 1
+            column: np.ndarray = (tile_types + row) % 5
+            walls |= np.where(full, 1 << (row * 5 + column), 0).astype(
+                np.int32
+            )
+
+            # The score is looked up from the bits of the row and column the tile was placed in.
+            row_bits: np.ndarray = (walls >> (row * 5)) & 0b11111
+            column_bits: np.ndarray = np.zeros_like(walls)
+            for wall_row in range(5):
+                column_bits |= ((walls >> (wall_row * 5 + column)) & 1) << (
+                    wall_row
+                )
+            placement_index: np.ndarray = (
+                ((row * 5 + column) << 10) | (row_bits << 5) | column_bits
+            )
+            scores += np.where(
+                full, _PLACEMENT_SCORE_TABLE[placement_index], 0
+            )
+
+            # The rest of each full pattern line goes into the lid, and the line is cleared.
+            np.add.at(lid, (lid_rows[full], tile_types[full]), row)
+            pattern_lines[full] = (-1, 0)
+            self.__pattern_lines[games, :, row] = pattern_lines
+
+        # The floor line penalty is added, but a score can't go below 0. The floor line tiles then go into the lid.
+        scores = np.maximum(
+            scores + _FLOOR_PENALTIES[self._floor_lengths(games)], 0
+        )
+        lid += self.__floor_lines[games].sum(axis=1, dtype=np.int32)
+        self.__floor_lines[games] = 0
+        self.__start_marker_holder[games] = -1
+
+        self.__walls[games] = walls
+        self.__scores[games] = scores
+        self.__lid[games] = lid
+
+    def _end_games(self, games: np.ndarray) -> None:
+        """
+        Method that takes the indexes of games that have just ended, adds the final bonuses to their scores, and marks them ended.
+        """
+        walls: np.ndarray = self.__walls[games, :, None]
+        self.__scores[games] += (
+            ((walls & _ROW_MASK_ARRAY) == _ROW_MASK_ARRAY).sum(axis=2)
+            * ROW_BONUS
+            + ((walls & _COLUMN_MASK_ARRAY) == _COLUMN_MASK_ARRAY).sum(axis=2)
+            * COLUMN_BONUS
+            + ((walls & _COLOUR_MASK_ARRAY) == _COLOUR_MASK_ARRAY).sum(axis=2)
+            * COLOUR_BONUS
+        )
+        self.__ended[games] = True
+
+    def _end_rounds(self, games: np.ndarray) -> None:
+        """
+        Method that takes the indexes of games whose round has ended, tiles the walls, and then either ends the game or fills the
+        factories for the next round.
+        """
+        self._tile_walls(games)
+        self.__rounds[games] += 1
+
+        # A game ends when any player has a full row on their wall, or it has been played for max_rounds rounds.
+        full_rows: np.ndarray = (
+            (self.__walls[games, :, None] & _ROW_MASK_ARRAY) == _ROW_MASK_ARRAY
+        ).any(axis=(1, 2))
+        ended: np.ndarray = full_rows | (
+            self.__rounds[games] >= self.__max_rounds
+        )
+        self._end_games(games[ended])
+        self._fill_factories(games[~ended])
+
+    def return_num_of_games(self) -> int:
+        """
+        Method that returns the number of games.
+        """
+        return self.__num_of_games
+
+    def return_num_of_players(self) -> int:
+        """
+        Method that returns the number of players in each game.
+        """
+        return self.__num_of_players
+
+    def return_num_of_factories(self) -> int:
+        """
+        Method that returns the number of factories in each game.
+        """
+        return self.__num_of_factories
+
+    def return_factories(self) -> np.ndarray:
+        """
+        Method that returns a read-only N x F x 5 array of the count of each tile type in each factory.
+        """
+        return self._read_only(self.__factories)
+
+    def return_center(self) -> np.ndarray:
+        """
+        Method that returns a read-only N x 5 array of the count of each tile type in the center of the table.
+        """
+        return self._read_only(self.__center)
+
+    def return_start_marker_holders(self) -> np.ndarray:
+        """
+        Method that returns a read-only array of the index of the player holding the start marker in each game, or -1 if no one
+        holds it.
+        """
+        return self._read_only(self.__start_marker_holder)
+
+    def return_pattern_lines(self) -> np.ndarray:
+        """
+        Method that returns a read-only N x P x 5 x 2 array of the tile type index (or -1) and the number of tiles on each pattern
+        line.
+        """
+        return self._read_only(self.__pattern_lines)
+
+    def return_walls(self) -> np.ndarray:
+        """
+        Method that returns a read-only N x P array of the walls, as 25-bit integers.
+        """
+        return self._read_only(self.__walls)
+
+    def return_floor_lines(self) -> np.ndarray:
+        """
+        Method that returns a read-only N x P x 5 array of the count of each tile type on each floor line.
+        """
+        return self._read_only(self.__floor_lines)
+
+    def return_scores(self) -> np.ndarray:
+        """
+        Method that returns a read-only N x P array of the scores. The final bonuses are included once a game has ended.
+        """
+        return self._read_only(self.__scores)
+
+    def return_bag(self) -> np.ndarray:
+        """
+        Method that returns a read-only N x 5 array of the count of each tile type in the bag.
+        """
+        return self._read_only(self.__bag)
+
+    def return_lid(self) -> np.ndarray:
+        """
+        Method that returns a read-only N x 5 array of the count of each tile type in the lid.
+        """
+        return self._read_only(self.__lid)
+
+    def return_current_players(self) -> np.ndarray:
+        """
+        Method that returns a read-only array of the index of the player whose turn it is in each game.
+        """
+        return self._read_only(self.__current_player)
+
+    def return_ended(self) -> np.ndarray:
+        """
+        Method that returns a read-only array of whether each game has ended.
+        """
+        return self._read_only(self.__ended)
+
+    def _read_only(self, values: np.ndarray) -> np.ndarray:
+        # A view is returned, so the caller can read the live state without copying it, but can't change it.
+        view: np.ndarray = values.view()
+        view.flags.writeable = False
+        return view
+
+    def is_all_ended(self) -> bool:
+        """
+        Method that checks whether every game has ended.
+
+        If so, it returns True. Otherwise, it returns False.
+        """
+        return bool(self.__ended.all())
+
+    def legal_mask(self) -> np.ndarray:
+        """
+        Method that returns an N x (F + 1) x 5 x 6 boolean array of the legal moves of the current player in each game.
+
+        It's indexed by the source (the factory index, or F for the center), the tile type index, and the destination (the pattern
+        line index, or FLOOR). Games that have ended have no legal moves.
+        """
+        games: np.ndarray = np.arange(self.__num_of_games)
+        player: np.ndarray = self.__current_player
+
+        # The mask is worked out with the games on the last axis, so every operation runs over all the games in one long loop,
+        # rather than a short loop per game. The returned array is a transposed view of it.
+        # The tiles can be taken from any factory, or the center, that holds at least one tile of that type.
+        sources: np.ndarray = np.ascontiguousarray(
+            np.concatenate(
+                (self.__factories, self.__center[:, None]), axis=1
+            ).transpose(1, 2, 0)
+            > 0
+        )
+
+        # A pattern line is available for a tile type if it's empty or holds the same type and isn't full, and its row on the wall
+        # doesn't have that type yet.
+        pattern_lines: np.ndarray = self.__pattern_lines[games, player]
+        tile_types: np.ndarray = np.arange(len(TILE_TYPES))[:, None, None]
+        line_indexes: np.ndarray = np.arange(5)[:, None]
+        line_types: np.ndarray = pattern_lines[:, :, 0].T
+        line_counts: np.ndarray = pattern_lines[:, :, 1].T
+        available: np.ndarray = (line_counts == 0) | (
+            (line_types == tile_types) & (line_counts <= line_indexes)
+        )
+        wall_bits: np.ndarray = 1 << (
+            line_indexes * 5 + (tile_types + line_indexes) % 5
+        )
+        available &= (self.__walls[games, player] & wall_bits) == 0
+
+        destinations: np.ndarray = np.ones(
+            (len(TILE_TYPES), 6, self.__num_of_games), dtype=bool
+        )
+        destinations[:, :5] = available
+
+        mask: np.ndarray = sources[:, :, None] & destinations
+        mask[..., self.__ended] = False
+        return mask.transpose(3, 0, 1, 2)
+
+    def step(self, moves: np.ndarray | Sequence[Sequence[int]]) -> np.ndarray:
+        """
+        Method that takes an N x 3 array of moves (the factory index or CENTER, the tile type index, and the pattern line index or
+        FLOOR), and plays each move for the current player of its game. The moves of games that have ended are ignored.
+
+        When a round ends, its walls are tiled and its factories refilled in the same step. It returns a read-only array of
+        whether each game has ended.
+        """
+        moves = np.asarray(moves, dtype=np.int64)
+        # Validation to ensure there is a move for every game.
+        if moves.shape != (self.__num_of_games, 3):
+            raise ValueError(
+                {
+                    "class": "BatchGame",
+                    "method": "step",
+                    "message": f"Moves must be an array of shape ({self.__num_of_games}, 3).",
+                }
+            )
+
+        games: np.ndarray = np.flatnonzero(~self.__ended)
+        sources: np.ndarray = moves[games, 0]
+        tile_types: np.ndarray = moves[games, 1]
+        destinations: np.ndarray = moves[games, 2]
+        players: np.ndarray = self.__current_player[games].astype(np.int64)
+
+        # Validation to ensure that every move is legal.
+        if (
+            ((sources < CENTER) | (sources >= self.__num_of_factories)).any()
+            or ((tile_types < 0) | (tile_types >= len(TILE_TYPES))).any()
+            or ((destinations < 0) | (destinations > FLOOR)).any()
+        ):
+            raise IndexError(
+                {
+                    "class": "BatchGame",
+                    "method": "step",
+                    "message": "Each move needs a factory index or CENTER, a tile type index from 0-4, and a pattern line index from 0-4 or FLOOR.",
+                }
+            )
+        from_center: np.ndarray = sources == CENTER
+        legal: np.ndarray = self.legal_mask()[
+            games,
+            np.where(from_center, self.__num_of_factories, sources),
+            tile_types,
+            destinations,
+        ]
+        if not legal.all():
+            raise RuleError(
+                {
+                    "class": "BatchGame",
+                    "method": "step",
+                    "message": f"The moves for games {games[~legal].tolist()} aren't legal!",
+                }
+            )
+
+        taken: np.ndarray = np.empty(len(games), dtype=np.int32)
+
+        # Tiles taken from a factory: the rest of the factory is added to the center of the table.
+        factory_games: np.ndarray = games[~from_center]
+        factory_sources: np.ndarray = sources[~from_center]
+        factory_types: np.ndarray = tile_types[~from_center]
+        factory_tiles: np.ndarray = self.__factories[
+            factory_games, factory_sources
+        ]
+        taken[~from_center] = factory_tiles[
+            np.arange(len(factory_games)), factory_types
+        ]
+        factory_tiles[np.arange(len(factory_games)), factory_types] = 0
+        self.__center[factory_games] += factory_tiles
+        self.__factories[factory_games, factory_sources] = 0
+
+        # Tiles taken from the center: if no player holds the start marker yet, it's placed onto the player's floor line, and
+        # they'll play first next round.
+        center_games: np.ndarray = games[from_center]
+        center_types: np.ndarray = tile_types[from_center]
+        taken[from_center] = self.__center[center_games, center_types]
+        self.__center[center_games, center_types] = 0
+        marker_games: np.ndarray = center_games[
+            self.__start_marker_holder[center_games] == -1
+        ]
+        marker_players: np.ndarray = players[from_center][
+            self.__start_marker_holder[center_games] == -1
+        ]
+        self.__start_in_center[marker_games] = False
+        self.__first_player[marker_games] = marker_players
+        # If the floor line is already full, the start marker isn't placed, so the next player to take from the center gets it.
+        has_space: np.ndarray = (
+            self._floor_lengths(marker_games)[
+                np.arange(len(marker_games)), marker_players
+            ]
+            < _FLOOR_LENGTH
+        )
+        self.__start_marker_holder[marker_games[has_space]] = marker_players[
+            has_space
+        ]
+
+        # The tiles that fit are placed onto the pattern line,
+        overflow: np.ndarray = taken.copy()
+        onto_line: np.ndarray = destinations != FLOOR
+        line_games: np.ndarray = games[onto_line]
+        line_players: np.ndarray = players[onto_line]
+        line_indexes: np.ndarray = destinations[onto_line]
+        line_counts: np.ndarray = self.__pattern_lines[
+            line_games, line_players, line_indexes, 1
+        ]
+        placed: np.ndarray = np.minimum(
+            taken[onto_line], line_indexes + 1 - line_counts
+        )
+        self.__pattern_lines[line_games, line_players, line_indexes, 0] = (
+            tile_types[onto_line]
+        )
+        self.__pattern_lines[line_games, line_players, line_indexes, 1] = (
+            line_counts + placed
+        )
+        overflow[onto_line] -= placed
+
+        # and the rest fall onto the floor line, with any that don't fit going into the lid.
+        space: np.ndarray = (
+            _FLOOR_LENGTH
+            - self._floor_lengths(games)[np.arange(len(games)), players]
+        )
+        onto_floor: np.ndarray = np.minimum(overflow, space)
+        self.__floor_lines[games, players, tile_types] += onto_floor.astype(
+            np.uint8
+        )
+        self.__lid[games, tile_types] += (overflow - onto_floor).astype(
+            np.uint8
+        )
+
+        # The turn passes to the next player.
+        self.__current_player[games] = (players + 1) % self.__num_of_players
+
+        # Games with no tiles left in the factories or the center move on to the next round.
+        round_ended: np.ndarray = games[
+            (self.__factories[games].sum(axis=(1, 2)) == 0)
+            & (self.__center[games].sum(axis=1) == 0)
+        ]
+        if len(round_ended):
+            self._end_rounds(round_ended)
+
+        return self.return_ended()
+
+    def encode_observations(
+        self,
+        player_indexes: np.ndarray | None = None,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Method that encodes every game from the point of view of the player at the same index in player_indexes (the current
+        player of each game by default), laid out as described in game.observation.
+
+        The observations are written into the rows of out, a float32 or uint8 array of shape (N, OBSERVATION_SIZE), which is
+        allocated if it isn't given. It returns out.
+        """
+        num_of_games: int = self.__num_of_games
+        if out is None:
+            out = np.zeros((num_of_games, OBSERVATION_SIZE), dtype=np.float32)
+        # Validation to ensure there is a row for every game.
+        elif out.shape != (num_of_games, OBSERVATION_SIZE):
+            raise ValueError(
+                {
+                    "class": "BatchGame",
+                    "method": "encode_observations",
+                    "message": f"out must be an array of shape ({num_of_games}, {OBSERVATION_SIZE}).",
+                }
+            )
+        else:
+            out.fill(0)
+        observers: np.ndarray = (
+            self.__current_player.astype(np.int64)
+            if player_indexes is None
+            else np.asarray(player_indexes, dtype=np.int64)
+        )
+        games: np.ndarray = np.arange(num_of_games)
+
+        # The count of each tile type in each factory and in the center of the table.
+        out[
+            :,
+            FACTORIES_OFFSET : FACTORIES_OFFSET
+            + self.__num_of_factories * len(TILE_TYPES),
+        ] = self.__factories.reshape(num_of_games, -1)
+        out[:, CENTER_OFFSET : CENTER_OFFSET + 5] = self.__center
+        out[:, CENTER_OFFSET + 5] = self.__start_in_center
+
+        # The boards, starting with each observer's own board, followed by the other players in turn order.
+        for seat in range(self.__num_of_players):
+            players: np.ndarray = (observers + seat) % self.__num_of_players
+            offset: int = BOARDS_OFFSET + seat * BOARD_SIZE
+            pattern_lines: np.ndarray = self.__pattern_lines[games, players]
+            out[
+                :,
+                offset
+                + PATTERN_LINES_OFFSET : offset
+                + PATTERN_LINES_OFFSET
+                + 25,
+            ] = (
+                (pattern_lines[..., 0, None] == np.arange(len(TILE_TYPES)))
+                * pattern_lines[..., 1, None]
+            ).reshape(
+                num_of_games, 25
+            )
+            out[:, offset + WALL_OFFSET : offset + WALL_OFFSET + 25] = (
+                self.__walls[games, players, None] >> np.arange(25)
+            ) & 1
+            out[
+                :, offset + FLOOR_LINE_OFFSET : offset + FLOOR_LINE_OFFSET + 5
+            ] = self.__floor_lines[games, players]
+            out[:, offset + FLOOR_LINE_OFFSET + 5] = (
+                self.__start_marker_holder == players
+            )
+            out[:, offset + SCORE_OFFSET] = self.__scores[games, players]
+
+        # The count of each tile type in the bag and the lid, and whose turn it is, counted from the observer.
+        out[:, BAG_OFFSET : BAG_OFFSET + 5] = self.__bag
+        out[:, LID_OFFSET : LID_OFFSET + 5] = self.__lid
+        out[
+            games,
+            CURRENT_PLAYER_OFFSET
+            + (self.__current_player - observers) % self.__num_of_players,
+        ] = 1
+
+        return out
+
+    def snapshot(self, game_index: int) -> GameState:
+        """
+        Method that takes the index of a game, and returns a snapshot of it that can be turned into a Game with
+        Game.from_snapshot.
+        """
+        center: list[int] = self.__center[game_index].tolist()
+        scores: tuple[int, ...] = tuple(self.__scores[game_index].tolist())
+        return GameState(
+            self.__num_of_players,
+            self.__num_of_factories,
+            tuple(
+                tuple(factory)
+                for factory in self.__factories[game_index].tolist()
+            ),
+            tuple(center + [int(self.__start_in_center[game_index])]),
+            int(self.__start_marker_holder[game_index]),
+            tuple(
+                tuple(pattern_lines.flatten().tolist())
+                for pattern_lines in self.__pattern_lines[game_index]
+            ),
+            tuple(self.__walls[game_index].tolist()),
+            tuple(
+                tuple(floor_line)
+                for floor_line in self.__floor_lines[game_index].tolist()
+            ),
+            scores,
+            tuple(self.__bag[game_index].tolist()),
+            tuple(self.__lid[game_index].tolist()),
+            # Once a game has ended, its scores are final.
+            scores if self.__ended[game_index] else (),
+            int(self.__current_player[game_index]),
+            int(self.__first_player[game_index]),
+        )
+
+    @classmethod
+    def from_snapshots(
+        cls,
+        states: Sequence[GameState],
+        *,
+        rng: Generator | None = None,
+        max_rounds: int = MAX_ROUNDS,
+    ) -> "BatchGame":
+        """
+        Method that takes snapshots of games in the Factory Offer phase, all with the same number of players, and returns a
+        BatchGame holding them.
+
+        It optionally takes a NumPy Generator, which is used for every draw from the bags.
+        """
+        num_of_players: int = states[0].num_of_players if states else 2
+        # Validation to ensure that every game has the same number of players.
+        if any(state.num_of_players != num_of_players for state in states):
+            raise RuleError(
+                {
+                    "class": "BatchGame",
+                    "method": "from_snapshots",
+                    "message": "Every game in a batch must have the same number of players.",
+                }
+            )
+
+        batch: BatchGame = cls.__new__(cls)
+        batch._allocate(len(states), num_of_players, rng, max_rounds)
+        for game_index, state in enumerate(states):
+            for factory_index, factory in enumerate(state.factories):
+                batch.__factories[game_index, factory_index] = factory
+            batch.__center[game_index] = state.center[:-1]
+            batch.__start_in_center[game_index] = state.center[-1] > 0
+            batch.__start_marker_holder[game_index] = state.start_marker_holder
+            batch.__pattern_lines[game_index] = np.reshape(
+                state.pattern_lines, (num_of_players, 5, 2)
+            )
+            batch.__walls[game_index] = state.walls
+            batch.__floor_lines[game_index] = state.floor_lines
+            batch.__scores[game_index] = state.scores
+            batch.__bag[game_index] = state.bag
+            batch.__lid[game_index] = state.lid
+            batch.__current_player[game_index] = state.current_player
+            batch.__first_player[game_index] = state.first_player
+
+        return batch
+
+
+def random_moves(batch: BatchGame, rng: Generator) -> np.ndarray:
+    """
+    Function that picks one of the legal moves at random in every game, and returns them as an N x 3 array of moves.
+
+    Games that have ended get a move of all zeros, which step ignores.
+    """
+    mask: np.ndarray = batch.legal_mask()
+    # The mask is a transposed view with the games on the last axis, so it's flattened that way round without a copy.
+    flat_mask: np.ndarray = mask.transpose(1, 2, 3, 0).reshape(-1, len(mask))
+    # A random number is picked below the number of legal moves in each game, and the legal move it lands on is picked, i.e. the
+    # number of moves whose running count of legal moves is at most that number. The running count is added up a row of moves at
+    # a time, as a cumulative sum along the first axis is much slower.
+    targets: np.ndarray = rng.integers(
+        0, np.maximum(flat_mask.sum(axis=0, dtype=np.int16), 1)
+    )
+    running_count: np.ndarray = np.zeros(len(mask), dtype=np.int16)
+    picks: np.ndarray = np.zeros(len(mask), dtype=np.int64)
+    for legal_moves in flat_mask:
+        running_count += legal_moves
+        picks += running_count <= targets
+    # Games that have ended have no legal moves, so their pick is kept in range.
+    picks = np.minimum(picks, len(flat_mask) - 1)
+    sources, tile_types, destinations = np.unravel_index(picks, mask.shape[1:])
+    moves: np.ndarray = np.stack(
+        (
+            np.where(
+                sources == batch.return_num_of_factories(), CENTER, sources
+            ),
+            tile_types,
+            destinations,
+        ),
+        axis=1,
+    )
+    moves[batch.return_ended()] = 0
+    return moves
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=4096)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    generator: Generator = np.random.default_rng(arguments.seed)
+    batch_game: BatchGame = BatchGame(
+        arguments.games, arguments.players, rng=generator
+    )
+    positions: int = 0
+    start: float = time.perf_counter()
+    for _ in range(arguments.steps):
+        if batch_game.is_all_ended():
+            break
+        positions += int((~batch_game.return_ended()).sum())
+        batch_game.step(random_moves(batch_game, generator))
+    elapsed: float = time.perf_counter() - start
+
+    print(
+        f"{positions} positions in {elapsed:.2f}s "
+        f"({positions / elapsed if elapsed > 0 else 0.0:.1f} positions/sec)"
+    )
+    print(f"Mean scores: {batch_game.return_scores().mean(axis=0)}")
@@ -6,7 +6,8 @@ from .pattern_line import PatternLine
 from .floor_line import FloorLine
 from .wall import Wall
 from ..tile import Tile
-from ..rule_error import RuleError
+from ..view import BoardView
+from ..zobrist import SCORE_KEYS
 
 
 class Board:
@@ -18,40 +19,28 @@ class Board:
     __floor_line: FloorLine
     __wall: Wall
     __score: int
+    __view: BoardView | None
 
     def __init__(self) -> None:
         self.__pattern_lines = PatternLine()
         self.__floor_line = FloorLine()
         self.__wall = Wall()
         self.__score = 0
+        self.__view = None
 
-    def _place_tile_onto_wall(self, line_index: int) -> list[Tile]:
+    def view(self) -> BoardView:
         """
-        Method that takes the line index of the item to be placed on the wall.
-
-        It then stores the score, clears the pattern line, and returns a list of tiles to be added to the lid.
+        Method that returns a read-only view of the board, which reads the pattern lines, floor line, wall and score as they are
+        whenever it's accessed.
         """
-        # Validation to ensure that the line is full before placing tile onto the wall. If it isn't, it raises a Rule Error.
-        if not self.__pattern_lines.is_line_full(line_index):
-            raise RuleError(
-                {
-                    "class": "Board",
-                    "method": "place_tile_onto_wall",
-                    "message": "Cannot place tile onto wall if pattern line is not empty!",
-                }
+        if self.__view is None:
+            self.__view = BoardView(
+                self.__pattern_lines.view(),
+                self.__floor_line.view(),
+                self.__wall.view(),
+                lambda: self.__score,
             )
-
-        # For the specified pattern line, it first gets the tile type in the pattern line.
-        tile_type: str = self.__pattern_lines.get_tile_type(line_index)
-        # As well as the index of the column of the associated tile type on the wall.
-        column_index: int = self.__wall.get_column_index(line_index, tile_type)
-        # It then places the tile onto the wall, which returns the score calculated when tile is added to the wall. This is stored as an attribute.
-        self.__score += self.__wall.place_tile_onto_wall(
-            line_index, column_index, tile_type
-        )
-
-        # The pattern line is cleared and the returned items are returned.
-        return self.__pattern_lines.clear_pattern_line(line_index)
+        return self.__view
 
     def return_pattern_lines(self) -> list[list[Tile]]:
         """
@@ -68,15 +57,8 @@ class Board:
         """
         Method that returns a list of the floor line tiles.
         """
-        floor_line: list[str | Tile] = []
-        # For each item in the floor line,
-        for tile in iter(self.__floor_line):
-            # The tile type is formatted,
-            tile_string: str = repr(tile).replace("'", "")
-            # Then added to the list.
-            floor_line.append(tile_string)
-        # Which is returned as a list.
-        return floor_line
+        # Each tile on the floor line is returned as its tile type.
+        return [str(tile) for tile in self.__floor_line]
 
     def return_wall(self) -> list[list[list[str | Tile | None]]]:
         """
@@ -92,6 +74,79 @@ class Board:
         """
         return self.__score
 
+    def return_hash(self) -> int:
+        """
+        Method that returns the Zobrist hash of the board, i.e. of its pattern lines, floor line, wall and score.
+
+        The pattern lines, floor line and wall keep their hashes up to date themselves, so they're only combined here.
+        """
+        return (
+            self.__pattern_lines.return_hash()
+            ^ self.__floor_line.return_hash()
+            ^ self.__wall.return_hash()
+            ^ SCORE_KEYS[self.__score % len(SCORE_KEYS)]
+        )
+
+    def return_state(
+        self,
+    ) -> tuple[tuple[int, ...], tuple[int, ...], int, int]:
+        """
+        Method that returns the state of the pattern lines, the count of each tile type on the floor line, the occupancy of the wall,
+        and the score.
+        """
+        return (
+            self.__pattern_lines.return_state(),
+            self.__floor_line.return_tile_counts(),
+            self.__wall.return_occupancy(),
+            self.__score,
+        )
+
+    def restore_state(
+        self,
+        pattern_lines: tuple[int, ...],
+        floor_line: tuple[int, ...],
+        wall: int,
+        score: int,
+        start_marker: Tile | None,
+    ) -> None:
+        """
+        Method that takes the values returned by return_state, along with the start marker if it's on this board's floor line, and
+        replaces the state of the board with them.
+        """
+        self.__pattern_lines.restore_state(pattern_lines)
+        self.__floor_line.restore_tile_counts(floor_line, start_marker)
+        self.__wall.restore_occupancy(wall)
+        self.__score = score
+
+    def return_floor_tiles(self) -> list[Tile]:
+        """
+        Method that returns the tiles on the floor line as a list, without formatting them.
+        """
+        return list(self.__floor_line)
+
+    def restore_floor_line(self, tiles: list[Tile]) -> None:
+        """
+        Method that takes a list of tiles, and replaces the tiles on the floor line with them, in the same order.
+        """
+        self.__floor_line.restore_floor_line(tiles)
+
+    def remove_tiles_from_pattern_line(
+        self, line_index: int, num_of_tiles: int
+    ) -> None:
+        """
+        Method that takes the pattern line index and a number of tiles, and removes that many of the most recently placed tiles from
+        the pattern line.
+        """
+        self.__pattern_lines.remove_tiles_from_pattern_line(
+            line_index, num_of_tiles
+        )
+
+    def remove_tiles_from_floor_line(self, num_of_tiles: int) -> None:
+        """
+        Method that takes a number of tiles, and removes that many of the most recently placed tiles from the floor line.
+        """
+        self.__floor_line.remove_tiles_from_floor_line(num_of_tiles)
+
     def is_pattern_line_full(self, line_index: int) -> bool:
         """
         Method that takes line index.
@@ -108,6 +163,26 @@ class Board:
         """
         return self.__wall.is_tile_on_wall(line_index, tile_type)
 
+    def return_available_pattern_lines(self, tile_type: str) -> list[int]:
+        """
+        Method that takes the type of tile, and returns the indexes of the pattern lines that tiles of that type can be placed onto.
+
+        A pattern line is available if it isn't full, only holds tiles of the same type, and its row on the wall doesn't have that
+        tile yet.
+        """
+        return [
+            line_index
+            for line_index in range(5)
+            if self.__pattern_lines.is_line_available(line_index, tile_type)
+            and not self.__wall.is_tile_on_wall(line_index, tile_type)
+        ]
+
+    def get_pattern_line_space(self, line_index: int) -> int:
+        """
+        Method that takes the pattern line index, and returns how many more tiles fit onto the pattern line.
+        """
+        return self.__pattern_lines.get_space_remaining(line_index)
+
     def is_wall_row_full(self) -> bool:
         """
         Method that iterates through each of the rows and check if any of the rows are full.
@@ -144,17 +219,19 @@ class Board:
         """
         Method that, for each full pattern line, places the tile onto the wall, stores the score, and then adds the negative score from the floor line.
 
-        It then returns the tiles to be added to the lid.
+        It then clears the floor line, and returns the tiles to be added to the lid.
         """
         cleared_pattern_lines: list[list[Tile]] = []
-        # For each pattern line,
-        for line_index in range(5):
-            # As long as the line is full,
-            if self.__pattern_lines.is_line_full(line_index):
-                # The rightmost tile is added onto the wall, and the rest of the line is appended to cleared pattern lines.
-                cleared_pattern_lines.append(
-                    self._place_tile_onto_wall(line_index)
-                )
+        # For each full pattern line, the rightmost tile is added onto the wall, and the rest of the line is appended to cleared
+        # pattern lines. Each row is shifted one to the right, so the column is the tile type index offset by the line index.
+        full_lines: list[tuple[int, Tile, list[Tile]]] = (
+            self.__pattern_lines.clear_full_lines()
+        )
+        for line_index, tile, line_tiles in full_lines:
+            self.__score += self.__wall.place_tile_onto_wall(
+                line_index, (tile.index + line_index) % 5, tile.colour
+            )
+            cleared_pattern_lines.append(line_tiles)
 
         # The score of the items in the floor line is calculated.
         floor_score: int = self.__floor_line.calculate_score()
@@ -168,22 +245,29 @@ class Board:
         else:
             self.__score = 0
 
+        # The floor line is cleared, and its tiles are returned along with the cleared pattern lines.
+        cleared_pattern_lines.append(self.__floor_line.clear_floor_line())
+
         # The cleared pattern lines is returned.
         return cleared_pattern_lines
 
-    def add_final_scores(self) -> None:
+    def calculate_final_bonus(self) -> int:
         """
-        Method that checks if there are any full rows, columns, or diagonal rows of tiles, multiplies those counts by their respective score weight, adds them up, then adds it to the player's final score.
+        Method that checks if there are any full rows, columns, or diagonal rows of tiles, multiplies those counts by their respective score weight, and adds them up.
+
+        It returns the bonus, without adding it to the score. The wall keeps count of its full rows, columns and colours as tiles are
+        placed, so this doesn't scan the wall.
         """
-        # Each full row is counted, and for each full row it's multiplied by 2.
-        full_row_count: int = self.__wall.count_full_rows() * 2
-        # Each full column is counted, and for each full column it's multiplied by 7.
-        full_column_count: int = self.__wall.count_full_columns() * 7
-        # Each full diagonal row is counted (for instance, each instance where all tiles of the same colour is on the wall), and then multiplied by 10.
-        full_tile_count: int = self.__wall.count_full_tiles() * 10
+        return self.__wall.calculate_bonus()
 
-        # These scores are added,
-        final_scores: int = full_row_count + full_column_count + full_tile_count
+    def return_projected_score(self) -> int:
+        """
+        Method that returns the score the player would finish with if the game ended now, i.e. the score plus the final bonus so far.
+        """
+        return self.__score + self.__wall.calculate_bonus()
 
-        # and then stored in the score attribute.
-        self.__score += final_scores
+    def add_final_scores(self) -> None:
+        """
+        Method that calculates the final bonus, then adds it to the player's final score.
+        """
+        self.__score += self.calculate_final_bonus()
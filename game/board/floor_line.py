@@ -3,21 +3,32 @@ Module containing the FloorLine class implementation.
 """
 
 from collections import deque
-from collections.abc import Iterator
-from ..tile import Tile
+from collections.abc import Iterable, Iterator
+from ..tile import Tile, TILES
+from ..view import SequenceView
+from ..zobrist import FLOOR_LINE_KEYS
 
 
 class FloorLine:
     """
     The FloorLine class handles methods associated with adding and removing tiles from the floor line.
+
+    The count of each tile type on the floor line (followed by the start marker) and its Zobrist hash are kept up to date as
+    tiles are added and removed.
     """
 
     __floor_line: deque[Tile]
+    __tile_counts: list[int]
+    __hash: int
     __scores: tuple[int, ...]
+    __view: SequenceView | None
 
     def __init__(self) -> None:
         self.__scores = tuple([-1, -1, -2, -2, -2, -3, -3])
         self.__floor_line = deque(maxlen=7)
+        self.__tile_counts = [0] * (len(TILES) + 1)
+        self.__hash = 0
+        self.__view = None
 
     def __iter__(self) -> Iterator[Tile]:
         """
@@ -26,6 +37,32 @@ class FloorLine:
         for tile in self.__floor_line:
             yield tile
 
+    def view(self) -> SequenceView:
+        """
+        Method that returns a read-only view of the tiles on the floor line.
+        """
+        if self.__view is None:
+            self.__view = SequenceView(lambda: self.__floor_line)
+        return self.__view
+
+    def _count_tiles(self, tiles: Iterable[Tile], change: int) -> None:
+        # The start marker has an index of -1, so it's counted in the last slot.
+        for tile in tiles:
+            count: int = self.__tile_counts[tile.index]
+            self.__tile_counts[tile.index] = count + change
+            # The key of the old count is swapped for the key of the new one.
+            self.__hash ^= (
+                FLOOR_LINE_KEYS[tile.index][count]
+                ^ FLOOR_LINE_KEYS[tile.index][count + change]
+            )
+
+    def return_hash(self) -> int:
+        """
+        Method that returns the Zobrist hash of the count of each tile type on the floor line, and whether it holds the start
+        marker.
+        """
+        return self.__hash
+
     def place_tiles_onto_floor_line(
         self, *, tiles: list[Tile]
     ) -> list[Tile] | None:
@@ -60,13 +97,66 @@ class FloorLine:
             # If the tile length is less than the space remaining, all the tiles will be added to the floor line.
             if tile_length < space_remaining:
                 self.__floor_line.extend(tiles)
+                self._count_tiles(tiles, 1)
             # If the tile length is greater than or equal to the space remaining, it will add that many tiles to the floor line and return the
             # rest.
             elif tile_length >= space_remaining:
                 self.__floor_line.extend(tiles[:space_remaining])
+                self._count_tiles(tiles[:space_remaining], 1)
                 return tiles[space_remaining:]
         return None
 
+    def return_tile_counts(self) -> tuple[int, ...]:
+        """
+        Method that returns the count of each tile type on the floor line, in the order of TILE_TYPES. The start marker isn't counted.
+        """
+        return tuple(self.__tile_counts[: len(TILES)])
+
+    def restore_tile_counts(
+        self, tile_counts: tuple[int, ...], start_marker: Tile | None
+    ) -> None:
+        """
+        Method that takes the count of each tile type, in the order of TILE_TYPES, and the start marker if it's on this floor line.
+
+        It replaces the tiles on the floor line with them, starting with the start marker.
+        """
+        self.clear_floor_line()
+        if start_marker is not None:
+            self.__floor_line.append(start_marker)
+        for tile, count in zip(TILES, tile_counts):
+            self.__floor_line.extend([tile] * count)
+        self._count_tiles(self.__floor_line, 1)
+
+    def remove_tiles_from_floor_line(self, num_of_tiles: int) -> None:
+        """
+        Method that takes a number of tiles, and removes that many of the most recently placed tiles from the floor line.
+
+        This is used to undo placing tiles onto the floor line.
+        """
+        for _ in range(num_of_tiles):
+            self._count_tiles((self.__floor_line.pop(),), -1)
+
+    def restore_floor_line(self, tiles: list[Tile]) -> None:
+        """
+        Method that takes a list of tiles returned by clear_floor_line, and puts them back onto the floor line in the same order.
+        """
+        self.clear_floor_line()
+        self.__floor_line.extend(tiles)
+        self._count_tiles(self.__floor_line, 1)
+
+    def clear_floor_line(self) -> list[Tile]:
+        """
+        Method that clears the floor line.
+
+        It returns a list of tiles to be added to the lid.
+        """
+        returned_tiles: list[Tile] = list(self.__floor_line)
+        self.__floor_line.clear()
+        self.__tile_counts = [0] * len(self.__tile_counts)
+        self.__hash = 0
+
+        return returned_tiles
+
     def calculate_score(self) -> int:
         """
         Method that calculates the negative score incurred by tiles being in the floor line.
@@ -4,22 +4,30 @@ Module containing the PatternLine class implementation.
 
 from collections import deque
 from collections.abc import Iterator
-from ..tile import Tile
+from ..tile import Tile, TILES
 from ..rule_error import RuleError
+from ..view import SequenceView
+from ..zobrist import PATTERN_LINE_KEYS
 
 
 class PatternLine:
     """
     The PatternLine class handles methods associated with adding and removing Tiles from the pattern lines.
+
+    The Zobrist hash of the pattern lines is kept up to date as tiles are added and removed.
     """
 
     __pattern_lines: list[deque[Tile]]
+    __hash: int
+    __view: SequenceView | None
 
     def __init__(self) -> None:
         """
         The constructor method generates a list of double-ended queues for each pattern line.
         """
         self.__pattern_lines: list[deque[Tile]] = []
+        self.__hash = 0
+        self.__view = None
 
         # A double-ended queue of ascending max-lengths from 1-5 is created, each being appended to the list.
         for line_length in range(1, 6):
@@ -33,6 +41,31 @@ class PatternLine:
         for pattern_line in self.__pattern_lines:
             yield list(pattern_line)
 
+    def view(self) -> SequenceView:
+        """
+        Method that returns a read-only view of the pattern lines, where each pattern line is a read-only view of its tiles.
+        """
+        if self.__view is None:
+            self.__view = SequenceView(
+                lambda: self.__pattern_lines, nested=True
+            )
+        return self.__view
+
+    def _line_key(self, line_index: int) -> int:
+        # The key of a pattern line is the key of its tile type and number of tiles, or 0 if it's empty.
+        pattern_line: deque[Tile] = self.__pattern_lines[line_index]
+        if not pattern_line:
+            return 0
+        return PATTERN_LINE_KEYS[line_index * 5 + pattern_line[-1].index][
+            len(pattern_line)
+        ]
+
+    def return_hash(self) -> int:
+        """
+        Method that returns the Zobrist hash of the pattern lines.
+        """
+        return self.__hash
+
     def _is_type_in_line(self, tile_type: str, line: deque[Tile]) -> bool:
         """
         Method that checks whether the specified type of tile is in a pattern line.
@@ -44,6 +77,50 @@ class PatternLine:
                 return False
         return True
 
+    def return_state(self) -> tuple[int, ...]:
+        """
+        Method that returns, for each pattern line, the index of its tile type (or -1 if it's empty) followed by the number of tiles
+        on it, as a flat tuple.
+        """
+        state: list[int] = []
+        for pattern_line in self.__pattern_lines:
+            state.append(pattern_line[-1].index if pattern_line else -1)
+            state.append(len(pattern_line))
+        return tuple(state)
+
+    def restore_state(self, state: tuple[int, ...]) -> None:
+        """
+        Method that takes the flat tuple returned by return_state, and replaces the tiles on the pattern lines with it.
+        """
+        for line_index, pattern_line in enumerate(self.__pattern_lines):
+            tile_index: int = state[line_index * 2]
+            pattern_line.clear()
+            pattern_line.extend(
+                [TILES[tile_index]] * state[line_index * 2 + 1]
+            )
+        self.__hash = 0
+        for line_index in range(len(self.__pattern_lines)):
+            self.__hash ^= self._line_key(line_index)
+
+    def is_line_available(self, line_index: int, tile_type: str) -> bool:
+        """
+        Method that takes the pattern line index and the type of tile, and checks if tiles of that type can be placed onto the line,
+        i.e. the line isn't full and only holds tiles of the same type.
+
+        If so, it returns True. Otherwise, it returns False.
+        """
+        pattern_line: deque[Tile] = self.__pattern_lines[line_index]
+        return len(pattern_line) != pattern_line.maxlen and (
+            not pattern_line or pattern_line[-1] == tile_type
+        )
+
+    def get_space_remaining(self, line_index: int) -> int:
+        """
+        Method that takes the pattern line index, and returns how many more tiles fit onto the pattern line.
+        """
+        pattern_line: deque[Tile] = self.__pattern_lines[line_index]
+        return (pattern_line.maxlen or 0) - len(pattern_line)
+
     def is_line_full(self, line_index: int) -> bool:
         """
         Method that takes the pattern line index and checks if the corresponding pattern line is full.
@@ -59,14 +136,23 @@ class PatternLine:
         # Otherwise, it returns True.
         return True
 
-    def get_tile_type(self, line_index: int) -> str:
+    def clear_full_lines(self) -> list[tuple[int, Tile, list[Tile]]]:
         """
-        Method that takes the pattern line index and checks the type of the last element within the pattern line.
+        Method that clears every full pattern line in one pass.
 
-        It then returns the type.
+        It returns, for each full line, its line index, the tile to be placed onto the wall, and the rest of its tiles, which are to
+        be added to the lid.
         """
-        # This returns the type of tile of the last element in the selected pattern line.
-        return repr(self.__pattern_lines[line_index][-1])
+        cleared_lines: list[tuple[int, Tile, list[Tile]]] = []
+        for line_index, pattern_line in enumerate(self.__pattern_lines):
+            if len(pattern_line) != pattern_line.maxlen:
+                continue
+            # The line is emptied, so its key is removed from the hash.
+            self.__hash ^= self._line_key(line_index)
+            tile: Tile = pattern_line[-1]
+            cleared_lines.append((line_index, tile, [tile] * line_index))
+            pattern_line.clear()
+        return cleared_lines
 
     def place_tile_onto_pattern_line(
         self, tiles: list[Tile], tile_type: str, line_index: int
@@ -106,6 +192,7 @@ class PatternLine:
                         "message": f"Selected Pattern Line only has {space_remaining} space(s) remaining! Please try again but with less Tiles.",
                     }
                 )
+            self.__hash ^= self._line_key(line_index)
             # If the space remaining isn't 0, but there are some spaces available, then fill those spaces.
             if tile_length > space_remaining:
                 self.__pattern_lines[line_index].extendleft(
@@ -114,32 +201,21 @@ class PatternLine:
             # Otherwise, fill the pattern tiles with all the tiles.
             else:
                 self.__pattern_lines[line_index].extendleft(tiles)
+            self.__hash ^= self._line_key(line_index)
         # And return the tiles that were added to the pattern line as a list.
         return list(self.__pattern_lines[line_index].copy())
 
-    def clear_pattern_line(self, line_index: int) -> list[Tile]:
+    def remove_tiles_from_pattern_line(
+        self, line_index: int, num_of_tiles: int
+    ) -> None:
         """
-        Method that takes the line index, and clears the pattern line.
+        Method that takes the pattern line index and a number of tiles, and removes that many of the most recently placed tiles from
+        the pattern line.
 
-        It returns a list of tiles to be added to the lid.
+        This is used to undo placing tiles onto the pattern line.
         """
-        # Validation to ensure that the line is full before being cleared.
-        if not self.is_line_full(line_index):
-            raise RuleError(
-                {
-                    "class": "PatternLine",
-                    "method": "clear_pattern_line",
-                    "message": "Cannot clear pattern line if line is not full.",
-                }
-            )
-
-        # Removes last element that was added to the wall.
-        self.__pattern_lines[line_index].pop()
-
-        returned_tiles: list[Tile] = []
-        if len(self.__pattern_lines[line_index]) > 0:
-            # Pops remaining elements in pattern line to be returned.
-            for _ in range(len(self.__pattern_lines[line_index])):
-                returned_tiles.append(self.__pattern_lines[line_index].pop())
-
-        return returned_tiles
+        # Tiles are placed onto the left of the pattern line, so the most recent ones are removed from the left.
+        self.__hash ^= self._line_key(line_index)
+        for _ in range(num_of_tiles):
+            self.__pattern_lines[line_index].popleft()
+        self.__hash ^= self._line_key(line_index)
@@ -2,8 +2,26 @@
 Module containing the Wall class implementation.
 """
 
-import numpy as np
-from ..tile import Tile
+from array import array
+from ..rules import (
+    COLOUR_BONUS,
+    COLOUR_MASKS,
+    COLUMN_BONUS,
+    COLUMN_MASKS,
+    COLUMNS,
+    PLACEMENT_SCORES,
+    ROW_BONUS,
+    ROW_MASKS,
+    ROWS,
+)
+from ..tile import Tile, TILES, TILE_TYPES
+from ..view import WallView
+from ..zobrist import WALL_KEYS
+
+# Lookup of tile type -> index of the tile type in TILE_TYPES.
+_COLOUR_INDEXES: dict[str, int] = {
+    tile_type: index for index, tile_type in enumerate(TILE_TYPES)
+}
 
 
 class Wall:
@@ -11,88 +29,97 @@ class Wall:
     The Wall class handles methods associated with adding and removing tiles from the floor line.
     """
 
-    __rows: int = 5
-    __columns: int = 5
-    __depth: int = 2
-    __wall = np.empty((__rows, __columns, __depth), dtype=object)
-
-    def _shift_right(self, tiles_list: list[str | None]) -> list[str | None]:
-        """
-        Method that takes in a list of tile types, and shifts them one to the right.
-
-        It then returns the shifted list.
-        """
-        shifted_list: list[str | None] = [None] * len(tiles_list)
-        # For each index in the tiles list,
-        for index, _ in enumerate(tiles_list):
-            # We shift it one to the right, and mod it by the length of tiles list so it wraps around to the beginning.
-            shifted_list[(index + 1) % len(tiles_list)] = tiles_list[index]
-
-        # The shifted list is returned.
-        return shifted_list
+    __rows: int = ROWS
+    __columns: int = COLUMNS
+    __occupancy: int
+    __transposed: int
+    __hash: int
+    __row_counts: array
+    __column_counts: array
+    __colour_counts: array
+    __full_rows: int
+    __full_columns: int
+    __full_colours: int
+    __view: WallView | None
 
     def __init__(self) -> None:
         """
         Constructor method that initalises the items on the wall.
-        """
-        self.__wall = np.empty(
-            (self.__rows, self.__columns, self.__depth), dtype=object
-        )
-
-        tiles_list: list[str | None] = ["blue", "yellow", "red", "black", "ice"]
-        for i in range(self.__rows):
-            for j in range(self.__columns):
-                # For each row, and column in range 5, we initialise a list with:
-                # A string from tiles_list to indicate the tile type.
-                # And either a Tile object if the tile is present, or None if it isn't.
-                wall_item: list[str | Tile | None] = [tiles_list[j], None]
-                self.__wall[i][j] = wall_item
-            # And then we shift tiles_list one item to the right, modded by the total number of items in tiles_list.
-            tiles_list = self._shift_right(tiles_list)
-
-    def _count_adjacent_row_items(
-        self, row_index: int, column_index: int
-    ) -> int:
-        consecutive_count: int = 0
 
-        # Count consecutive items to the left of the selected item, EXCLUDING item
-        for index in range(column_index - 1, -1, -1):
-            if self.__wall[row_index][index][1] is not None:
-                consecutive_count += 1
-            else:
-                break
-
-        # Count consecutive items to the right of the selected item
-        for index in range(column_index + 1, len(self.__wall[row_index])):
-            if self.__wall[row_index][index][1] is not None:
-                consecutive_count += 1
-            else:
-                break
+        The occupancy is stored row by row, and the transposed occupancy column by column, so that both rows and columns can be read as 5 bits.
+        The Zobrist hash of the occupied cells is kept alongside them, as is the number of tiles in each row, column and colour, and
+        the number of those that are full, so the end of the game and the final bonus never need the wall to be scanned.
+        """
+        self.__occupancy = 0
+        self.__transposed = 0
+        self.__hash = 0
+        self.__row_counts = array("B", bytes(self.__rows))
+        self.__column_counts = array("B", bytes(self.__columns))
+        self.__colour_counts = array("B", bytes(len(TILE_TYPES)))
+        self.__full_rows = 0
+        self.__full_columns = 0
+        self.__full_colours = 0
+        self.__view = None
+
+    def _get_placement_index(self, row: int, column: int) -> int:
+        """
+        Method that takes the row index and the column index, and returns the index of the placement score in the lookup table.
+        """
+        row_bits: int = (self.__occupancy >> (row * self.__columns)) & 0b11111
+        column_bits: int = (
+            self.__transposed >> (column * self.__rows)
+        ) & 0b11111
+        return (
+            ((row * self.__columns + column) << 10)
+            | (row_bits << 5)
+            | column_bits
+        )
 
-        # The consecutive items to the left and right constitute the row score, NOT INCLUDING the tile itself.
-        return consecutive_count
+    def view(self) -> WallView:
+        """
+        Method that returns a read-only view of the wall as a 5 x 5 grid, where each cell is the Tile on the wall, or None.
+        """
+        if self.__view is None:
+            self.__view = WallView(lambda: self.__occupancy)
+        return self.__view
 
-    def _count_adjacent_column_items(
-        self, row_index: int, column_index: int
-    ) -> int:
-        consecutive_count: int = 0
+    def return_occupancy(self) -> int:
+        """
+        Method that returns the occupancy of the wall as a 25-bit integer, where bit (row * 5 + column) is set if a tile is on the wall.
+        """
+        return self.__occupancy
 
-        # Count consecutive items above the selected item, EXCLUDING item
-        for index in range(row_index - 1, -1, -1):
-            if self.__wall[index][column_index][1] is not None:
-                consecutive_count += 1
-            else:
-                break
+    def restore_occupancy(self, occupancy: int) -> None:
+        """
+        Method that takes the occupancy of a wall as a 25-bit integer, and replaces the tiles on this wall with it.
+        """
+        self.__occupancy = occupancy
+        self.__transposed = 0
+        self.__hash = 0
+        # For each tile on the wall, the bit is also set in the column-major occupancy, and its key is added to the hash.
+        for cell in range(self.__rows * self.__columns):
+            if occupancy >> cell & 1:
+                row, column = divmod(cell, self.__columns)
+                self.__transposed |= 1 << (column * self.__rows + row)
+                self.__hash ^= WALL_KEYS[cell]
 
-        # Count consecutive items below the selected item
-        for index in range(row_index + 1, len(self.__wall)):
-            if self.__wall[index][column_index][1] is not None:
-                consecutive_count += 1
-            else:
-                break
+        # The tiles in each row, column and colour are counted from their masks.
+        for counts, masks in (
+            (self.__row_counts, ROW_MASKS),
+            (self.__column_counts, COLUMN_MASKS),
+            (self.__colour_counts, COLOUR_MASKS),
+        ):
+            for index, mask in enumerate(masks):
+                counts[index] = (occupancy & mask).bit_count()
+        self.__full_rows = self.__row_counts.count(self.__columns)
+        self.__full_columns = self.__column_counts.count(self.__rows)
+        self.__full_colours = self.__colour_counts.count(self.__rows)
 
-        # The consecutive items above and below constitute the column score, NOT INCLUDING the tile itself.
-        return consecutive_count
+    def return_hash(self) -> int:
+        """
+        Method that returns the Zobrist hash of the tiles on the wall.
+        """
+        return self.__hash
 
     def return_wall(self) -> list[list[list[str | Tile | None]]]:
         """
@@ -106,9 +133,16 @@ class Wall:
         for i in range(self.__rows):
             wall_row: list[list[str | Tile | None]] = []
             for j in range(self.__columns):
-                wall_item: list[str | Tile | None] = list(self.__wall[i][j])
+                # The tile type of the item is shifted one to the right for each row.
+                tile_type: str = TILE_TYPES[(j - i) % self.__columns]
+                # If the bit is set, a Tile is on the wall. Otherwise, it's None.
+                tile: Tile | None = (
+                    TILES[(j - i) % self.__columns]
+                    if self.__occupancy >> (i * self.__columns + j) & 1
+                    else None
+                )
                 # The item in that row is appended to the row.
-                wall_row.append(wall_item)
+                wall_row.append([tile_type, tile])
             # The entire row is appended to the wall.
             wall.append(wall_row)
 
@@ -121,54 +155,25 @@ class Wall:
 
         If it does, it returns True. Otherwise, it returns False.
         """
+        colour_index: int | None = _COLOUR_INDEXES.get(tile_type)
+        # If the tile type isn't on the wall at all, it can't be placed.
+        if colour_index is None:
+            return False
 
-        # For the pattern line index selected,
-        for wall_row in self.__wall[line_index]:
-            # if tile is on corresponding index of the wall
-            if wall_row[0] == tile_type:
-                # and the value is not None
-                if wall_row[1] is not None:
-                    # then the tile is on the wall.
-                    return True
-        # Otherwise, it isn't.
-        return False
+        # The tile is on the wall if the bit for that colour on that row is set.
+        return bool(
+            self.__occupancy
+            & COLOUR_MASKS[colour_index]
+            & ROW_MASKS[line_index]
+        )
 
     def is_row_full(self) -> bool:
         """
-        Method that iterates through each of the rows and checks if any of the rows are full.
+        Method that checks if any of the rows are full.
 
         If so, it returns True. Otherwise, it returns False.
         """
-        # For each row in the wall,
-        for row_index in range(self.__rows):
-            count: int = 0
-            # the nest item is checked to see if it's not None.
-            for column_index in range(self.__columns):
-                if self.__wall[row_index][column_index][1] is not None:
-                    # If so, the count is incremented by 1.
-                    count += 1
-            # If the consecutive row count is 5, i.e. all tiles are not None, then it's a full row.
-            if count == 5:
-                # If so, we return True.
-                return True
-        # Otherwise, we return False.
-        return False
-
-    def get_column_index(self, line_index: int, tile_type: str) -> int:
-        """
-        Method that takes the pattern line index and the type of tile, and retrieves the index of the column.
-
-        It then returns that column index.
-        """
-        index: int = 0
-        # For each associated row in the wall,
-        for i, wall_row in enumerate(self.__wall[line_index]):
-            # If the associated tile type is the same as the passed in tile type,
-            if repr(wall_row[0]) == tile_type:
-                # then the index of that tile is returned.
-                index = i
-
-        return index
+        return self.__full_rows > 0
 
     def place_tile_onto_wall(
         self, row: int, column: int, tile_type: str
@@ -178,95 +183,73 @@ class Wall:
 
         It then returns the score.
         """
-        score: int = 0
-
-        # A new tile is added onto the wall at the selected row and column.
-        self.__wall[row][column][1] = Tile(tile_type)
-
-        # The row score is calculated, which counts the number of adjacent items in that row.
-        row_score: int = self._count_adjacent_row_items(row, column)
-        # Also, the column score is calculated, which counts the number of adjacent items in that column.
-        column_score: int = self._count_adjacent_column_items(row, column)
-
-        # consecutive items in the row (excluding item) + consecutive items in the column (excluding item) + item itself for each row and column.
-        score = row_score + column_score + 2
-
-        # That score is then returned.
-        return score
+        # The bit for the selected row and column is set, in both the row-major and column-major occupancy.
+        cell: int = row * self.__columns + column
+        if not self.__occupancy >> cell & 1:
+            self.__hash ^= WALL_KEYS[cell]
+            # The tile is counted in its row, its column and its colour, and any of them it fills is counted as full.
+            colour: int = (column - row) % COLUMNS
+            row_counts: array = self.__row_counts
+            column_counts: array = self.__column_counts
+            colour_counts: array = self.__colour_counts
+            row_counts[row] += 1
+            column_counts[column] += 1
+            colour_counts[colour] += 1
+            if row_counts[row] == COLUMNS:
+                self.__full_rows += 1
+            if column_counts[column] == ROWS:
+                self.__full_columns += 1
+            if colour_counts[colour] == ROWS:
+                self.__full_colours += 1
+        self.__occupancy |= 1 << cell
+        self.__transposed |= 1 << (column * self.__rows + row)
+
+        # The score is looked up from the row and column the tile was placed in.
+        return PLACEMENT_SCORES[self._get_placement_index(row, column)]
+
+    def get_placement_score(self, row: int, column: int) -> int:
+        """
+        Method that takes in the row index and the column index, and returns the score of placing an item there, without placing it.
+        """
+        return PLACEMENT_SCORES[self._get_placement_index(row, column)]
 
     def count_full_rows(self) -> int:
         """
-        Method that iterates through each of the rows and checks if they're full.
-
-        It returns a count of full rows.
+        Method that returns a count of full rows.
         """
-        full_row_count: int = 0
-
-        # For each row in the wall,
-        for row_index in range(self.__rows):
-            consecutive_count: int = 0
-            # the next item is checked to see if it's not None.
-            for column_index in range(self.__columns):
-                if self.__wall[row_index][column_index][1] is not None:
-                    # If so, the count is incremented by 1.
-                    consecutive_count += 1
-            # If the consecutive row count is 5, i.e. all tiles are not None, then it's a full row.
-            if consecutive_count == 5:
-                # And the full row count is incremented by 1.
-                full_row_count += 1
-
-        # The full row count is then returned.
-        return full_row_count
+        return self.__full_rows
 
     def count_full_columns(self) -> int:
         """
-        Method that iterates through each of the columns and checks if they're full.
-
-        It returns a count of full columns.
+        Method that returns a count of full columns.
         """
-        full_column_count: int = 0
-
-        # For each column in the wall,
-        for row_index in range(self.__rows):
-            consecutive_count: int = 0
-            # the next item is checked to see if it's not None.
-            for column_index in range(self.__columns):
-                if self.__wall[column_index][row_index][1] is not None:
-                    # If so, the count is incremented by 1.
-                    consecutive_count += 1
-            # If the consecutive column count is 5, i.e. all tiles are not None, then it's a full column.
-            if consecutive_count == 5:
-                # And the full column count is incremented by 1.
-                full_column_count += 1
-
-        # The full column count is then returned.
-        return full_column_count
+        return self.__full_columns
 
     def count_full_tiles(self) -> int:
         """
-        Method that iterates through each of the rows and columns diagonally and checks if it has a full row of tiles.
-
-        It returns a count of diagonal tiles.
+        Method that returns a count of full colours, i.e. colours with all of their tiles on the wall.
         """
-        full_tile_count: int = 0
+        return self.__full_colours
 
-        # For each row in the wall,
-        for row_index in range(self.__rows):
-            consecutive_count: int = 0
-            # And for each column,
-            for column_index in range(self.__columns):
-                # If the row + column % rows of the item is not None
-                if (
-                    self.__wall[column_index][
-                        (row_index + column_index) % self.__rows
-                    ][1]
-                    is not None
-                ):
-                    # If so, the count is incremented by 1.
-                    consecutive_count += 1
-            # If so, the consecutive count is 5, i.e. all tiles are not None. And it's a full diagonal row. (all the tiles of that type are on the wall).
-            if consecutive_count == 5:
-                full_tile_count += 1
+    def return_line_counts(
+        self,
+    ) -> tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]:
+        """
+        Method that returns the number of tiles in each row, in each column, and of each colour (in the order of TILE_TYPES).
+        """
+        return (
+            tuple(self.__row_counts),
+            tuple(self.__column_counts),
+            tuple(self.__colour_counts),
+        )
 
-        # The full diagonal row count is then returned.
-        return full_tile_count
+    def calculate_bonus(self) -> int:
+        """
+        Method that returns the bonus the wall would score if the game ended now: 2 for each full row, 7 for each full column,
+        and 10 for each colour with all of its tiles on the wall.
+        """
+        return (
+            self.__full_rows * ROW_BONUS
+            + self.__full_columns * COLUMN_BONUS
+            + self.__full_colours * COLOUR_BONUS
+        )
@@ -0,0 +1,445 @@
+"""
+Module containing the position dataset, which streams the positions of played games to disk as fixed-size records, and reads
+them back through memory maps, so datasets far larger than memory can be sampled from.
+
+A dataset is a directory of four raw files, with one row per position, in the same order:
+
+- observations.u8: the observation of the player to move, as OBSERVATION_SIZE uint8 values, laid out as described in
+  game.observation.
+- legal_masks.u8: the legal moves of the player to move, as MOVE_SIZE bits packed into MASK_SIZE bytes.
+- moves.i16: the index of the move that was played, as an int16.
+- outcomes.f32: the final outcome for the player who moved, as a float32. The players with the highest final score share an
+  outcome of 1, and the rest get 0.
+
+A move's index is worked out from its source (the factory index, or MAX_FACTORIES for the center), its tile type index and its
+destination (the pattern line index, or FLOOR), so it's the same for every number of players.
+
+Rows are only ever appended, so a dataset can be added to by later runs. Run it directly to fill a dataset with random play:
+
+    python3 -m game.dataset positions --games 1000 --players 2 --seed 0
+"""
+
+import argparse
+import os
+import time
+from collections.abc import Sequence
+from types import TracebackType
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple
+import numpy as np
+from numpy.random import Generator
+from .move import CENTER, Move
+from .observation import MAX_FACTORIES, OBSERVATION_SIZE
+from .tile import TILE_INDEXES, TILE_TYPES
+
+if TYPE_CHECKING:
+    from .game import Game
+    from .simulate import Policy
+
+# There is a move for every source (each factory and the center), tile type and destination (each pattern line and the floor
+# line).
+MOVE_SIZE: int = (MAX_FACTORIES + 1) * len(TILE_TYPES) * 6
+# The legal moves are packed 8 to a byte.
+MASK_SIZE: int = (MOVE_SIZE + 7) // 8
+
+# The file name and the shape and type of a row, for each part of a position.
+_FILES: dict[str, tuple[str, int, np.dtype]] = {
+    "observations": ("observations.u8", OBSERVATION_SIZE, np.dtype(np.uint8)),
+    "legal_masks": ("legal_masks.u8", MASK_SIZE, np.dtype(np.uint8)),
+    "moves": ("moves.i16", 1, np.dtype("<i2")),
+    "outcomes": ("outcomes.f32", 1, np.dtype("<f4")),
+}
+
+
+class Positions(NamedTuple):
+    """
+    Class that holds a batch of positions: the observations (N x OBSERVATION_SIZE uint8), the legal moves (N x MOVE_SIZE bool),
+    the index of the move played (N int16) and the final outcome for the player who moved (N float32).
+    """
+
+    observations: np.ndarray
+    legal_masks: np.ndarray
+    moves: np.ndarray
+    outcomes: np.ndarray
+
+
+def move_index(move: Move) -> int:
+    """
+    Function that takes a move, and returns its index in the legal-move mask.
+    """
+    source: int = MAX_FACTORIES if move.source == CENTER else move.source
+    return (source * len(TILE_TYPES) + TILE_INDEXES[move.tile_type]) * 6 + (
+        move.destination
+    )
+
+
+def index_to_move(index: int) -> Move:
+    """
+    Function that takes the index of a move in the legal-move mask, and returns the move.
+    """
+    # Validation to ensure the index is in the mask.
+    if index not in range(MOVE_SIZE):
+        raise IndexError(
+            {
+                "class": "dataset",
+                "method": "index_to_move",
+                "message": f"Please enter an 'index' between 0 and {MOVE_SIZE - 1}",
+            }
+        )
+    source, rest = divmod(index, len(TILE_TYPES) * 6)
+    tile_index, destination = divmod(rest, 6)
+    return Move(
+        CENTER if source == MAX_FACTORIES else source,
+        TILE_TYPES[tile_index],
+        destination,
+    )
+
+
+def move_indexes(moves: np.ndarray) -> np.ndarray:
+    """
+    Function that takes an N x 3 array of moves, as played by BatchGame.step, and returns the index of each move in the
+    legal-move mask.
+    """
+    moves = np.asarray(moves, dtype=np.int64)
+    sources: np.ndarray = np.where(
+        moves[:, 0] == CENTER, MAX_FACTORIES, moves[:, 0]
+    )
+    return (sources * len(TILE_TYPES) + moves[:, 1]) * 6 + moves[:, 2]
+
+
+def legal_mask(game: "Game") -> np.ndarray:
+    """
+    Function that takes a game, and returns a boolean array of length MOVE_SIZE of the legal moves of the current player.
+    """
+    mask: np.ndarray = np.zeros(MOVE_SIZE, dtype=bool)
+    mask[[move_index(move) for move in game.legal_moves()]] = True
+    return mask
+
+
+def legal_masks(batch_mask: np.ndarray) -> np.ndarray:
+    """
+    Function that takes the N x (F + 1) x 5 x 6 legal-move mask of a BatchGame, and returns it as an N x MOVE_SIZE boolean
+    array, with the center moved to the slot after the last possible factory.
+    """
+    num_of_factories: int = batch_mask.shape[1] - 1
+    masks: np.ndarray = np.zeros(
+        (len(batch_mask), MAX_FACTORIES + 1) + batch_mask.shape[2:],
+        dtype=bool,
+    )
+    masks[:, :num_of_factories] = batch_mask[:, :num_of_factories]
+    masks[:, MAX_FACTORIES] = batch_mask[:, num_of_factories]
+    return masks.reshape(len(batch_mask), MOVE_SIZE)
+
+
+def _outcomes(game: "Game") -> list[float]:
+    # The players with the highest score share an outcome of 1. If the final scores haven't been worked out, the scores as they
+    # are are used.
+    winners: dict[int, int] = game.return_winners()
+    if not winners:
+        scores: list[int] = [
+            game.return_score(player_index=player)
+            for player in range(game.return_num_of_players())
+        ]
+        winners = {
+            player: score
+            for player, score in enumerate(scores)
+            if score == max(scores)
+        }
+    return [
+        1 / len(winners) if player in winners else 0.0
+        for player in range(game.return_num_of_players())
+    ]
+
+
+def _num_of_rows(directory: str) -> int:
+    # A run that stopped part way through writing a position can leave the files with different numbers of rows, so only the
+    # rows that are in every file are counted.
+    return min(
+        (
+            os.path.getsize(os.path.join(directory, file_name))
+            if os.path.exists(os.path.join(directory, file_name))
+            else 0
+        )
+        // (row_size * dtype.itemsize)
+        for file_name, row_size, dtype in _FILES.values()
+    )
+
+
+class DatasetWriter:
+    """
+    Class that appends positions to a dataset.
+
+    The positions of a game are held until the game ends, as their outcome isn't known until then. Positions whose outcome is
+    already known, such as those of a BatchGame, can be appended straight away with append.
+    """
+
+    __files: dict[str, BinaryIO]
+    __observations: list[np.ndarray]
+    __legal_masks: list[np.ndarray]
+    __moves: list[int]
+    __players: list[int]
+    __num_of_rows: int
+
+    def __init__(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        # Any partly written rows are cut off, so every file starts at the same row.
+        self.__num_of_rows = _num_of_rows(directory)
+        self.__files = {}
+        for name, (file_name, row_size, dtype) in _FILES.items():
+            file: BinaryIO = open(os.path.join(directory, file_name), "ab")
+            file.truncate(self.__num_of_rows * row_size * dtype.itemsize)
+            self.__files[name] = file
+        self.__observations = []
+        self.__legal_masks = []
+        self.__moves = []
+        self.__players = []
+
+    def __len__(self) -> int:
+        return self.__num_of_rows
+
+    def add_position(self, game: "Game", move: Move) -> None:
+        """
+        Method that takes a game and the move the current player is about to play, and holds the position until the game ends.
+
+        It should be called before the move is applied.
+        """
+        player_index: int = game.return_current_player()
+        self.__observations.append(
+            game.encode_observation(
+                player_index, np.zeros(OBSERVATION_SIZE, dtype=np.uint8)
+            )
+        )
+        self.__legal_masks.append(legal_mask(game))
+        self.__moves.append(move_index(move))
+        self.__players.append(player_index)
+
+    def end_game(self, game: "Game") -> int:
+        """
+        Method that takes the game the held positions were played in once it has ended, and appends them with the outcome for
+        the player who moved in each.
+
+        It returns the number of positions appended.
+        """
+        outcomes: list[float] = _outcomes(game)
+        num_of_positions: int = len(self.__moves)
+        if num_of_positions:
+            self.append(
+                np.stack(self.__observations),
+                np.stack(self.__legal_masks),
+                np.array(self.__moves),
+                np.array([outcomes[player] for player in self.__players]),
+            )
+        self.discard_game()
+        return num_of_positions
+
+    def discard_game(self) -> None:
+        """
+        Method that throws away the positions held for the current game.
+        """
+        self.__observations = []
+        self.__legal_masks = []
+        self.__moves = []
+        self.__players = []
+
+    def append(
+        self,
+        observations: np.ndarray,
+        legal_masks: np.ndarray,
+        moves: np.ndarray | Sequence[int],
+        outcomes: np.ndarray | Sequence[float],
+    ) -> None:
+        """
+        Method that takes N observations, N x MOVE_SIZE legal-move masks, N move indexes and N outcomes, and appends them to the
+        dataset.
+        """
+        observations = np.asarray(observations)
+        legal_masks = np.asarray(legal_masks, dtype=bool)
+        moves = np.asarray(moves)
+        outcomes = np.asarray(outcomes)
+        num_of_positions: int = len(observations)
+        # Validation to ensure every part has a row for every position.
+        if (
+            observations.shape != (num_of_positions, OBSERVATION_SIZE)
+            or legal_masks.shape != (num_of_positions, MOVE_SIZE)
+            or moves.shape != (num_of_positions,)
+            or outcomes.shape != (num_of_positions,)
+        ):
+            raise ValueError(
+                {
+                    "class": "DatasetWriter",
+                    "method": "append",
+                    "message": f"Please enter {num_of_positions} observations of length {OBSERVATION_SIZE}, legal masks of "
+                    f"length {MOVE_SIZE}, moves and outcomes.",
+                }
+            )
+
+        rows: dict[str, np.ndarray] = {
+            "observations": observations,
+            "legal_masks": np.packbits(legal_masks, axis=1),
+            "moves": moves,
+            "outcomes": outcomes,
+        }
+        for name, (_, _, dtype) in _FILES.items():
+            self.__files[name].write(
+                np.ascontiguousarray(rows[name], dtype=dtype).tobytes()
+            )
+        self.__num_of_rows += num_of_positions
+
+    def __enter__(self) -> "DatasetWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def flush(self) -> None:
+        """
+        Method that writes the appended positions through to the files.
+        """
+        for file in self.__files.values():
+            file.flush()
+
+    def close(self) -> None:
+        """
+        Method that closes the files. The positions held for a game that hasn't ended are thrown away.
+        """
+        self.discard_game()
+        for file in self.__files.values():
+            file.close()
+
+
+class Dataset:
+    """
+    Class that reads a dataset through memory maps, so positions are only read from disk when they're accessed.
+
+    The dataset holds the positions that were written when it was opened.
+    """
+
+    __num_of_rows: int
+    __arrays: dict[str, np.ndarray]
+
+    def __init__(self, directory: str) -> None:
+        # Validation to ensure the directory is a dataset.
+        if not os.path.isdir(directory):
+            raise ValueError(
+                {
+                    "class": "Dataset",
+                    "method": "__init__",
+                    "message": f"{directory} isn't a dataset.",
+                }
+            )
+        self.__num_of_rows = _num_of_rows(directory)
+        self.__arrays = {}
+        for name, (file_name, row_size, dtype) in _FILES.items():
+            shape: tuple[int, ...] = (
+                (self.__num_of_rows, row_size)
+                if row_size > 1
+                else (self.__num_of_rows,)
+            )
+            # An empty file can't be memory-mapped, so an empty dataset is read from empty arrays.
+            if self.__num_of_rows:
+                self.__arrays[name] = np.memmap(
+                    os.path.join(directory, file_name),
+                    dtype=dtype,
+                    mode="r",
+                    shape=shape,
+                )
+            else:
+                self.__arrays[name] = np.zeros(shape, dtype=dtype)
+
+    def __len__(self) -> int:
+        return self.__num_of_rows
+
+    def __getitem__(self, index: int | slice | np.ndarray) -> Positions:
+        """
+        Method that takes the index of a position, a slice, or an array of indexes, and reads those positions.
+        """
+        observations: np.ndarray = np.asarray(
+            self.__arrays["observations"][index]
+        )
+        return Positions(
+            observations,
+            np.unpackbits(
+                self.__arrays["legal_masks"][index], axis=-1, count=MOVE_SIZE
+            ).astype(bool),
+            np.asarray(self.__arrays["moves"][index]),
+            np.asarray(self.__arrays["outcomes"][index]),
+        )
+
+    def sample(self, batch_size: int, rng: Generator) -> Positions:
+        """
+        Method that takes a batch size and a NumPy Generator, and reads that many positions picked at random, with replacement.
+
+        Only the pages holding the picked positions are read from disk.
+        """
+        # Validation to ensure there are positions to sample from.
+        if not self.__num_of_rows:
+            raise IndexError(
+                {
+                    "class": "Dataset",
+                    "method": "sample",
+                    "message": "There are no positions in the dataset!",
+                }
+            )
+        # The indexes are sorted, so the files are read front to back.
+        indexes: np.ndarray = np.sort(
+            rng.integers(0, self.__num_of_rows, size=batch_size)
+        )
+        return self[indexes]
+
+
+def write_games(
+    directory: str,
+    n: int,
+    num_of_players: int = 2,
+    seed: int = 0,
+    policy: "Policy | None" = None,
+) -> int:
+    """
+    Function that plays n games between policies (random play by default), as game.simulate does, and appends their positions
+    to the dataset in directory.
+
+    It returns the number of positions appended.
+    """
+    # The simulate module imports the game module, which imports this one, so they're imported when they're needed.
+    from .game import Game
+    from .simulate import game_seed, play_rounds, random_policy
+
+    num_of_positions: int = 0
+    with DatasetWriter(directory) as writer:
+        for game_index in range(n):
+            game: Game = Game(seed=game_seed(seed, game_index))
+            (policy_rng,) = game.spawn_rngs(1)
+            game.initialise_players(num_of_players=num_of_players)
+            play_rounds(
+                game,
+                policy if policy is not None else random_policy,
+                policy_rng,
+                on_move=writer.add_position,
+            )
+            game.calculate_final_scores()
+            num_of_positions += writer.end_game(game)
+    return num_of_positions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("directory")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    start: float = time.perf_counter()
+    positions: int = write_games(
+        arguments.directory, arguments.games, arguments.players, arguments.seed
+    )
+    elapsed: float = time.perf_counter() - start
+    print(
+        f"{positions} positions from {arguments.games} games in {elapsed:.2f}s "
+        f"({positions / elapsed if elapsed > 0 else 0.0:.1f} positions/sec)"
+    )
+    print(f"{len(Dataset(arguments.directory))} positions in the dataset")
@@ -2,23 +2,53 @@
 Module containing the Factory class implementation.
 """
 
+from array import array
 from typing import Generator
-from collections.abc import Iterator
-from .tile import Tile
+from collections.abc import Iterator, Sequence
+from .tile import Tile, TILES, TILE_INDEXES
+from .view import SequenceView
+from .zobrist import FACTORY_KEYS, counts_key
+
+# There are at most 9 factories (in a 4 player game), so the counts of every factory fit in a fixed 9 x 5 array.
+_MAX_FACTORIES: int = 9
 
 
 class Factory:
     """
     Class that implements the addition and removal of Tiles from Factories.
+
+    The factories are kept as the count of each tile type in each factory, in a fixed 9 x 5 array in the order of TILE_TYPES,
+    along with the number of factories that aren't empty, so selecting tiles and checking whether the factories are empty don't
+    depend on the number of factories.
+
+    The Zobrist hash of the counts is kept up to date as tiles are added and removed.
     """
 
-    __factories: list[list[Tile]]
+    __tile_counts: array
+    __num_of_factories: int
+    __num_of_non_empty: int
+    __hash: int
+    __view: SequenceView | None
 
     def __init__(self) -> None:
-        self.__factories = []
+        self.__tile_counts = array("B", bytes(_MAX_FACTORIES * len(TILES)))
+        self.__num_of_factories = 0
+        self.__num_of_non_empty = 0
+        self.__hash = 0
+        self.__view = None
 
     def __iter__(self) -> Iterator[list[Tile]]:
-        for factory_tiles in self.__factories:
+        """
+        Iterator that loops through the factories, and for each factory returns a list of its tiles, grouped by tile type in the
+        order of TILE_TYPES.
+        """
+        tile_counts = self.__tile_counts
+        for factory_index in range(self.__num_of_factories):
+            factory_tiles: list[Tile] = []
+            for tile_index, tile in enumerate(TILES):
+                factory_tiles += [tile] * tile_counts[
+                    factory_index * 5 + tile_index
+                ]
             yield factory_tiles
 
     def _chunks(
@@ -31,16 +61,90 @@ class Factory:
         for index in range(0, len(tile_list), chunk_length):
             yield tile_list[index : index + chunk_length]
 
+    def view(self) -> SequenceView:
+        """
+        Method that returns a read-only view of the factories, where each factory is a read-only memoryview of the count of each
+        tile type in it, in the order of TILE_TYPES.
+
+        The view reads the factories as they are whenever it's accessed, so it's only created once.
+        """
+        if self.__view is None:
+            tile_counts: memoryview = memoryview(
+                self.__tile_counts
+            ).toreadonly()
+            factory_views: tuple[memoryview, ...] = tuple(
+                tile_counts[factory_index * 5 : factory_index * 5 + 5]
+                for factory_index in range(_MAX_FACTORIES)
+            )
+            self.__view = SequenceView(
+                lambda: range(self.__num_of_factories),
+                item_view=factory_views.__getitem__,
+            )
+        return self.__view
+
+    def return_hash(self) -> int:
+        """
+        Method that returns the Zobrist hash of the count of each tile type in each factory.
+        """
+        return self.__hash
+
+    def return_tile_counts(self) -> tuple[tuple[int, ...], ...]:
+        """
+        Method that returns, for each factory, the count of each tile type in the order of TILE_TYPES.
+        """
+        return tuple(
+            tuple(
+                self.__tile_counts[factory_index * 5 : factory_index * 5 + 5]
+            )
+            for factory_index in range(self.__num_of_factories)
+        )
+
+    def restore_tile_counts(
+        self, tile_counts: tuple[tuple[int, ...], ...]
+    ) -> None:
+        """
+        Method that takes the count of each tile type for each factory, and replaces the tiles in the factories with them.
+        """
+        self.clear_factories()
+        for factory_index, factory_counts in enumerate(tile_counts):
+            self.__tile_counts[factory_index * 5 : factory_index * 5 + 5] = (
+                array("B", factory_counts)
+            )
+            self.__hash ^= counts_key(
+                FACTORY_KEYS, factory_counts, factory_index * 5
+            )
+            if any(factory_counts):
+                self.__num_of_non_empty += 1
+        self.__num_of_factories = len(tile_counts)
+
+    def return_factory_counts(self, factory_index: int) -> bytes:
+        """
+        Method that takes the index of a factory, and returns the count of each tile type in it, in the order of TILE_TYPES.
+        """
+        return bytes(
+            self.__tile_counts[factory_index * 5 : factory_index * 5 + 5]
+        )
+
+    def is_tile_in_factory(self, tile_type: str, factory_index: int) -> bool:
+        """
+        Method that takes the type of tile and the index of the factory, and checks if a tile of that type is in the factory.
+
+        If so, it returns True. Otherwise, it returns False.
+        """
+        tile_index: int | None = TILE_INDEXES.get(tile_type)
+        return (
+            tile_index is not None
+            and 0 <= factory_index < self.__num_of_factories
+            and self.__tile_counts[factory_index * 5 + tile_index] > 0
+        )
+
     def is_factories_empty(self) -> bool:
         """
         Method that checks whether the factories are empty.
 
         If so, it returns True. Otherwise, if any of the factories are not empty, it will return False.
         """
-        for factory in self.__factories:
-            if len(factory) > 0:
-                return False
-        return True
+        return self.__num_of_non_empty == 0
 
     def add_tiles_to_factories(
         self, tiles_to_add: list[Tile]
@@ -53,13 +157,50 @@ class Factory:
         """
         # Split tiles to add into chunks of 4,
         factories: list[list[Tile]] = list(self._chunks(tiles_to_add, 4))
+        # Validation to ensure there is room for every factory.
+        if self.__num_of_factories + len(factories) > _MAX_FACTORIES:
+            raise IndexError(
+                {
+                    "class": "Factory",
+                    "method": "add_tiles_to_factories",
+                    "message": f"There can only be up to {_MAX_FACTORIES} factories!",
+                }
+            )
         # then for each factory,
         for tiles in factories:
-            # append its tiles to the factories attribute.
-            self.__factories.append(tiles)
+            # count its tiles into the next factory.
+            offset: int = self.__num_of_factories * 5
+            for tile in tiles:
+                count: int = self.__tile_counts[offset + tile.index]
+                self.__tile_counts[offset + tile.index] = count + 1
+                # The key of the old count is swapped for the key of the new one.
+                self.__hash ^= (
+                    FACTORY_KEYS[offset + tile.index][count]
+                    ^ FACTORY_KEYS[offset + tile.index][count + 1]
+                )
+            self.__num_of_factories += 1
+            if tiles:
+                self.__num_of_non_empty += 1
 
         return factories
 
+    def clear_factory(self, factory_index: int) -> bytes:
+        """
+        Method that takes the index of a factory, and removes every tile from it.
+
+        It returns the count of each tile type the factory held, in the order of TILE_TYPES.
+        """
+        factory_counts: bytes = self.return_factory_counts(factory_index)
+        if any(factory_counts):
+            self.__tile_counts[factory_index * 5 : factory_index * 5 + 5] = (
+                array("B", bytes(5))
+            )
+            self.__hash ^= counts_key(
+                FACTORY_KEYS, factory_counts, factory_index * 5
+            )
+            self.__num_of_non_empty -= 1
+        return factory_counts
+
     def remove_all_instances_of_tile(
         self, tile_type: str, factory_index: int
     ) -> list[list[Tile]]:
@@ -69,10 +210,8 @@ class Factory:
 
         Then returns a list of the selected tiles and discarded tiles.
         """
-
-        # Validation ensures that the user is selecting a tile that exists in the factory, as well as whether the values passed in for
-        # tile_type and factory_index are a string and integer, respectively.
-        if tile_type not in self.__factories[factory_index]:
+        # Validation ensures that the user is selecting a tile that exists in the factory.
+        if not self.is_tile_in_factory(tile_type, factory_index):
             raise IndexError(
                 {
                     "class": "Game",
@@ -81,24 +220,46 @@ class Factory:
                 }
             )
 
-        selected_tiles: list[Tile] = []
+        # Every tile is removed from the factory. The tiles of the selected type are selected, and the rest are discarded.
+        tile_index: int = TILE_INDEXES[tile_type]
+        factory_counts: bytes = self.clear_factory(factory_index)
+        selected_tiles: list[Tile] = [TILES[tile_index]] * factory_counts[
+            tile_index
+        ]
         discarded_tiles: list[Tile] = []
+        for discarded_index, tile in enumerate(TILES):
+            if discarded_index != tile_index:
+                discarded_tiles += [tile] * factory_counts[discarded_index]
 
-        # For each Tile in the selected Factory, if the Tile is NOT the type selected, it will be appended to the discarded_tiles list,
-        # otherwise, it's appended to the selected_tiles list.
-        for tile in self.__factories[factory_index]:
-            if tile != tile_type:
-                discarded_tiles.append(tile)
-            else:
-                selected_tiles.append(tile)
+        return [selected_tiles, discarded_tiles]
 
-        # Replace tiles in factory at index factory_index with an empty list, thus removing the elements.
-        self.__factories[factory_index] = []
+    def restore_factory(
+        self, factory_index: int, tile_counts: Sequence[int]
+    ) -> None:
+        """
+        Method that takes the index of a factory and the count of each tile type it held, and puts the tiles back into the
+        factory.
 
-        return [selected_tiles, discarded_tiles]
+        This is used to undo removing tiles from a factory.
+        """
+        old_counts: array = self.__tile_counts[
+            factory_index * 5 : factory_index * 5 + 5
+        ]
+        was_empty: bool = not any(old_counts)
+        self.__tile_counts[factory_index * 5 : factory_index * 5 + 5] = array(
+            "B", tile_counts
+        )
+        self.__hash ^= counts_key(
+            FACTORY_KEYS, old_counts, factory_index * 5
+        ) ^ counts_key(FACTORY_KEYS, tile_counts, factory_index * 5)
+        self.__num_of_non_empty += int(was_empty) - int(not any(tile_counts))
 
     def clear_factories(self) -> None:
         """
         Method that clears the contents of the factories.
         """
-        self.__factories.clear()
+        # The counts are cleared in place, so any view of them stays valid.
+        self.__tile_counts[:] = array("B", bytes(len(self.__tile_counts)))
+        self.__num_of_factories = 0
+        self.__num_of_non_empty = 0
+        self.__hash = 0
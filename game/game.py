@@ -2,11 +2,70 @@
 Module containing the Game class implementation.
 """
 
+from array import array
+from collections.abc import Iterator
+from itertools import chain
+from random import Random
+from typing import TYPE_CHECKING
+import numpy as np
 from .board import Board
 from .bag import Bag
-from .tile import Tile
+from .tile import Tile, TILES, TILE_TYPES, TILE_INDEXES, START_MARKER
 from .factory import Factory
 from .rule_error import RuleError
+from .move import Move, CENTER, FLOOR
+from .state import GameState
+from .view import GameView, SequenceView
+from .rng import Seed, seed_sequence, spawn_rngs
+from .record import GameRecord
+from .instrumentation import Instrumentation
+from .summary import RoundSummary
+from .zobrist import (
+    BAG_KEYS,
+    CENTER_KEYS,
+    CURRENT_PLAYER_KEYS,
+    FIRST_PLAYER_KEYS,
+    LID_KEYS,
+    counts_key,
+    player_key,
+)
+from .observation import (
+    BAG_OFFSET,
+    BOARD_SIZE,
+    BOARDS_OFFSET,
+    CENTER_OFFSET,
+    CURRENT_PLAYER_OFFSET,
+    FACTORIES_OFFSET,
+    FLOOR_LINE_OFFSET,
+    LID_OFFSET,
+    OBSERVATION_SIZE,
+    PATTERN_LINES_OFFSET,
+    SCORE_OFFSET,
+    WALL_OFFSET,
+)
+
+if TYPE_CHECKING:
+    from numpy.random import Generator, SeedSequence
+
+# The kinds of change recorded in the journal. Each change is a tuple starting with its kind, followed by what's needed to undo it.
+# (kind, factory index, the tiles the factory held)
+_FACTORY: int = 0
+# (kind, the center of the table before it changed)
+_CENTER: int = 1
+# (kind, the start marker holder before it changed)
+_START_MARKER: int = 2
+# (kind, player index, pattern line index, number of tiles placed)
+_PATTERN_LINE: int = 3
+# (kind, player index, number of tiles placed onto the floor line)
+_FLOOR_LINE: int = 4
+# (kind, the lid before tiles were added)
+_LID: int = 5
+# (kind, player index, board state, floor line tiles) before the tiles were placed onto the wall
+_BOARD: int = 6
+# (kind, bag counts, factory counts, number of factories) before the factories were filled
+_FACTORIES: int = 7
+# (kind, current player, first player) before either changed
+_PLAYERS: int = 8
 
 
 class Game:
@@ -16,40 +75,284 @@ class Game:
     This is the only class that will be accessed by users of the game.
     """
 
+    __rng: "Random | Generator"
+    __seed_sequence: "SeedSequence | None"
     __bag: Bag
     __factory: Factory
     __num_of_players: int
     __num_of_factories: int
-    __center_of_table: list[Tile]
-    __lid: list[Tile]
+    __center_of_table: array
+    __start_marker_holder: int
+    __lid: array
     __start_marker: Tile
     __boards: list[Board]
     __final_scores: list[int]
-
-    def __init__(self) -> None:
+    __current_player: int
+    __first_player: int
+    __legal_moves: dict[Move, int]
+    __seed: Seed
+    __move_indexes: bytearray | None
+    __journal: list[tuple[Move | None, list[tuple]]]
+    __redo_moves: list[Move]
+    __view: GameView | None
+    __instrumentation: Instrumentation | None
+
+    def __init__(
+        self,
+        *,
+        seed: Seed = None,
+        rng: "Random | Generator | None" = None,
+        instrument: bool | Instrumentation = False,
+    ) -> None:
         """
         Constructor method that initliases Bag object.
+
+        It optionally takes a seed, or a random.Random or NumPy Generator, which the Bag uses to draw tiles. A seed is used to seed
+        a random.Random, so the same seed always draws the same tiles. Independent streams for other players or workers can be
+        spawned from the game with spawn_rngs.
+
+        If instrument is True, the calls of the public methods are recorded by a new Instrumentation, which is returned by
+        return_instrumentation. An Instrumentation can also be passed in, to share it between games. Otherwise, nothing is
+        recorded, and the methods run as they are.
         """
-        self.__bag = Bag()
+        # Validation to ensure the game only has one source of random numbers.
+        if seed is not None and rng is not None:
+            raise ValueError(
+                {
+                    "class": "Game",
+                    "method": "__init__",
+                    "message": "Please provide either a 'seed' or an 'rng', not both.",
+                }
+            )
+        self.__rng = rng if rng is not None else Random(seed)
+        # The SeedSequence is only created when streams are first spawned, so a seed random.Random accepts never fails here.
+        self.__seed_sequence = None
+        self.__bag = Bag(self.__rng)
         self.__factory: Factory = Factory()
         self.__num_of_players: int = 0
         self.__num_of_factories: int = 0
-        self.__start_marker: Tile = Tile("start")
-        self.__center_of_table: list[Tile] = [self.__start_marker]
-        self.__lid: list[Tile] = []
+        self.__start_marker: Tile = START_MARKER
+        # The center of the table is kept as the count of each tile type, in the order of TILE_TYPES, followed by whether the start
+        # marker is in the center, which it is from the start of each round until a player first takes from the center.
+        self.__center_of_table: array = array("B", [0] * len(TILE_TYPES) + [1])
+        # The index of the player whose floor line holds the start marker, or -1 if no player holds it.
+        self.__start_marker_holder: int = -1
+        self.__lid: array = array("B", [0] * len(TILE_TYPES))
         self.__boards: list[Board] = []
         self.__final_scores: list[int] = []
+        self.__current_player: int = 0
+        self.__first_player: int = 0
+        # The moves yielded by legal_moves for the current player, along with their index in the order they were yielded.
+        self.__legal_moves: dict[Move, int] = {}
+        self.__seed = seed
+        # The index of each move played with apply_move, which is only kept if the game can be replayed from an integer seed.
+        self.__move_indexes = (
+            bytearray()
+            if isinstance(seed, int) and 0 <= seed < 1 << 64
+            else None
+        )
+        self.__journal: list[tuple[Move | None, list[tuple]]] = []
+        self.__redo_moves: list[Move] = []
+        self.__view: GameView | None = None
+        self.__instrumentation = None
+        if instrument:
+            self.__instrumentation = (
+                instrument
+                if isinstance(instrument, Instrumentation)
+                else Instrumentation()
+            )
+            self.__instrumentation.attach(self)
+
+    def _start_entry(self, move: Move | None = None) -> None:
+        """
+        Method that takes the move being played, if any, and starts a new entry in the journal for the changes it makes.
+
+        Any undone moves can no longer be redone.
+        """
+        self.__journal.append((move, []))
+        self.__redo_moves = []
+
+    def _record(self, *change: object) -> None:
+        # Add the change to the latest entry in the journal.
+        self.__journal[-1][1].append(change)
 
     def _add_tiles_to_center(self, tiles: list[Tile]) -> None:
         # Add the selected tile list to the center of the table.
+        if tiles:
+            self._record(_CENTER, bytes(self.__center_of_table))
         for tile in tiles:
-            self.__center_of_table.append(tile)
+            self.__center_of_table[tile.index] += 1
 
-    def _is_in_board_floor_lines(self, tile: Tile) -> bool:
-        for board in self.__boards:
-            if tile in board.return_floor_line():
-                return True
-        return False
+    def _add_counts_to_center(
+        self, tile_counts: bytes, selected_index: int
+    ) -> None:
+        # Add the count of each tile type discarded from a factory (every type but the selected one) to the center of the table.
+        if sum(tile_counts) == tile_counts[selected_index]:
+            return
+        self._record(_CENTER, bytes(self.__center_of_table))
+        for tile_index in range(len(TILE_TYPES)):
+            if tile_index != selected_index:
+                self.__center_of_table[tile_index] += tile_counts[tile_index]
+
+    def _add_tiles_to_lid(self, tiles: list[Tile]) -> None:
+        self._record(_LID, bytes(self.__lid))
+        # The lid is kept as the count of each tile type, in the order of TILE_TYPES.
+        for tile in tiles:
+            # The start marker never goes into the lid.
+            if tile is not self.__start_marker:
+                self.__lid[tile.index] += 1
+
+    def _place_onto_floor_line(
+        self, tiles: list[Tile], player_index: int
+    ) -> None:
+        # The tiles are added to the floor line, and any leftover tiles are added to the lid.
+        returned_tiles: list[Tile] | None = self.__boards[
+            player_index
+        ].place_tiles_onto_floor_line(tiles=tiles)
+        self._record(
+            _FLOOR_LINE,
+            player_index,
+            len(tiles) - len(returned_tiles or ()),
+        )
+        if returned_tiles is not None:
+            self._add_tiles_to_lid(returned_tiles)
+
+    def _select_from_center(
+        self, tile_type: str, player_index: int
+    ) -> list[Tile]:
+        """
+        Method that takes the type of tile to be taken from the center of the table and the player index, and removes all tiles of
+        that type from the center, without any validation.
+
+        If no player holds the start marker yet, it's given to the player. The removed tiles are returned as a list.
+        """
+        # The tiles of the selected type are taken from the center of the table (the start marker leaves the center either way).
+        tile_index: int = TILE_INDEXES[tile_type]
+        self._record(_CENTER, bytes(self.__center_of_table))
+        selected_tiles: list[Tile] = [
+            TILES[tile_index]
+        ] * self.__center_of_table[tile_index]
+        self.__center_of_table[tile_index] = 0
+        self.__center_of_table[-1] = 0
+
+        # If the user selects from the center, it will add the start marker to their floor line, and they'll play first next round.
+        if self.__start_marker_holder == -1:
+            returned_tiles: list[Tile] | None = self.__boards[
+                player_index
+            ].place_tiles_onto_floor_line(tiles=[self.__start_marker])
+            self._record(_FLOOR_LINE, player_index, 0 if returned_tiles else 1)
+            self._record(_PLAYERS, self.__current_player, self.__first_player)
+            self.__first_player = player_index
+            # If the floor line is already full, the start marker isn't placed, so the next player to take from the center gets it.
+            if not returned_tiles:
+                self._record(_START_MARKER, self.__start_marker_holder)
+                self.__start_marker_holder = player_index
+
+        return selected_tiles
+
+    def _validate_move(self, move: Move, player_index: int) -> None:
+        """
+        Method that takes a move and the player index, and raises an error if the move isn't legal for that player.
+        """
+        # Validation to ensure that the type being passed in is of the specified types.
+        if move.tile_type not in ("black", "ice", "blue", "yellow", "red"):
+            raise ValueError(
+                {
+                    "class": "Game",
+                    "method": "apply_move",
+                    "message": "Tile type must be a string that contains either 'black', 'ice', 'blue', 'yellow', or 'red'.",
+                }
+            )
+        # Validation to ensure that the tiles are in the selected factory, or the center.
+        if move.source == CENTER:
+            if not self._is_in_center(move.tile_type):
+                raise IndexError(
+                    {
+                        "class": "Game",
+                        "method": "apply_move",
+                        "message": "No Tile of this type found within the center!",
+                    }
+                )
+        elif move.source not in range(
+            self.__num_of_factories
+        ) or not self.__factory.is_tile_in_factory(
+            move.tile_type, move.source
+        ):
+            raise IndexError(
+                {
+                    "class": "Game",
+                    "method": "apply_move",
+                    "message": "No Tile of this type found within the factory!",
+                }
+            )
+        # Validation to ensure that the destination is the floor line, or a pattern line the tiles can be placed onto.
+        if move.destination == FLOOR:
+            return
+        if move.destination not in range(0, 5):
+            raise IndexError(
+                {
+                    "class": "Game",
+                    "method": "apply_move",
+                    "message": "Selected Pattern Line doesn't exist. Please provide an index from 0-4, or FLOOR.",
+                }
+            )
+        if move.destination not in self.__boards[
+            player_index
+        ].return_available_pattern_lines(move.tile_type):
+            raise RuleError(
+                {
+                    "class": "Game",
+                    "method": "apply_move",
+                    "message": "Tiles of this type can't be placed onto the selected Pattern Line!",
+                }
+            )
+
+    def _apply_move(self, move: Move, player_index: int) -> None:
+        """
+        Method that takes a legal move and the player index, and plays the move for that player, without any validation.
+        """
+        selected_tiles: list[Tile]
+        # The tiles are taken from the center, or from the factory, in which case the discarded tiles are added to the center.
+        if move.source == CENTER:
+            selected_tiles = self._select_from_center(
+                move.tile_type, player_index
+            )
+        else:
+            factory_counts: bytes = self.__factory.clear_factory(move.source)
+            self._record(_FACTORY, move.source, factory_counts)
+            tile_index: int = TILE_INDEXES[move.tile_type]
+            selected_tiles = [TILES[tile_index]] * factory_counts[tile_index]
+            self._add_counts_to_center(factory_counts, tile_index)
+
+        # The tiles that fit are placed onto the pattern line,
+        if move.destination != FLOOR:
+            board: Board = self.__boards[player_index]
+            space_remaining: int = board.get_pattern_line_space(
+                move.destination
+            )
+            board.place_tile_onto_pattern_line(
+                selected_tiles[:space_remaining],
+                move.tile_type,
+                move.destination,
+            )
+            self._record(
+                _PATTERN_LINE,
+                player_index,
+                move.destination,
+                min(len(selected_tiles), space_remaining),
+            )
+            selected_tiles = selected_tiles[space_remaining:]
+
+        # and the rest fall onto the floor line.
+        if selected_tiles:
+            self._place_onto_floor_line(selected_tiles, player_index)
+
+    def _is_in_center(self, tile_type: str) -> bool:
+        # A tile type is in the center of the table if its count isn't 0.
+        tile_index: int | None = TILE_INDEXES.get(tile_type)
+        return (
+            tile_index is not None and self.__center_of_table[tile_index] > 0
+        )
 
     def _calculate_final_score(self, player_index: int) -> int:
         """
@@ -77,6 +380,68 @@ class Game:
 
         return self.__num_of_players
 
+    def return_current_player(self) -> int:
+        """
+        Method that returns the index of the player whose turn it is.
+        """
+
+        return self.__current_player
+
+    def view(self) -> GameView:
+        """
+        Method that returns a read-only view of the game, which reads the factories, the center of the table, the lid, the bag and
+        the boards as they are whenever it's accessed, without copying them.
+
+        The view is only created once, so it can be kept and read after every move. The lid and the bag are read-only memoryviews of
+        the count of each tile type, and the floor lines hold the tiles themselves rather than their tile types.
+        """
+        if self.__view is None:
+            self.__view = GameView(
+                factories=self.__factory.view(),
+                center=memoryview(self.__center_of_table).toreadonly(),
+                lid=memoryview(self.__lid).toreadonly(),
+                bag=self.__bag.view(),
+                boards=SequenceView(
+                    lambda: self.__boards, item_view=Board.view
+                ),
+                final_scores=SequenceView(lambda: self.__final_scores),
+                num_of_players=lambda: self.__num_of_players,
+                num_of_factories=lambda: self.__num_of_factories,
+                current_player=lambda: self.__current_player,
+                start_marker_holder=lambda: self.__start_marker_holder,
+            )
+        return self.__view
+
+    def return_instrumentation(self) -> Instrumentation | None:
+        """
+        Method that returns the Instrumentation the game was created with, or None if it wasn't created with one.
+        """
+        return self.__instrumentation
+
+    def return_hash(self) -> int:
+        """
+        Method that returns the Zobrist hash of the game, which is the same for any two games in the same position, whichever
+        order the moves were played in to reach it.
+
+        The factories and boards keep their hashes up to date as moves are played and undone, so only the center of the table, the
+        lid, the bag and whose turn it is (a few counts each) are hashed here.
+        """
+        key: int = (
+            self.__factory.return_hash()
+            ^ counts_key(CENTER_KEYS, self.__center_of_table)
+            ^ counts_key(LID_KEYS, self.__lid)
+            ^ counts_key(BAG_KEYS, self.__bag.view())
+        )
+        if self.__num_of_players:
+            key ^= (
+                CURRENT_PLAYER_KEYS[self.__current_player]
+                ^ FIRST_PLAYER_KEYS[self.__first_player]
+            )
+        # Each board is rotated by its player index, so swapping two players' boards changes the hash.
+        for player_index, board in enumerate(self.__boards):
+            key ^= player_key(board.return_hash(), player_index)
+        return key
+
     def return_factories(self) -> list[list[Tile]]:
         """
         Method that returns a list of the Factories and the Tiles contained in each Factory.
@@ -93,23 +458,25 @@ class Game:
         Method that returns a list of the Tiles in the center of the table.
         """
         center_of_table: list[Tile | str] = []
-        # For each tile in the center of the table,
-        for tile in self.__center_of_table:
-            # If the tile type is "start", append that to the list.
-            if tile == "start":
-                center_of_table.append("start")
-            # Otherwise, append the tile itself.
-            else:
-                center_of_table.append(tile)
-        # The center is returned as a list of lists.
+        # If the start marker is in the center of the table, "start" is added to the list first,
+        if self.__center_of_table[-1]:
+            center_of_table.append("start")
+        # followed by 'count' tiles of each tile type.
+        for tile, count in zip(TILES, self.__center_of_table):
+            center_of_table += [tile] * count
+        # The center is returned as a list.
         return center_of_table
 
     def return_lid(self) -> list[Tile]:
         """
         Method that returns a list of the Tiles in the lid.
         """
-        # For each tile in the lid, it's added to a list and returned.
-        lid = [tile for tile in self.__lid]
+        # For each tile type in the lid, 'count' tiles are added to a list and returned.
+        lid: list[Tile] = [
+            tile
+            for tile, count in zip(TILES, self.__lid)
+            for _ in range(count)
+        ]
 
         return lid
 
@@ -174,6 +541,45 @@ class Game:
         # For the selected player, their score is returned.
         return self.__boards[player_index].return_score()
 
+    def calculate_final_bonus(self, *, player_index: int) -> int:
+        """
+        Method that takes the player index, and returns the bonus the player would get for their full rows, columns and colours if
+        the game ended now, without adding it to their score.
+        """
+        # Validation to ensure the player_index is valid.
+        if player_index not in range(self.__num_of_players):
+            raise IndexError(
+                {
+                    "class": "Game",
+                    "method": "calculate_final_bonus",
+                    "message": f"Please enter a 'player_index' between 0 and {self.__num_of_players - 1}",
+                }
+            )
+
+        return self.__boards[player_index].calculate_final_bonus()
+
+    def return_projected_score(self, *, player_index: int) -> int:
+        """
+        Method that takes the player index, and returns the score the player would finish with if the game ended now, i.e. their
+        score plus the bonus for their full rows, columns and colours so far.
+
+        The walls keep count of what's full as tiles are placed, so this is cheap enough to call at every node of a search. Once the
+        final scores have been added, it returns the final score.
+        """
+        # Validation to ensure the player_index is valid.
+        if player_index not in range(self.__num_of_players):
+            raise IndexError(
+                {
+                    "class": "Game",
+                    "method": "return_projected_score",
+                    "message": f"Please enter a 'player_index' between 0 and {self.__num_of_players - 1}",
+                }
+            )
+
+        if self.__final_scores:
+            return self.__boards[player_index].return_score()
+        return self.__boards[player_index].return_projected_score()
+
     def return_winners(self) -> dict[int, int]:
         """
         Method that iterates through the final scores, and returns a dictionary of the winner indexes and their corresponding score.
@@ -209,10 +615,9 @@ class Game:
         """
         Method that checks if the center is empty.
 
-        Returns True if empty. Returns False otherwise.
+        Returns True if empty. Returns False otherwise. The start marker isn't a tile, so the center is empty even if it's there.
         """
-
-        return len(self.__center_of_table) <= 0
+        return not any(self.__center_of_table[:-1])
 
     def is_pattern_line_empty(
         self, *, line_index: int, player_index: int
@@ -311,6 +716,11 @@ class Game:
 
         # This value is stored as an attribute.
         self.__num_of_players = num_of_players
+        # Adding players can't be undone, so the journal is cleared. It also starts a new game, so the record of moves is cleared.
+        self.__journal.clear()
+        self.__redo_moves = []
+        if self.__move_indexes is not None:
+            self.__move_indexes.clear()
 
         player_indexes: list[int] = []
         # For each player index from 0 to the number of players (-1)
@@ -328,6 +738,31 @@ class Game:
         Method takes in the number of players, and based on that initilialises the factories, takes the correct
         number of tiles from the bag, and then places them into the relevant factories,
         """
+        self._start_entry()
+        return self._fill_factories()
+
+    def _fill_factories(self) -> list[list[Tile]]:
+        """
+        Method that fills the factories from the bag, adding the lid to the bag first if it doesn't have enough tiles, and records
+        the changes in the latest entry in the journal.
+
+        It returns the filled factories.
+        """
+        # The bag, factories, lid and players are recorded before they change, so filling the factories can be undone. Undoing it
+        # doesn't rewind the random number generator, so filling them again draws different tiles.
+        self._record(
+            _FACTORIES,
+            self.__bag.return_tile_counts(),
+            self.__factory.return_tile_counts(),
+            self.__num_of_factories,
+        )
+        self._record(_LID, bytes(self.__lid))
+        self._record(_PLAYERS, self.__current_player, self.__first_player)
+
+        # The start marker goes back into the center of the table at the start of every round.
+        if not self.__center_of_table[-1]:
+            self._record(_CENTER, bytes(self.__center_of_table))
+            self.__center_of_table[-1] = 1
 
         # The number of factories is set to 5 if the number if players is 2,
         self.__num_of_factories: int = (
@@ -341,12 +776,12 @@ class Game:
         )
 
         # If the bag doesn't have enough tiles to be added to the factory,
-        bag_tiles: list[Tile] = self.__bag.return_tile_bag()
-        if len(bag_tiles) < (self.__num_of_factories * 4):
+        if len(self.__bag) < (self.__num_of_factories * 4):
             # The tiles in the lid is added to the bag.
-            self.__bag.add_tiles_to_bag(self.__lid)
+            self.__bag.add_tile_counts(self.__lid)
             # And the lid is cleared.
-            self.__lid.clear()
+            for tile_index in range(len(self.__lid)):
+                self.__lid[tile_index] = 0
 
         # Otherwise, tiles are removed from the bag and added to the factories.
         tiles_from_bag: list[Tile] = self.__bag.remove_tiles_from_bag(
@@ -363,13 +798,18 @@ class Game:
                 current_factories.append(factory_tile)
 
         # If the lid is empty,
-        if not self.__lid:
+        if not any(self.__lid):
             # The tiles from the current factory is added to the bag.
             self.__bag.add_tiles_to_bag(current_factories)
 
         # And the factory is cleared.
         self.__factory.clear_factories()
 
+        # The player who took the start marker last round plays first.
+        self.__current_player = self.__first_player
+        # Any moves remembered by legal_moves are no longer trusted.
+        self.__legal_moves.clear()
+
         # The factories are then added to a list,
         factories: list[list[Tile]] = self.__factory.add_tiles_to_factories(
             tiles_from_bag
@@ -407,12 +847,22 @@ class Game:
             )
 
         returned_tiles: list[list[Tile]] = []
-
+        # Any moves remembered by legal_moves are no longer trusted.
+        self.__legal_moves.clear()
+        # Moves made outside apply_move can't be recorded.
+        self.__move_indexes = None
+
+        # The tiles the factory holds are kept, so removing them can be undone.
+        factory_counts: bytes = self.__factory.return_factory_counts(
+            factory_index
+        )
         # A method is called on the factory object to remove all tiles of type from specified factory.
         # Which returns lists of selected and discarded tiles.
         returned_tiles = self.__factory.remove_all_instances_of_tile(
             tile_type, factory_index
         )
+        self._start_entry()
+        self._record(_FACTORY, factory_index, factory_counts)
 
         return returned_tiles
 
@@ -426,7 +876,7 @@ class Game:
         """
 
         # If requested tile isn't in the center or the table, there are no tiles in the center, or tile is not a string, it will throw an error.
-        if tile_type not in self.__center_of_table:
+        if not self._is_in_center(tile_type):
             raise IndexError(
                 {
                     "class": "Game",
@@ -434,7 +884,7 @@ class Game:
                     "message": "No Tile of this type found within the center!",
                 }
             )
-        if len(self.__center_of_table) <= 0:
+        if self.is_center_empty():
             raise IndexError(
                 {
                     "class": "Game",
@@ -451,23 +901,15 @@ class Game:
                 }
             )
 
-        # For each tile in the center of the table, it will append it to the selected tiles, and then remove it from the center of the table.
-        selected_tiles: list[Tile] = []
-        for tile in self.__center_of_table:
-            if tile == tile_type:
-                selected_tiles.append(tile)
-                self.__center_of_table.remove(tile)
-
-        # If the user selects from the center, it will add the start marker to their floor line, and remove it from the center of the table.
-        if not self._is_in_board_floor_lines(self.__start_marker):
-            self.__boards[player_index].place_tiles_onto_floor_line(
-                tiles=[self.__start_marker]
-            )
-        # If the "start" tile is in the center, it will be removed from the center.
-        if self.__start_marker in self.__center_of_table:
-            self.__center_of_table.remove(self.__start_marker)
+        # Any moves remembered by legal_moves are no longer trusted.
+        self.__legal_moves.clear()
+        # Moves made outside apply_move can't be recorded.
+        self.__move_indexes = None
+        self._start_entry()
 
-        return selected_tiles
+        # The tiles of the selected type are removed from the center of the table, along with the start marker, which is added to the
+        # player's floor line if no one holds it yet.
+        return self._select_from_center(tile_type, player_index)
 
     def place_onto_pattern_line(
         self,
@@ -522,10 +964,25 @@ class Game:
                 }
             )
 
+        # Any moves remembered by legal_moves are no longer trusted.
+        self.__legal_moves.clear()
+        # Moves made outside apply_move can't be recorded.
+        self.__move_indexes = None
+
         # The selected tiles are placed onto the specified pattern line.
+        space_remaining: int = self.__boards[
+            player_index
+        ].get_pattern_line_space(line_index)
         self.__boards[player_index].place_tile_onto_pattern_line(
             selected_tiles, tile_type, line_index
         )
+        self._start_entry()
+        self._record(
+            _PATTERN_LINE,
+            player_index,
+            line_index,
+            min(len(selected_tiles), space_remaining),
+        )
 
         # The discarded tiles are added to the center of the table.
         self._add_tiles_to_center(discarded_tiles)
@@ -557,15 +1014,58 @@ class Game:
                     "message": "List provided is empty!",
                 }
             )
-        # The tiles in the list are then added to the floor line.
-        returned_tiles: list[Tile] | None = self.__boards[
-            player_index
-        ].place_tiles_onto_floor_line(tiles=tiles)
-        # If there are returned tiles, that means the floor line is full.
-        # And the leftover tiles are added to the lid.
-        if returned_tiles is not None:
-            for tile in returned_tiles:
-                self.__lid.append(tile)
+
+        # Any moves remembered by legal_moves are no longer trusted.
+        self.__legal_moves.clear()
+        # Moves made outside apply_move can't be recorded.
+        self.__move_indexes = None
+        self._start_entry()
+
+        # The tiles in the list are then added to the floor line. If the floor line is full, the leftover tiles are added to the lid.
+        self._place_onto_floor_line(tiles, player_index)
+
+        # If the start marker made it onto the floor line, the player now holds it.
+        if (
+            "start" in tiles
+            and "start" in self.__boards[player_index].return_floor_line()
+        ):
+            self._record(_START_MARKER, self.__start_marker_holder)
+            self.__start_marker_holder = player_index
+
+    def place_onto_center(self, *, tiles: list[Tile]) -> None:
+        """
+        Method that takes in a list of tiles discarded from a factory, and adds them to the center of the table.
+
+        This is used when the selected tiles are placed straight onto the floor line, rather than onto a pattern line.
+        """
+        for tile in tiles:
+            # Validation to ensure that each tile in the list is a valid tile. The start marker can't be put back into the center.
+            if tile not in ("black", "ice", "blue", "yellow", "red"):
+                raise ValueError(
+                    {
+                        "class": "Game",
+                        "method": "place_onto_center",
+                        "message": "Tile type must be a string that contains either 'black', 'ice', 'blue', 'yellow', or 'red'.",
+                    }
+                )
+        # If the length of the tiles list is less than 0, throw an index error.
+        if len(tiles) <= 0:
+            raise IndexError(
+                {
+                    "class": "Game",
+                    "method": "place_onto_center",
+                    "message": "List provided is empty!",
+                }
+            )
+
+        # Any moves remembered by legal_moves are no longer trusted.
+        self.__legal_moves.clear()
+        # Moves made outside apply_move can't be recorded.
+        self.__move_indexes = None
+        self._start_entry()
+
+        # The tiles in the list are then added to the center of the table.
+        self._add_tiles_to_center(tiles)
 
     def place_onto_wall(self, *, player_index: int) -> None:
         """
@@ -575,7 +1075,7 @@ class Game:
         """
 
         # Validation to ensure that the center of the table is empty. If it isn't it raises a Rule Error.
-        if len(self.__center_of_table) > 0:
+        if not self.is_center_empty():
             raise RuleError(
                 {
                     "class": "Game",
@@ -593,17 +1093,259 @@ class Game:
                 }
             )
 
+        # Any moves remembered by legal_moves are no longer trusted.
+        self.__legal_moves.clear()
+
+        # The board is recorded before the tiles are placed, so placing them can be undone.
+        board: Board = self.__boards[player_index]
+        self._start_entry()
+        self._record(
+            _BOARD,
+            player_index,
+            board.return_state(),
+            board.return_floor_tiles(),
+        )
+
         # For the selected player, the tiles on their full pattern lines are added to the wall. The cleared pattern lines are then returned.
-        returned_tiles: list[list[Tile]] = self.__boards[
-            player_index
-        ].place_tiles_onto_wall()
+        returned_tiles: list[list[Tile]] = board.place_tiles_onto_wall()
+
+        # The start marker is cleared from the floor line along with the other tiles.
+        if self.__start_marker_holder == player_index:
+            self._record(_START_MARKER, self.__start_marker_holder)
+            self.__start_marker_holder = -1
 
         # And for each cleared pattern line,
         for cleared_line in returned_tiles:
             # as long as the line isn't empty,
             if len(cleared_line) > 0:
                 # the tiles in the line are added to the lid.
-                self.__lid += cleared_line
+                self._add_tiles_to_lid(cleared_line)
+
+    def end_round(self, *, refill: bool = True) -> RoundSummary:
+        """
+        Method that ends the round in one call: every player places the tiles from their full pattern lines onto the wall, their
+        floor lines are scored and cleared, and the start marker leaves the floor line, so the player who held it plays first. If
+        the game hasn't ended, and refill is True, the factories are then filled for the next round, as initalise_factories does.
+
+        It returns the change in each player's score, whether the game has ended, and the filled factories. The whole round end is
+        undone by a single undo.
+        """
+        # Validation to ensure that the center of the table and the factories are empty. If they aren't, it raises a Rule Error.
+        if not self.is_center_empty():
+            raise RuleError(
+                {
+                    "class": "Game",
+                    "method": "end_round",
+                    "message": "Cannot end the round while the center still has tiles!",
+                }
+            )
+        if not self.__factory.is_factories_empty():
+            raise RuleError(
+                {
+                    "class": "Game",
+                    "method": "end_round",
+                    "message": "Cannot end the round while the factories still have tiles!",
+                }
+            )
+
+        # Any moves remembered by legal_moves are no longer trusted.
+        self.__legal_moves.clear()
+        self._start_entry()
+
+        score_deltas: list[int] = []
+        lid_tiles: list[Tile] = []
+        game_ended: bool = False
+        for player_index, board in enumerate(self.__boards):
+            # The board is recorded before the tiles are placed, so placing them can be undone.
+            score: int = board.return_score()
+            self._record(
+                _BOARD,
+                player_index,
+                board.return_state(),
+                board.return_floor_tiles(),
+            )
+            for cleared_line in board.place_tiles_onto_wall():
+                lid_tiles.extend(cleared_line)
+            score_deltas.append(board.return_score() - score)
+            game_ended = game_ended or board.is_wall_row_full()
+
+        # The start marker is cleared from the floor line along with the other tiles.
+        if self.__start_marker_holder != -1:
+            self._record(_START_MARKER, self.__start_marker_holder)
+            self.__start_marker_holder = -1
+        # The tiles from every player's cleared pattern lines and floor line are added to the lid at once.
+        if lid_tiles:
+            self._add_tiles_to_lid(lid_tiles)
+
+        # The factories are filled for the next round, unless the game has ended.
+        factories: list[list[Tile]] = (
+            self._fill_factories() if refill and not game_ended else []
+        )
+        return RoundSummary(tuple(score_deltas), game_ended, factories)
+
+    def legal_moves(self, player_index: int | None = None) -> Iterator[Move]:
+        """
+        Method that takes the player index (the current player by default), and yields every legal move for that player, straight
+        from the state of the game.
+
+        The moves yielded for the current player are remembered, so apply_move doesn't validate them again.
+        """
+        if player_index is None:
+            player_index = self.__current_player
+        # Validation to ensure the player_index is valid.
+        elif player_index not in range(self.__num_of_players):
+            raise IndexError(
+                {
+                    "class": "Game",
+                    "method": "legal_moves",
+                    "message": f"Please enter a 'player_index' between 0 and {self.__num_of_players - 1}",
+                }
+            )
+
+        board: Board = self.__boards[player_index]
+        trusted_moves: dict[Move, int] | None = (
+            self.__legal_moves
+            if player_index == self.__current_player
+            else None
+        )
+        # The available pattern lines are only looked up once for each type of tile.
+        available_pattern_lines: dict[str, list[int]] = {}
+        move_index: int = 0
+
+        # For each factory, and the center,
+        for source, tile_counts in chain(
+            enumerate(self.__factory.view()),
+            ((CENTER, self.__center_of_table),),
+        ):
+            # and each type of tile within it (the start marker, in the last slot of the center, can't be selected),
+            for tile_type, count in zip(TILE_TYPES, tile_counts):
+                if not count:
+                    continue
+                if tile_type not in available_pattern_lines:
+                    available_pattern_lines[tile_type] = (
+                        board.return_available_pattern_lines(tile_type)
+                    )
+                # the tiles can be placed onto any available pattern line, or the floor line.
+                for destination in chain(
+                    available_pattern_lines[tile_type], (FLOOR,)
+                ):
+                    move: Move = Move(source, tile_type, destination)
+                    if trusted_moves is not None:
+                        trusted_moves[move] = move_index
+                    move_index += 1
+                    yield move
+
+    def apply_move(self, move: Move) -> None:
+        """
+        Method that takes a move, and plays it for the current player. The turn then passes to the next player.
+
+        Moves yielded by legal_moves for the current player aren't validated again. Any other move is validated first.
+        """
+        player_index: int = self.__current_player
+        move_index: int | None = self.__legal_moves.get(move)
+        if move_index is None:
+            self._validate_move(move, player_index)
+        # The move is recorded as its index in the order of legal_moves.
+        if self.__move_indexes is not None:
+            if move_index is None:
+                move_index = list(self.legal_moves()).index(move)
+            self.__move_indexes.append(move_index)
+
+        # Every change the move makes is recorded in the journal, so it can be undone.
+        self._start_entry(move)
+        self._record(_PLAYERS, player_index, self.__first_player)
+        self._apply_move(move, player_index)
+
+        # The turn passes to the next player, and the remembered moves are no longer legal.
+        self.__current_player = (player_index + 1) % self.__num_of_players
+        self.__legal_moves.clear()
+
+    def undo(self) -> Move | None:
+        """
+        Method that reverses the last change made to the game, by reversing each change recorded in the journal for it, latest first.
+
+        It returns the move that was undone, which can be played again with redo, or None if the change wasn't made by apply_move.
+        """
+        # Validation to ensure there is something to undo.
+        if not self.__journal:
+            raise IndexError(
+                {
+                    "class": "Game",
+                    "method": "undo",
+                    "message": "There are no changes to undo!",
+                }
+            )
+
+        move, changes = self.__journal.pop()
+        for change in reversed(changes):
+            kind: int = change[0]
+            if kind == _FACTORY:
+                self.__factory.restore_factory(change[1], change[2])
+            elif kind == _CENTER:
+                # The center is replaced in place, so any view of it stays valid.
+                self.__center_of_table[:] = array("B", change[1])
+            elif kind == _START_MARKER:
+                self.__start_marker_holder = change[1]
+            elif kind == _PATTERN_LINE:
+                self.__boards[change[1]].remove_tiles_from_pattern_line(
+                    change[2], change[3]
+                )
+            elif kind == _FLOOR_LINE:
+                self.__boards[change[1]].remove_tiles_from_floor_line(
+                    change[2]
+                )
+            elif kind == _LID:
+                # The lid is replaced in place, so any view of it stays valid.
+                self.__lid[:] = array("B", change[1])
+            elif kind == _BOARD:
+                pattern_lines, floor_line, wall, score = change[2]
+                board: Board = self.__boards[change[1]]
+                board.restore_state(
+                    pattern_lines, floor_line, wall, score, None
+                )
+                board.restore_floor_line(change[3])
+            elif kind == _FACTORIES:
+                self.__bag.restore_tile_counts(change[1])
+                self.__factory.restore_tile_counts(change[2])
+                self.__num_of_factories = change[3]
+                # The random number generator isn't rewound, so the game can no longer be replayed from its seed.
+                self.__move_indexes = None
+            elif kind == _PLAYERS:
+                self.__current_player, self.__first_player = change[1:]
+
+        # Any moves remembered by legal_moves are no longer trusted.
+        self.__legal_moves.clear()
+        # Only moves can be redone, as anything else may have drawn tiles from the bag.
+        if move is None:
+            self.__redo_moves = []
+        else:
+            self.__redo_moves.append(move)
+            if self.__move_indexes is not None:
+                self.__move_indexes.pop()
+
+        return move
+
+    def redo(self) -> Move:
+        """
+        Method that plays the last move reversed by undo again, and returns it.
+        """
+        # Validation to ensure there is a move to redo.
+        if not self.__redo_moves:
+            raise IndexError(
+                {
+                    "class": "Game",
+                    "method": "redo",
+                    "message": "There are no moves to redo!",
+                }
+            )
+
+        # Playing the move starts a new journal entry, which would otherwise forget the rest of the undone moves.
+        redo_moves: list[Move] = self.__redo_moves
+        move: Move = redo_moves.pop()
+        self.apply_move(move)
+        self.__redo_moves = redo_moves
+
+        return move
 
     def calculate_final_scores(self) -> list[int]:
         """
@@ -617,7 +1359,203 @@ class Game:
             for player_index in range(self.__num_of_players)
         ]
 
+        # Adding the final scores can't be undone, so the journal is cleared.
+        self.__journal.clear()
+        self.__redo_moves = []
+
         # The final score attribute is incremented by final score,
         self.__final_scores += final_scores
         # and then returned.
         return final_scores
+
+    def encode_observation(
+        self, player_index: int, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Method that takes the player index, and encodes the game from that player's point of view as a fixed-shape vector, laid
+        out as described in game.observation.
+
+        The observation is written into out, a float32 or uint8 array of shape (OBSERVATION_SIZE,), which is allocated if it isn't
+        given. It returns out.
+        """
+        # Validation to ensure the player_index is valid.
+        if player_index not in range(self.__num_of_players):
+            raise IndexError(
+                {
+                    "class": "Game",
+                    "method": "encode_observation",
+                    "message": f"Please enter a 'player_index' between 0 and {self.__num_of_players - 1}",
+                }
+            )
+        if out is None:
+            out = np.zeros(OBSERVATION_SIZE, dtype=np.float32)
+        # Validation to ensure the observation fits into out.
+        elif out.shape != (OBSERVATION_SIZE,):
+            raise ValueError(
+                {
+                    "class": "Game",
+                    "method": "encode_observation",
+                    "message": f"out must be an array of shape ({OBSERVATION_SIZE},).",
+                }
+            )
+        else:
+            out.fill(0)
+
+        # The count of each tile type in each factory and in the center of the table.
+        for factory_index, factory_counts in enumerate(self.__factory.view()):
+            offset: int = FACTORIES_OFFSET + factory_index * 5
+            out[offset : offset + 5] = factory_counts
+        out[CENTER_OFFSET : CENTER_OFFSET + 6] = self.__center_of_table
+
+        # The boards, starting with the player's own board, followed by the other players in turn order.
+        for seat in range(self.__num_of_players):
+            board_index: int = (player_index + seat) % self.__num_of_players
+            board: Board = self.__boards[board_index]
+            offset = BOARDS_OFFSET + seat * BOARD_SIZE
+            pattern_lines, floor_line, wall, score = board.return_state()
+            for line_index in range(5):
+                tile_index: int = pattern_lines[line_index * 2]
+                if tile_index >= 0:
+                    out[
+                        offset
+                        + PATTERN_LINES_OFFSET
+                        + line_index * 5
+                        + tile_index
+                    ] = pattern_lines[line_index * 2 + 1]
+            # Only the cells with a tile on them are set.
+            while wall:
+                cell: int = wall.bit_length() - 1
+                out[offset + WALL_OFFSET + cell] = 1
+                wall ^= 1 << cell
+            out[
+                offset + FLOOR_LINE_OFFSET : offset + FLOOR_LINE_OFFSET + 5
+            ] = floor_line
+            if self.__start_marker_holder == board_index:
+                out[offset + FLOOR_LINE_OFFSET + 5] = 1
+            out[offset + SCORE_OFFSET] = score
+
+        # The count of each tile type in the bag and the lid.
+        out[BAG_OFFSET : BAG_OFFSET + 5] = self.__bag.return_tile_counts()
+        out[LID_OFFSET : LID_OFFSET + 5] = self.__lid
+        # Whose turn it is, counted from the player.
+        out[
+            CURRENT_PLAYER_OFFSET
+            + (self.__current_player - player_index) % self.__num_of_players
+        ] = 1
+
+        return out
+
+    def spawn_rngs(
+        self, n: int, *, numpy: bool = False
+    ) -> "list[Random] | list[Generator]":
+        """
+        Method that takes a number of streams, and spawns that many random number generators which are independent of each other
+        and of the game's own generator, i.e. for players, rollouts or parallel workers.
+
+        They're random.Random generators, or NumPy Generators if numpy is True. If the game was given a seed, the same seed always
+        spawns the same streams. Otherwise, they're seeded by drawing from the game's generator once, the first time streams are
+        spawned.
+        """
+        if self.__seed_sequence is None:
+            # A NumPy Generator already has a SeedSequence to spawn from.
+            if self.__seed is not None:
+                self.__seed_sequence = seed_sequence(self.__seed)
+            elif isinstance(self.__rng, Random):
+                self.__seed_sequence = seed_sequence(
+                    self.__rng.getrandbits(128)
+                )
+            else:
+                self.__seed_sequence = self.__rng.bit_generator.seed_seq
+        return spawn_rngs(self.__seed_sequence, n, numpy=numpy)
+
+    def return_record(self) -> GameRecord:
+        """
+        Method that returns the record of the game, i.e. its seed and the index of each move played with apply_move in the order
+        of legal_moves, which can be replayed with game.record.replay.
+
+        A game can only be recorded if it was created with an integer seed (from 0 to 2^64 - 1), every move was played with
+        apply_move, and filling the factories was never undone.
+        """
+        # Validation to ensure the game can be replayed from its record.
+        if self.__move_indexes is None:
+            raise ValueError(
+                {
+                    "class": "Game",
+                    "method": "return_record",
+                    "message": "Only games created with an integer 'seed', and played from the start with apply_move, can be recorded.",
+                }
+            )
+        return GameRecord(
+            self.__num_of_players, self.__seed, bytes(self.__move_indexes)
+        )
+
+    def snapshot(self) -> GameState:
+        """
+        Method that returns a compact, immutable and hashable snapshot of the game.
+
+        The snapshot can be copied and hashed cheaply, and turned back into a Game with from_snapshot.
+        """
+        board_states: list[
+            tuple[tuple[int, ...], tuple[int, ...], int, int]
+        ] = [board.return_state() for board in self.__boards]
+
+        return GameState(
+            self.__num_of_players,
+            self.__num_of_factories,
+            self.__factory.return_tile_counts(),
+            tuple(self.__center_of_table),
+            self.__start_marker_holder,
+            tuple(board_state[0] for board_state in board_states),
+            tuple(board_state[2] for board_state in board_states),
+            tuple(board_state[1] for board_state in board_states),
+            tuple(board_state[3] for board_state in board_states),
+            self.__bag.return_tile_counts(),
+            tuple(self.__lid),
+            tuple(self.__final_scores),
+            self.__current_player,
+            self.__first_player,
+        )
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        state: GameState,
+        *,
+        seed: Seed = None,
+        rng: "Random | Generator | None" = None,
+    ) -> "Game":
+        """
+        Method that takes a snapshot returned by snapshot, and returns a new Game in that state.
+
+        It optionally takes a seed, or a random.Random or NumPy Generator, which the Bag uses to draw tiles.
+        """
+        game: Game = cls(seed=seed, rng=rng)
+        if state.num_of_players:
+            game.initialise_players(num_of_players=state.num_of_players)
+        game.__num_of_factories = state.num_of_factories
+
+        game.__bag.restore_tile_counts(state.bag)
+        game.__factory.restore_tile_counts(state.factories)
+        game.__center_of_table[:] = array("B", state.center)
+        game.__start_marker_holder = state.start_marker_holder
+        game.__lid[:] = array("B", state.lid)
+
+        for player_index, board in enumerate(game.__boards):
+            board.restore_state(
+                state.pattern_lines[player_index],
+                state.floor_lines[player_index],
+                state.walls[player_index],
+                state.scores[player_index],
+                (
+                    game.__start_marker
+                    if state.start_marker_holder == player_index
+                    else None
+                ),
+            )
+        game.__final_scores = list(state.final_scores)
+        # The game didn't start from its seed, so it can't be recorded.
+        game.__move_indexes = None
+        game.__current_player = state.current_player
+        game.__first_player = state.first_player
+
+        return game
@@ -0,0 +1,369 @@
+"""
+Module containing the opt-in instrumentation of the Game facade, which counts the calls of each public method of a game along
+with the time spent in them, counts the errors they raise by exception type, and optionally measures the memory allocated in each
+round with tracemalloc.
+
+A game is only instrumented once an Instrumentation is attached to it, by creating it with Game(instrument=True), or with
+attach. The public methods are then wrapped on that game alone, so a game that isn't instrumented runs the same code as before.
+One Instrumentation can be attached to many games, to add up the counts of a whole match or tournament:
+
+    with Instrumentation(trace_allocations=True) as instrumentation:
+        game = instrumentation.attach(Game(seed=0))
+        ...
+    print(instrumentation.to_prometheus())
+"""
+
+import functools
+import inspect
+import time
+import tracemalloc
+import weakref
+from collections.abc import Callable, Iterator
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from .game import Game
+
+# Every round starts when the factories are filled, either by initalise_factories, or by end_round (unless it's asked not to).
+_ROUND_METHODS: frozenset[str] = frozenset(
+    ("initalise_factories", "end_round")
+)
+
+
+class RoundAllocations(NamedTuple):
+    """
+    Class that holds the memory allocated in a round: the number of bytes still allocated when the round ended, and the most
+    bytes allocated at once during the round, both counted from the start of the round.
+    """
+
+    round_index: int
+    allocated_bytes: int
+    peak_bytes: int
+
+
+class Instrumentation:
+    """
+    Class that records the calls of the public methods of the games it's attached to.
+
+    The time of a method includes the time of any other public method it calls, which is also counted as a call of that method.
+    Errors are counted once, by the method they were raised from, even if they pass through other public methods.
+    """
+
+    __trace_allocations: bool
+    __started_tracing: bool
+    __games: "weakref.WeakSet[Game]"
+    __calls: dict[str, int]
+    __seconds: dict[str, float]
+    __errors: dict[tuple[str, str], int]
+    __depth: int
+    __last_error: Exception | None
+    __rounds: list[RoundAllocations]
+    __round_start: int | None
+
+    def __init__(self, *, trace_allocations: bool = False) -> None:
+        """
+        Constructor method that optionally turns on tracing the memory allocated in each round, which starts tracemalloc if it
+        isn't running already. Tracing makes every allocation slower, so it's off by default.
+        """
+        self.__trace_allocations = trace_allocations
+        self.__started_tracing = False
+        # The games are held weakly, so a game that's no longer used is let go of without being detached.
+        self.__games = weakref.WeakSet()
+        self.__calls = {}
+        self.__seconds = {}
+        self.__errors = {}
+        self.__depth = 0
+        self.__last_error = None
+        self.__rounds = []
+        self.__round_start = None
+
+    def _count_error(self, method_name: str, error: Exception) -> None:
+        # An error is only counted by the first method it passes through, which is the one it was raised from.
+        if error is self.__last_error:
+            return
+        self.__last_error = error
+        key: tuple[str, str] = (method_name, type(error).__name__)
+        self.__errors[key] = self.__errors.get(key, 0) + 1
+
+    def _leave(self) -> None:
+        # Once the outermost method returns, the last error can't pass through any other method, so it's let go of.
+        self.__depth -= 1
+        if not self.__depth:
+            self.__last_error = None
+
+    def _wrap(
+        self, name: str, method: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        """
+        Method that takes the name of a public method and the method bound to a game, and returns a function that calls it,
+        counting the call, the time spent in it, and any error it raises.
+        """
+        calls: dict[str, int] = self.__calls
+        seconds: dict[str, float] = self.__seconds
+        calls.setdefault(name, 0)
+        seconds.setdefault(name, 0.0)
+        perf_counter: Callable[[], float] = time.perf_counter
+
+        # A generator (i.e. legal_moves) is timed while it produces each item, rather than when it's created.
+        if inspect.isgeneratorfunction(method):
+
+            @functools.wraps(method)
+            def generator_wrapper(*args: Any, **kwargs: Any) -> Iterator[Any]:
+                calls[name] += 1
+                generator: Iterator[Any] = method(*args, **kwargs)
+                while True:
+                    self.__depth += 1
+                    start: float = perf_counter()
+                    try:
+                        item: Any = next(generator)
+                    except StopIteration:
+                        return
+                    except Exception as error:
+                        self._count_error(name, error)
+                        raise
+                    finally:
+                        seconds[name] += perf_counter() - start
+                        self._leave()
+                    yield item
+
+            return generator_wrapper
+
+        # The arguments of a round method are bound to its signature, so refill is found however it's passed.
+        signature: inspect.Signature | None = (
+            inspect.signature(method) if name in _ROUND_METHODS else None
+        )
+
+        @functools.wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if signature is not None:
+                try:
+                    refill: bool = signature.bind(
+                        *args, **kwargs
+                    ).arguments.get("refill", True)
+                except TypeError:
+                    # The arguments don't fit the method, so the call below raises the error, and no round starts.
+                    refill = False
+                if refill:
+                    self._start_round()
+            calls[name] += 1
+            self.__depth += 1
+            start: float = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            except Exception as error:
+                self._count_error(name, error)
+                raise
+            finally:
+                seconds[name] += perf_counter() - start
+                self._leave()
+
+        return wrapper
+
+    def _start_round(self) -> None:
+        # The round before ends when the next one starts.
+        if not self.__trace_allocations:
+            return
+        self.finish_round()
+        tracemalloc.reset_peak()
+        self.__round_start = tracemalloc.get_traced_memory()[0]
+
+    def finish_round(self) -> None:
+        """
+        Method that ends the round in progress, if any, and records the memory allocated in it. Rounds also end when the next
+        round starts, and when the instrumentation is closed.
+        """
+        if self.__round_start is None or not tracemalloc.is_tracing():
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        self.__rounds.append(
+            RoundAllocations(
+                len(self.__rounds),
+                current - self.__round_start,
+                peak - self.__round_start,
+            )
+        )
+        self.__round_start = None
+
+    def attach(self, game: "Game") -> "Game":
+        """
+        Method that takes a game, and wraps each of its public methods, so their calls are recorded. It returns the game.
+
+        The game is only held weakly, so it doesn't need to be detached before it's let go of.
+        """
+        # Validation to ensure a game is only instrumented once.
+        if game in self.__games:
+            raise ValueError(
+                {
+                    "class": "Instrumentation",
+                    "method": "attach",
+                    "message": "This game is already instrumented.",
+                }
+            )
+        if self.__trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__started_tracing = True
+
+        # The wrappers are set on the game itself, so they're found before the methods of the class, and only this game is
+        # slowed down.
+        for name in dir(type(game)):
+            if name.startswith("_") or not inspect.isfunction(
+                inspect.getattr_static(type(game), name)
+            ):
+                continue
+            setattr(game, name, self._wrap(name, getattr(game, name)))
+        self.__games.add(game)
+        return game
+
+    def detach(self, game: "Game") -> None:
+        """
+        Method that takes a game this is attached to, and removes the wrappers from its methods.
+        """
+        for name in self.__calls:
+            vars(game).pop(name, None)
+        self.__games.discard(game)
+
+    def close(self) -> None:
+        """
+        Method that detaches from every game, ends the round in progress, and stops tracemalloc if it was started by this
+        instrumentation.
+        """
+        for game in list(self.__games):
+            self.detach(game)
+        self.finish_round()
+        if self.__started_tracing:
+            tracemalloc.stop()
+            self.__started_tracing = False
+
+    def __enter__(self) -> "Instrumentation":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def reset(self) -> None:
+        """
+        Method that sets every count back to 0, and forgets the recorded rounds.
+        """
+        for name in self.__calls:
+            self.__calls[name] = 0
+            self.__seconds[name] = 0.0
+        self.__errors.clear()
+        self.__rounds.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Method that returns the counts as a dictionary: the calls and seconds of each method that was called, the number of errors
+        of each exception type raised by each method, and the memory allocated in each round (if it's traced).
+        """
+        return {
+            "methods": {
+                name: {"calls": calls, "seconds": self.__seconds[name]}
+                for name, calls in sorted(self.__calls.items())
+                if calls
+            },
+            "errors": [
+                {"method": method, "exception": exception, "count": count}
+                for (method, exception), count in sorted(self.__errors.items())
+            ],
+            "rounds": [
+                round_allocations._asdict()
+                for round_allocations in self.__rounds
+            ],
+        }
+
+    def to_prometheus(self, prefix: str = "azul_game") -> str:
+        """
+        Method that takes a prefix for the metric names, and returns the counts in the Prometheus text exposition format.
+
+        The rounds are exported as totals, rather than a series for each round.
+        """
+        lines: list[str] = []
+
+        def metric(
+            name: str,
+            kind: str,
+            help_text: str,
+            samples: list[tuple[str, float]],
+        ) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{prefix}_{name}{labels} {value}")
+
+        called: dict[str, int] = {
+            name: calls
+            for name, calls in sorted(self.__calls.items())
+            if calls
+        }
+        metric(
+            "method_calls_total",
+            "counter",
+            "Number of calls of each public Game method.",
+            [
+                (f'{{method="{name}"}}', calls)
+                for name, calls in called.items()
+            ],
+        )
+        metric(
+            "method_seconds_total",
+            "counter",
+            "Wall time spent in each public Game method, in seconds.",
+            [
+                (f'{{method="{name}"}}', self.__seconds[name])
+                for name in called
+            ],
+        )
+        metric(
+            "errors_total",
+            "counter",
+            "Number of errors raised by each public Game method, by exception type.",
+            [
+                (f'{{method="{method}",exception="{exception}"}}', count)
+                for (method, exception), count in sorted(self.__errors.items())
+            ],
+        )
+        if self.__trace_allocations:
+            metric(
+                "rounds_total",
+                "counter",
+                "Number of rounds whose allocations were traced.",
+                [("", len(self.__rounds))],
+            )
+            metric(
+                "round_allocated_bytes_total",
+                "counter",
+                "Bytes still allocated at the end of each round, added up over the rounds.",
+                [
+                    (
+                        "",
+                        sum(
+                            round_allocations.allocated_bytes
+                            for round_allocations in self.__rounds
+                        ),
+                    )
+                ],
+            )
+            metric(
+                "round_peak_bytes",
+                "gauge",
+                "Most bytes allocated at once during any round.",
+                [
+                    (
+                        "",
+                        max(
+                            (
+                                round_allocations.peak_bytes
+                                for round_allocations in self.__rounds
+                            ),
+                            default=0,
+                        ),
+                    )
+                ],
+            )
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,518 @@
+"""
+Module containing the Monte Carlo tree search agent, which picks moves by playing out random games through the Game library.
+
+Run it directly to play the agent against a random policy, and report how many iterations per second it searches:
+
+    python3 -m game.mcts --games 10 --players 2 --iterations 500 --seed 0
+"""
+
+import argparse
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from random import Random
+from typing import NamedTuple
+from .game import Game
+from .move import Move
+from .rule_error import RuleError
+from .state import GameState
+from .simulate import (
+    MAX_ROUNDS,
+    Policy,
+    heuristic_policy,
+    play_rounds,
+    random_policy,
+)
+from .zobrist import TranspositionTable
+
+# The exploration constant of UCT. Rewards are between 0 and 1, so the usual value of sqrt(2) is used.
+EXPLORATION: float = math.sqrt(2)
+
+
+class Budget(NamedTuple):
+    """
+    Class that holds how long a search may run for. The search stops at whichever limit is reached first.
+    """
+
+    iterations: int | None = None
+    seconds: float | None = None
+
+
+class SearchStats(NamedTuple):
+    """
+    Class that holds how many iterations a search ran, and how quickly.
+    """
+
+    iterations: int
+    elapsed: float
+    iterations_per_second: float
+
+
+class _Node:
+    """
+    Class that holds a node of the search tree, i.e. the state of the game after a sequence of moves from the root.
+
+    The rewards are totalled for every player, so each player picks the moves that are best for them.
+    """
+
+    __slots__ = ("player", "children", "untried_moves", "visits", "rewards")
+
+    def __init__(
+        self, player: int, moves: list[Move], num_of_players: int
+    ) -> None:
+        self.player: int = player
+        self.children: dict[Move, _Node] = {}
+        self.untried_moves: list[Move] = moves
+        self.visits: int = 0
+        self.rewards: list[float] = [0.0] * num_of_players
+
+    def select_child(self, exploration: float) -> tuple[Move, "_Node"]:
+        """
+        Method that returns the move and child with the highest upper confidence bound for the player whose turn it is.
+        """
+        log_visits: float = math.log(self.visits)
+        player: int = self.player
+        return max(
+            self.children.items(),
+            key=lambda item: item[1].rewards[player] / item[1].visits
+            + exploration * math.sqrt(log_visits / item[1].visits),
+        )
+
+
+def _evaluate(game: Game) -> list[float]:
+    """
+    Function that takes a game at the end of a rollout, and returns the reward of each player.
+
+    The players with the highest score share a reward of 1. If the game has ended, the final bonuses are included in the scores.
+    """
+    num_of_players: int = game.return_num_of_players()
+    is_game_ended: bool = game.is_game_ended()
+    scores: list[int] = [
+        (
+            game.return_projected_score(player_index=player)
+            if is_game_ended
+            else game.return_score(player_index=player)
+        )
+        for player in range(num_of_players)
+    ]
+    max_score: int = max(scores)
+    winners: int = scores.count(max_score)
+
+    return [1 / winners if score == max_score else 0.0 for score in scores]
+
+
+class MCTSAgent:
+    """
+    Class that picks moves with a Monte Carlo tree search, using UCT to pick which moves to explore.
+
+    The tree covers the moves left in the current round, as the tiles drawn for the next round aren't known yet. Each rollout plays
+    out the round (and optionally later rounds) with the rollout policy, and is scored from the scores at the end of it.
+    """
+
+    __exploration: float
+    __rollout_policy: Policy
+    __rollout_rounds: int
+    __workers: int
+    __reuse_tree: bool
+    __rng: Random
+    __transposition_table: TranspositionTable | None
+    __root: _Node | None
+    __root_state: GameState | None
+    __stats: SearchStats
+
+    def __init__(
+        self,
+        *,
+        exploration: float = EXPLORATION,
+        rollout_policy: Policy = random_policy,
+        rollout_rounds: int = 1,
+        workers: int = 1,
+        reuse_tree: bool = True,
+        seed: int | str | None = None,
+        transposition_table: TranspositionTable | None = None,
+    ) -> None:
+        """
+        Constructor method that takes the settings of the search.
+
+        The rollout policy is random_policy or heuristic_policy from game.simulate, or any other Policy. Rollouts stop after
+        rollout_rounds rounds, or when the game ends. If workers is more than 1, that many independent searches are run in separate
+        processes and their visit counts are added up (root parallelism), in which case the tree isn't reused.
+
+        If a transposition table is given, nodes are looked up in it by the hash of their game, so positions reached through
+        different orders of moves share a node, and the nodes are shared with any other agent given the same table. The table isn't
+        used by worker processes.
+        """
+        if rollout_rounds < 1 or workers < 1:
+            raise ValueError(
+                {
+                    "class": "MCTSAgent",
+                    "method": "__init__",
+                    "message": "rollout_rounds and workers must be at least 1.",
+                }
+            )
+
+        self.__exploration = exploration
+        self.__rollout_policy = rollout_policy
+        self.__rollout_rounds = rollout_rounds
+        self.__workers = workers
+        self.__reuse_tree = reuse_tree
+        self.__rng = Random(seed)
+        self.__transposition_table = transposition_table
+        self.__root = None
+        self.__root_state = None
+        self.__stats = SearchStats(0, 0.0, 0.0)
+
+    def _rollout(self, game: Game, rng: Random) -> int:
+        """
+        Method that plays out the game with the rollout policy, until the end of the last rollout round or the game.
+
+        It returns the number of changes made, so they can all be undone.
+        """
+        changes: int = 0
+        rounds: int = 0
+        while True:
+            # Factory Offer: the players take turns until there are no tiles left to take.
+            moves: list[Move] = list(game.legal_moves())
+            while moves:
+                game.apply_move(
+                    self.__rollout_policy(
+                        game, game.return_current_player(), moves, rng
+                    )
+                )
+                changes += 1
+                moves = list(game.legal_moves())
+
+            # Wall Tiling: each player places the tiles from their full pattern lines onto the wall, and the factories are refilled
+            # for the next round, unless the game has ended, this was the last rollout round, or there are no tiles left.
+            rounds += 1
+            changes += 1
+            if not game.end_round(
+                refill=rounds < self.__rollout_rounds
+            ).factories:
+                return changes
+
+    def _search(
+        self, game: Game, root: _Node, budget: Budget, rng: Random
+    ) -> int:
+        """
+        Method that takes a copy of the game to search in place, the root of the tree, and the budget, and runs iterations of the
+        search until the budget runs out.
+
+        Every iteration is undone before the next, so the game is left as it was. It returns the number of iterations run.
+        """
+        num_of_players: int = game.return_num_of_players()
+        exploration: float = self.__exploration
+        deadline: float | None = (
+            time.perf_counter() + budget.seconds
+            if budget.seconds is not None
+            else None
+        )
+
+        iterations: int = 0
+        while (
+            budget.iterations is None or iterations < budget.iterations
+        ) and (deadline is None or time.perf_counter() < deadline):
+            node: _Node = root
+            path: list[_Node] = [root]
+
+            # Selection: while every move from the node has been tried, the child with the highest upper confidence bound is
+            # followed.
+            while not node.untried_moves and node.children:
+                move, node = node.select_child(exploration)
+                game.apply_move(move)
+                path.append(node)
+
+            # Expansion: one of the untried moves is played, and added to the tree.
+            if node.untried_moves:
+                move = node.untried_moves.pop()
+                game.apply_move(move)
+                child: _Node = self._new_node(game, num_of_players, rng)
+                node.children[move] = child
+                path.append(child)
+
+            # Simulation: the rest of the round is played out, and each player is rewarded from the scores.
+            changes: int = self._rollout(game, rng)
+            rewards: list[float] = _evaluate(game)
+
+            # Backpropagation: the rewards are added to every node on the path.
+            for node in path:
+                node.visits += 1
+                for player in range(num_of_players):
+                    node.rewards[player] += rewards[player]
+
+            # Every move and change is undone, back to the root.
+            for _ in range(changes + len(path) - 1):
+                game.undo()
+            iterations += 1
+
+        return iterations
+
+    def _find_subtree(
+        self, game: Game, node: _Node, state: GameState, depth: int
+    ) -> _Node | None:
+        """
+        Method that takes a game in the state of the node, and searches the explored children of the node, up to depth moves
+        deep, for the node that's in the given state.
+        """
+        if depth <= 0:
+            return None
+        for move, child in node.children.items():
+            game.apply_move(move)
+            found: _Node | None = (
+                child
+                if game.snapshot() == state
+                else self._find_subtree(game, child, state, depth - 1)
+            )
+            game.undo()
+            if found is not None:
+                return found
+        return None
+
+    def _new_node(self, game: Game, num_of_players: int, rng: Random) -> _Node:
+        """
+        Method that takes the game in the position of a new node, and returns a node with the legal moves of the game in a random
+        order.
+
+        If the agent has a transposition table, and the position is already in it, its node is returned instead.
+        """
+        table: TranspositionTable | None = self.__transposition_table
+        key: int = 0
+        if table is not None:
+            key = game.return_hash()
+            found: _Node | None = table.probe(key)
+            if found is not None:
+                return found
+
+        moves: list[Move] = list(game.legal_moves())
+        rng.shuffle(moves)
+        node: _Node = _Node(
+            game.return_current_player(), moves, num_of_players
+        )
+        if table is not None:
+            # A node with more legal moves heads a bigger subtree, so it's kept over one with fewer when their bucket is full.
+            table.store(key, node, len(moves))
+        return node
+
+    def _new_root(self, game: Game, num_of_players: int) -> _Node:
+        # A new root is created from the legal moves of the game, in a random order.
+        return self._new_node(game, num_of_players, self.__rng)
+
+    def choose_move(
+        self, game: Game, player_index: int, budget: Budget
+    ) -> Move:
+        """
+        Method that takes the game, the index of the player whose turn it is, and the budget of the search, and returns the move
+        the search visited the most.
+
+        The game isn't changed, as the search runs on a copy of it.
+        """
+        # Validation to ensure the budget has a limit.
+        if budget.iterations is None and budget.seconds is None:
+            raise ValueError(
+                {
+                    "class": "MCTSAgent",
+                    "method": "choose_move",
+                    "message": "The budget needs a number of iterations, a number of seconds, or both.",
+                }
+            )
+        # Validation to ensure that it's the player's turn.
+        if player_index != game.return_current_player():
+            raise RuleError(
+                {
+                    "class": "MCTSAgent",
+                    "method": "choose_move",
+                    "message": f"It's player {game.return_current_player()}'s turn, not player {player_index}'s!",
+                }
+            )
+
+        start: float = time.perf_counter()
+        state: GameState = game.snapshot()
+        num_of_players: int = game.return_num_of_players()
+        # The search runs on a copy of the game with its own random number generator, so it doesn't change the tiles drawn in the
+        # real game.
+        search_game: Game = Game.from_snapshot(
+            state, rng=Random(self.__rng.getrandbits(64))
+        )
+
+        # Validation to ensure there is a move to choose.
+        moves: list[Move] = list(search_game.legal_moves())
+        if not moves:
+            raise RuleError(
+                {
+                    "class": "MCTSAgent",
+                    "method": "choose_move",
+                    "message": "There are no legal moves left this round!",
+                }
+            )
+
+        visits: dict[Move, int]
+        iterations: int
+        if self.__workers > 1:
+            visits, iterations = self._search_in_parallel(state, budget)
+        else:
+            # The tree from the last search is reused, if the game has reached one of its nodes.
+            root: _Node | None = None
+            if self.__reuse_tree and self.__root is not None:
+                if self.__root_state == state:
+                    root = self.__root
+                elif self.__root_state is not None:
+                    previous_game: Game = Game.from_snapshot(self.__root_state)
+                    root = self._find_subtree(
+                        previous_game, self.__root, state, num_of_players
+                    )
+            if root is None:
+                root = self._new_root(search_game, num_of_players)
+
+            iterations = self._search(search_game, root, budget, self.__rng)
+            visits = {
+                move: child.visits for move, child in root.children.items()
+            }
+            self.__root, self.__root_state = root, state
+
+        elapsed: float = time.perf_counter() - start
+        self.__stats = SearchStats(
+            iterations, elapsed, iterations / elapsed if elapsed > 0 else 0.0
+        )
+
+        # If no move was searched, the first legal move is played.
+        if not visits:
+            return moves[0]
+        return max(visits, key=visits.__getitem__)
+
+    def _search_in_parallel(
+        self, state: GameState, budget: Budget
+    ) -> tuple[dict[Move, int], int]:
+        """
+        Method that runs an independent search in each worker process, and returns the total visits of each move from the root,
+        along with the total number of iterations.
+        """
+        visits: dict[Move, int] = {}
+        iterations: int = 0
+        with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+            futures = [
+                executor.submit(
+                    _search_worker,
+                    state,
+                    budget,
+                    self.__exploration,
+                    self.__rollout_policy,
+                    self.__rollout_rounds,
+                    self.__rng.getrandbits(64),
+                )
+                for _ in range(self.__workers)
+            ]
+            for future in futures:
+                worker_visits, worker_iterations = future.result()
+                for move, count in worker_visits.items():
+                    visits[move] = visits.get(move, 0) + count
+                iterations += worker_iterations
+
+        return visits, iterations
+
+    def return_search_stats(self) -> SearchStats:
+        """
+        Method that returns the number of iterations the last search ran, how long it took, and the iterations per second.
+        """
+        return self.__stats
+
+
+def _search_worker(
+    state: GameState,
+    budget: Budget,
+    exploration: float,
+    rollout_policy: Policy,
+    rollout_rounds: int,
+    seed: int,
+) -> tuple[dict[Move, int], int]:
+    """
+    Function that runs in a worker process, and searches from the given state with a new agent. It returns the visits of each
+    move from the root, along with the number of iterations.
+    """
+    agent: MCTSAgent = MCTSAgent(
+        exploration=exploration,
+        rollout_policy=rollout_policy,
+        rollout_rounds=rollout_rounds,
+        reuse_tree=False,
+        seed=seed,
+    )
+    game: Game = Game.from_snapshot(state, rng=Random(seed))
+    root: _Node = agent._new_root(game, game.return_num_of_players())
+    iterations: int = agent._search(game, root, budget, Random(seed))
+    return {
+        move: child.visits for move, child in root.children.items()
+    }, iterations
+
+
+def choose_move(game: Game, player_index: int, budget: Budget) -> Move:
+    """
+    Function that takes the game, the index of the player whose turn it is, and the budget of the search, and returns the move
+    chosen by a new agent with the default settings.
+
+    To reuse the tree between turns, or change the settings, create an MCTSAgent and call its choose_move method instead.
+    """
+    return MCTSAgent().choose_move(game, player_index, budget)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--seconds", type=float, default=None)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--rollout", choices=("random", "heuristic"), default="random"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    search_budget: Budget = Budget(arguments.iterations, arguments.seconds)
+    wins: float = 0.0
+    total_iterations: int = 0
+    total_elapsed: float = 0.0
+    for game_index in range(arguments.games):
+        # The agent plays as the first player, against a random policy in every other seat.
+        agent: MCTSAgent = MCTSAgent(
+            rollout_policy=(
+                heuristic_policy
+                if arguments.rollout == "heuristic"
+                else random_policy
+            ),
+            workers=arguments.workers,
+            seed=f"{arguments.seed}:{game_index}:agent",
+        )
+        policy_rng: Random = Random(f"{arguments.seed}:{game_index}:policy")
+        azul: Game = Game(rng=Random(f"{arguments.seed}:{game_index}"))
+        azul.initialise_players(num_of_players=arguments.players)
+        search_stats: list[SearchStats] = []
+
+        def match_policy(
+            game: Game,
+            player_index: int,
+            moves: list[Move],
+            rng: Random,
+            agent: MCTSAgent = agent,
+            search_stats: list[SearchStats] = search_stats,
+        ) -> Move:
+            # Every seat but the agent's plays randomly.
+            if player_index != 0:
+                return random_policy(game, player_index, moves, rng)
+            move: Move = agent.choose_move(game, player_index, search_budget)
+            search_stats.append(agent.return_search_stats())
+            return move
+
+        play_rounds(azul, match_policy, policy_rng, MAX_ROUNDS)
+        total_iterations += sum(stats.iterations for stats in search_stats)
+        total_elapsed += sum(stats.elapsed for stats in search_stats)
+
+        final_scores: list[int] = azul.calculate_final_scores()
+        winners: dict[int, int] = azul.return_winners()
+        if 0 in winners:
+            wins += 1 / len(winners)
+        print(f"Game {game_index + 1}: scores {final_scores}")
+
+    print(f"Agent win rate: {wins / max(arguments.games, 1):.3f}")
+    print(
+        f"{total_iterations} iterations in {total_elapsed:.2f}s "
+        f"({total_iterations / total_elapsed if total_elapsed > 0 else 0.0:.1f} iterations/sec)"
+    )
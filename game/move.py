@@ -0,0 +1,21 @@
+"""
+Module containing the Move type, which describes a single turn of the Factory Offer phase.
+"""
+
+from typing import NamedTuple
+
+# The source of a move that takes tiles from the center of the table, rather than from a factory.
+CENTER: int = -1
+# The destination of a move that places the tiles straight onto the floor line, rather than onto a pattern line.
+FLOOR: int = 5
+
+
+class Move(NamedTuple):
+    """
+    Class that describes a move: the factory index (or CENTER) the tiles are taken from, the type of tile taken, and the pattern
+    line index (or FLOOR) the tiles are placed onto.
+    """
+
+    source: int
+    tile_type: str
+    destination: int
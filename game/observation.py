@@ -0,0 +1,75 @@
+"""
+Module containing the layout of the observation tensor, which encodes a game from one player's point of view as a fixed-shape
+vector for machine learning.
+
+The layout is the same for every number of players: there is room for 9 factories and 4 boards, and unused slots are left as 0.
+The boards start with the observing player's board, followed by the other players in turn order.
+"""
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    from .game import Game
+
+MAX_FACTORIES: int = 9
+MAX_PLAYERS: int = 4
+
+# The count of each tile type in each factory.
+FACTORIES_OFFSET: int = 0
+# The count of each tile type in the center of the table, followed by whether the start marker is in the center.
+CENTER_OFFSET: int = FACTORIES_OFFSET + MAX_FACTORIES * 5
+# Each board is made up of the count of each tile type on each pattern line (line * 5 + tile type index), the wall (one value
+# per cell, row * 5 + column), the count of each tile type on the floor line followed by whether it holds the start marker, and
+# the score.
+BOARDS_OFFSET: int = CENTER_OFFSET + 6
+PATTERN_LINES_OFFSET: int = 0
+WALL_OFFSET: int = PATTERN_LINES_OFFSET + 25
+FLOOR_LINE_OFFSET: int = WALL_OFFSET + 25
+SCORE_OFFSET: int = FLOOR_LINE_OFFSET + 6
+BOARD_SIZE: int = SCORE_OFFSET + 1
+# The count of each tile type in the bag, and in the lid.
+BAG_OFFSET: int = BOARDS_OFFSET + MAX_PLAYERS * BOARD_SIZE
+LID_OFFSET: int = BAG_OFFSET + 5
+# Whose turn it is, counted from the observing player, one-hot.
+CURRENT_PLAYER_OFFSET: int = LID_OFFSET + 5
+
+OBSERVATION_SIZE: int = CURRENT_PLAYER_OFFSET + MAX_PLAYERS
+
+
+def encode_observations(
+    games: Sequence["Game"],
+    player_indexes: Sequence[int] | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Function that takes a list of games, and encodes each one from the point of view of the player at the same index in
+    player_indexes (the current player of each game by default).
+
+    The observations are written into the rows of out, a float32 or uint8 array of shape (len(games), OBSERVATION_SIZE), which
+    is allocated if it isn't given. It returns out.
+    """
+    if out is None:
+        out = np.zeros((len(games), OBSERVATION_SIZE), dtype=np.float32)
+    # Validation to ensure there is a row for every game.
+    elif out.shape != (len(games), OBSERVATION_SIZE):
+        raise ValueError(
+            {
+                "class": "observation",
+                "method": "encode_observations",
+                "message": f"out must be an array of shape ({len(games)}, {OBSERVATION_SIZE}).",
+            }
+        )
+
+    for game_index, game in enumerate(games):
+        game.encode_observation(
+            (
+                player_indexes[game_index]
+                if player_indexes is not None
+                else game.return_current_player()
+            ),
+            out=out[game_index],
+        )
+
+    return out
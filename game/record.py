@@ -0,0 +1,221 @@
+"""
+Module containing the compact binary game record, which stores a game as its seed and one byte per move, and replays it.
+
+A move is stored as its index in the order legal_moves yields the moves, which always fits in a byte (there are at most 9
+factories of up to 4 tile types and 5 tile types in the center, with 6 destinations each). Between moves, the rounds are played
+the same way as game.simulate: when there are no legal moves left, every player places their tiles onto the wall, and the
+factories are filled again before the next move.
+
+A record file starts with a magic number, followed by the records one after another. Each record is a header (the number of
+players, the seed and the number of moves) followed by the moves.
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Iterable, Iterator
+from random import Random
+from types import TracebackType
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple
+import numpy as np
+from .move import Move
+
+if TYPE_CHECKING:
+    from .game import Game
+
+MAGIC: bytes = b"AZULREC1"
+# The number of players (1 byte), the seed (8 bytes) and the number of moves (2 bytes), little-endian.
+_HEADER: struct.Struct = struct.Struct("<BQH")
+
+
+class GameRecord(NamedTuple):
+    """
+    Class that holds the record of a game: the number of players, the seed the game was created with, and the index of each move
+    in the order of legal_moves.
+    """
+
+    num_of_players: int
+    seed: int
+    moves: bytes
+
+    def to_bytes(self) -> bytes:
+        """
+        Method that returns the record in its binary form, i.e. its header followed by its moves.
+        """
+        return (
+            _HEADER.pack(self.num_of_players, self.seed, len(self.moves))
+            + self.moves
+        )
+
+
+def replay(record: GameRecord, num_of_moves: int | None = None) -> "Game":
+    """
+    Function that takes a record and a number of moves (every move by default), and returns the game after that many moves were
+    played.
+
+    If the round ended with the last move played, the players have already placed their tiles onto the wall.
+    """
+    # Validation to ensure the position is in the record.
+    if num_of_moves is None:
+        num_of_moves = len(record.moves)
+    elif num_of_moves not in range(len(record.moves) + 1):
+        raise IndexError(
+            {
+                "class": "record",
+                "method": "replay",
+                "message": f"Please enter a 'num_of_moves' between 0 and {len(record.moves)}",
+            }
+        )
+
+    # The game and simulate modules import this one, so they're imported when they're needed.
+    from .game import Game
+    from .simulate import play_rounds
+
+    move_indexes: Iterator[int] = iter(record.moves)
+
+    def recorded_policy(
+        game: "Game", player_index: int, moves: list[Move], rng: Random
+    ) -> Move:
+        # The move is the one at its index in the order of legal_moves.
+        move_index: int = next(move_indexes)
+        if move_index >= len(moves):
+            raise ValueError(
+                {
+                    "class": "record",
+                    "method": "replay",
+                    "message": f"Move {move_index} isn't a legal move.",
+                }
+            )
+        return moves[move_index]
+
+    game: Game = Game(seed=record.seed)
+    game.initialise_players(num_of_players=record.num_of_players)
+    # The rounds are played the same way as game.simulate, without a limit on the number of rounds. The moves come from the
+    # record, so the policy's random number generator is never used.
+    _, turns = play_rounds(
+        game, recorded_policy, Random(), None, max_turns=num_of_moves
+    )
+    # Validation to ensure every move was played before the game ended.
+    if turns < num_of_moves:
+        raise ValueError(
+            {
+                "class": "record",
+                "method": "replay",
+                "message": "The record has moves after the game ended.",
+            }
+        )
+
+    return game
+
+
+def write_records(file: BinaryIO, records: Iterable[GameRecord]) -> int:
+    """
+    Function that takes a binary file opened for writing (or appending), and writes the records to it. The magic number is
+    written first if the file is empty.
+
+    It returns the number of records written.
+    """
+    if file.tell() == 0:
+        file.write(MAGIC)
+    num_of_records: int = 0
+    for record in records:
+        file.write(record.to_bytes())
+        num_of_records += 1
+    return num_of_records
+
+
+class RecordReader:
+    """
+    Class that memory-maps a record file, and reads its records without loading the file into memory.
+
+    The offset of every record is found when the file is opened, so records can be read by index, as well as in order.
+    """
+
+    __file: BinaryIO
+    __map: mmap.mmap
+    __offsets: np.ndarray
+
+    def __init__(self, path: str) -> None:
+        self.__file = open(path, "rb")
+        # Validation to ensure the file is a record file. An empty file can't be memory-mapped, so its size is checked first.
+        if os.fstat(self.__file.fileno()).st_size < len(MAGIC):
+            self.__file.close()
+            raise ValueError(
+                {
+                    "class": "RecordReader",
+                    "method": "__init__",
+                    "message": f"{path} isn't a record file.",
+                }
+            )
+        self.__map = mmap.mmap(
+            self.__file.fileno(), 0, access=mmap.ACCESS_READ
+        )
+        if self.__map[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(
+                {
+                    "class": "RecordReader",
+                    "method": "__init__",
+                    "message": f"{path} isn't a record file.",
+                }
+            )
+
+        # Each record starts after the moves of the record before it.
+        offsets: list[int] = []
+        offset: int = len(MAGIC)
+        size: int = len(self.__map)
+        unpack_from = _HEADER.unpack_from
+        while offset < size:
+            offsets.append(offset)
+            # Validation to ensure the header and the moves of the record are all in the file.
+            end: int = offset + _HEADER.size
+            if end <= size:
+                end += unpack_from(self.__map, offset)[2]
+            if end > size:
+                self.close()
+                raise ValueError(
+                    {
+                        "class": "RecordReader",
+                        "method": "__init__",
+                        "message": f"{path} is truncated: record {len(offsets) - 1} doesn't fit in the file.",
+                    }
+                )
+            offset = end
+        self.__offsets = np.array(offsets, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.__offsets)
+
+    def __getitem__(self, index: int) -> GameRecord:
+        offset: int = int(self.__offsets[index])
+        num_of_players, seed, num_of_moves = _HEADER.unpack_from(
+            self.__map, offset
+        )
+        moves_offset: int = offset + _HEADER.size
+        return GameRecord(
+            num_of_players,
+            seed,
+            self.__map[moves_offset : moves_offset + num_of_moves],
+        )
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __enter__(self) -> "RecordReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Method that closes the memory map and the file.
+        """
+        self.__map.close()
+        self.__file.close()
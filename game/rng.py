@@ -0,0 +1,58 @@
+"""
+Module containing the random number generator plumbing, which turns seeds into random number generators, and spawns independent
+child streams from them for batch and parallel runners.
+
+Child streams are spawned with a NumPy SeedSequence, so they're independent of each other and of their parent, and the same seed
+always spawns the same streams.
+"""
+
+import hashlib
+from random import Random
+import numpy as np
+from numpy.random import Generator, SeedSequence
+
+# A seed is an integer, a string, or None for a seed taken from the operating system.
+Seed = int | str | None
+
+
+def seed_sequence(seed: Seed = None) -> SeedSequence:
+    """
+    Function that takes a seed, and returns the SeedSequence to spawn child streams from.
+
+    String seeds are hashed with SHA-256 rather than hash(), so they give the same SeedSequence in every process. A SeedSequence
+    only takes non-negative integers, so negative seeds (which random.Random accepts) are hashed too, from their signed bytes.
+    """
+    if isinstance(seed, str):
+        return SeedSequence(
+            int.from_bytes(hashlib.sha256(seed.encode()).digest(), "little")
+        )
+    if isinstance(seed, int) and seed < 0:
+        signed_bytes: bytes = seed.to_bytes(
+            (seed.bit_length() + 8) // 8, "little", signed=True
+        )
+        return SeedSequence(
+            int.from_bytes(hashlib.sha256(signed_bytes).digest(), "little")
+        )
+    return SeedSequence(seed)
+
+
+def spawn_rngs(
+    parent: SeedSequence, n: int, *, numpy: bool = False
+) -> list[Random] | list[Generator]:
+    """
+    Function that takes a SeedSequence, and spawns n independent child streams from it.
+
+    The streams are random.Random generators, or NumPy Generators if numpy is True. Spawning again from the same SeedSequence
+    gives new streams, which are independent of the ones spawned before.
+    """
+    children: list[SeedSequence] = parent.spawn(n)
+    if numpy:
+        return [np.random.default_rng(child) for child in children]
+    return [
+        Random(
+            int.from_bytes(
+                child.generate_state(4, np.uint32).tobytes(), "little"
+            )
+        )
+        for child in children
+    ]
@@ -0,0 +1,78 @@
+"""
+Module containing the rule tables shared by the Game library and the BatchGame engine.
+"""
+
+from array import array
+from .tile import TILE_TYPES
+
+# The wall is stored as a 25-bit integer, where the bit at index (row * 5 + column) is set if a tile is on the wall at that position.
+ROWS: int = 5
+COLUMNS: int = 5
+
+# Masks covering every bit of each row, each column, and each colour (the diagonal the colour occupies).
+ROW_MASKS: tuple[int, ...] = tuple(
+    0b11111 << (row * COLUMNS) for row in range(ROWS)
+)
+COLUMN_MASKS: tuple[int, ...] = tuple(
+    sum(1 << (row * COLUMNS + column) for row in range(ROWS))
+    for column in range(COLUMNS)
+)
+COLOUR_MASKS: tuple[int, ...] = tuple(
+    sum(
+        1 << (row * COLUMNS + (colour_index + row) % COLUMNS)
+        for row in range(ROWS)
+    )
+    for colour_index in range(len(TILE_TYPES))
+)
+
+
+def _count_adjacent_items(line: int, index: int) -> int:
+    """
+    Function that takes the 5 bits of a row or column, and the index of an item in that line.
+
+    It returns the number of consecutive items on either side of the item, EXCLUDING the item itself.
+    """
+    # The items after the index are the trailing ones of the shifted line.
+    after: int = line >> (index + 1)
+    after_count: int = (~after & (after + 1)).bit_length() - 1
+    # The items before the index stop at the highest gap below the index.
+    gaps: int = ~line & ((1 << index) - 1)
+    before_count: int = index - gaps.bit_length()
+
+    return before_count + after_count
+
+
+def _build_placement_scores() -> array:
+    """
+    Function that builds the placement score of every cell for every occupancy of its row and column.
+
+    The score of placing a tile at (row, column) is found at index (cell << 10) | (row bits << 5) | column bits, where cell is row * 5 + column.
+    """
+    placement_scores: array = array("B", bytes((ROWS * COLUMNS) << 10))
+    for cell in range(ROWS * COLUMNS):
+        row_index, column_index = divmod(cell, COLUMNS)
+        # The column scores only depend on the row index, so they're calculated once per cell.
+        column_scores: list[int] = [
+            _count_adjacent_items(column, row_index) for column in range(32)
+        ]
+        for row in range(32):
+            row_score: int = _count_adjacent_items(row, column_index)
+            for column in range(32):
+                # consecutive items in the row (excluding item) + consecutive items in the column (excluding item) + item itself for each row and column.
+                placement_scores[(cell << 10) | (row << 5) | column] = (
+                    row_score + column_scores[column] + 2
+                )
+    return placement_scores
+
+
+# The placement scores are built once, when the module is imported.
+PLACEMENT_SCORES: array = _build_placement_scores()
+
+# The bonus at the end of the game for each full row, each full column, and each colour with all of its tiles on the wall.
+ROW_BONUS: int = 2
+COLUMN_BONUS: int = 7
+COLOUR_BONUS: int = 10
+
+# The number of rounds after which a game is stopped. Random play can deadlock, with pattern lines waiting on tiles that are all
+# already on the walls, so the game would never end.
+MAX_ROUNDS: int = 50
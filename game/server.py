@@ -0,0 +1,584 @@
+"""
+Module containing the match server, which hosts many games at once in a single asyncio event loop.
+
+Clients connect over TCP or a Unix socket, and send requests as newline-delimited JSON. Every request is an object with an "op",
+and optionally an "id", which is copied onto its response:
+
+    {"id": 1, "op": "create", "players": 2, "seed": 0}      -> {"id": 1, "ok": true, "match": 1, "version": 0, "state": {...}}
+    {"id": 2, "op": "join", "match": 1, "player": 0}        -> {"id": 2, "ok": true}
+    {"id": 3, "op": "subscribe", "match": 1}                -> {"id": 3, "ok": true, "version": 0, "state": {...}}
+    {"id": 4, "op": "move", "match": 1, "source": 0, "tile_type": "blue", "destination": 2}
+                                                            -> {"id": 4, "ok": true, "version": 1}
+    {"id": 5, "op": "state", "match": 1}                    -> {"id": 5, "ok": true, "version": 1, "state": {...}}
+    {"id": 6, "op": "unsubscribe", "match": 1}              -> {"id": 6, "ok": true}
+    {"id": 7, "op": "close", "match": 1}                    -> {"id": 7, "ok": true}
+
+A request that fails gets {"id": ..., "ok": false, "error": {"class": ..., "method": ..., "message": ...}}.
+
+A player has to join a seat of the match before making moves for it. After every move, each client subscribed to the match is
+sent the fields of the state that changed:
+
+    {"event": "diff", "match": 1, "version": 1, "changes": {...}, "finished": false}
+
+The state is the match's GameState as an object. In the changes, the fields that hold a value for each factory or player
+(factories, pattern_lines, walls, floor_lines and scores) only hold the values that changed, keyed by their index. When a move
+ends the round, the walls are tiled and the factories filled straight away, and the diff also holds the round's "score_deltas".
+Once the game ends, "finished" is true and the diff holds the "winners".
+
+The engine is synchronous and cheap per move, so every request is handled to completion without yielding to the event loop,
+and one process can serve thousands of matches. Each match has its own Game, and so its own bag and random number generator.
+
+Run it directly to serve on a port, or on a Unix socket:
+
+    python3 -m game.server --port 8765
+    python3 -m game.server --unix /tmp/azul.sock
+"""
+
+import argparse
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any, Protocol
+from .game import Game
+from .move import Move
+from .rule_error import RuleError
+from .state import GameState
+from .summary import RoundSummary
+
+# The fields of GameState that hold a value for each factory or player, which are diffed index by index.
+_INDEXED_FIELDS: frozenset[str] = frozenset(
+    ("factories", "pattern_lines", "walls", "floor_lines", "scores")
+)
+# The most bytes that can wait to be sent to a client before it's considered too slow, and disconnected.
+_MAX_WRITE_BUFFER: int = 1 << 20
+
+
+class Connection(Protocol):
+    """
+    Class that describes a client of the server, which is sent the events of the matches it's subscribed to.
+    """
+
+    def send(self, message: dict[str, Any]) -> None: ...
+
+
+class _Match:
+    """
+    Class that holds a match hosted by the server: its game, the state last sent to its subscribers, and who plays each seat.
+    """
+
+    __slots__ = (
+        "game",
+        "state",
+        "version",
+        "finished",
+        "creator",
+        "seats",
+        "subscribers",
+    )
+
+    game: Game
+    state: GameState
+    version: int
+    finished: bool
+    creator: Connection
+    seats: list[Connection | None]
+    subscribers: list[Connection]
+
+    def __init__(
+        self, game: Game, num_of_players: int, creator: Connection
+    ) -> None:
+        self.game = game
+        self.state = game.snapshot()
+        self.version = 0
+        self.finished = False
+        self.creator = creator
+        self.seats = [None] * num_of_players
+        self.subscribers = []
+
+
+def _encode_state(state: GameState) -> dict[str, Any]:
+    # The state is sent as an object of its fields. Tuples are sent as JSON arrays.
+    return state._asdict()
+
+
+def _diff_states(old: GameState, new: GameState) -> dict[str, Any]:
+    """
+    Function that takes the state last sent to the subscribers of a match and its current state, and returns the fields that
+    changed.
+
+    The fields that hold a value for each factory or player only hold the values that changed, keyed by their index.
+    """
+    changes: dict[str, Any] = {}
+    for field, old_value, new_value in zip(GameState._fields, old, new):
+        if old_value == new_value:
+            continue
+        if field in _INDEXED_FIELDS and len(old_value) == len(new_value):
+            changes[field] = {
+                str(index): value
+                for index, (old_item, value) in enumerate(
+                    zip(old_value, new_value)
+                )
+                if old_item != value
+            }
+        else:
+            changes[field] = new_value
+    return changes
+
+
+class _StreamConnection:
+    """
+    Class that sends messages to a client connected over TCP or a Unix socket, as newline-delimited JSON.
+    """
+
+    __writer: asyncio.StreamWriter
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.__writer = writer
+
+    def send(self, message: dict[str, Any]) -> None:
+        """
+        Method that takes a message, and writes it to the client without waiting for it to be sent.
+
+        A client that lets too much pile up (i.e. one that subscribes to busy matches, but never reads) is disconnected.
+        """
+        if self.__writer.is_closing():
+            return
+        if self.__writer.transport.get_write_buffer_size() > _MAX_WRITE_BUFFER:
+            self.__writer.close()
+            return
+        self.__writer.write(
+            json.dumps(message, separators=(",", ":")).encode() + b"\n"
+        )
+
+
+class MatchServer:
+    """
+    Class that hosts matches, and handles the requests of their clients.
+
+    Requests are handled by handle_message, whichever way they arrive, so the server can be served over TCP, a Unix socket, or
+    used in-process through a LocalClient.
+    """
+
+    __max_matches: int
+    __matches: dict[int, _Match]
+    __next_match_id: int
+    __handlers: dict[str, Callable[[Connection, dict[str, Any]], dict]]
+
+    def __init__(self, *, max_matches: int = 100_000) -> None:
+        """
+        Constructor method that takes the most matches the server hosts at once.
+        """
+        self.__max_matches = max_matches
+        self.__matches = {}
+        self.__next_match_id = 1
+        self.__handlers = {
+            "create": self._create,
+            "join": self._join,
+            "subscribe": self._subscribe,
+            "unsubscribe": self._unsubscribe,
+            "state": self._state,
+            "move": self._move,
+            "close": self._close,
+        }
+
+    def return_num_of_matches(self) -> int:
+        """
+        Method that returns the number of matches the server is hosting.
+        """
+        return len(self.__matches)
+
+    def _field(
+        self, message: dict[str, Any], name: str, field_type: type
+    ) -> Any:
+        # Validation to ensure the request has the field, and that it has the right type (bools aren't accepted as integers).
+        value: Any = message.get(name)
+        if not isinstance(value, field_type) or (
+            field_type is int and isinstance(value, bool)
+        ):
+            raise ValueError(
+                {
+                    "class": "MatchServer",
+                    "method": str(message.get("op")),
+                    "message": f"Please provide '{name}' as a {field_type.__name__}.",
+                }
+            )
+        return value
+
+    def _match(self, message: dict[str, Any]) -> _Match:
+        # Validation to ensure the match exists.
+        match_id: int = self._field(message, "match", int)
+        match: _Match | None = self.__matches.get(match_id)
+        if match is None:
+            raise ValueError(
+                {
+                    "class": "MatchServer",
+                    "method": str(message.get("op")),
+                    "message": f"There is no match {match_id}.",
+                }
+            )
+        return match
+
+    def _create(
+        self, connection: Connection, message: dict[str, Any]
+    ) -> dict[str, Any]:
+        # Validation to ensure the server has room for another match.
+        if len(self.__matches) >= self.__max_matches:
+            raise RuleError(
+                {
+                    "class": "MatchServer",
+                    "method": "create",
+                    "message": f"The server is already hosting {self.__max_matches} matches.",
+                }
+            )
+        num_of_players: int = (
+            self._field(message, "players", int) if "players" in message else 2
+        )
+        seed: int | None = (
+            self._field(message, "seed", int)
+            if message.get("seed") is not None
+            else None
+        )
+
+        game: Game = Game(seed=seed)
+        game.initialise_players(num_of_players=num_of_players)
+        game.initalise_factories()
+
+        match_id: int = self.__next_match_id
+        self.__next_match_id += 1
+        match: _Match = _Match(game, num_of_players, connection)
+        self.__matches[match_id] = match
+        return {
+            "match": match_id,
+            "version": match.version,
+            "state": _encode_state(match.state),
+        }
+
+    def _join(
+        self, connection: Connection, message: dict[str, Any]
+    ) -> dict[str, Any]:
+        match: _Match = self._match(message)
+        player_index: int = self._field(message, "player", int)
+        # Validation to ensure the seat exists, and nobody else has taken it.
+        if player_index not in range(len(match.seats)):
+            raise IndexError(
+                {
+                    "class": "MatchServer",
+                    "method": "join",
+                    "message": f"Please enter a 'player' between 0 and {len(match.seats) - 1}",
+                }
+            )
+        if match.seats[player_index] not in (None, connection):
+            raise RuleError(
+                {
+                    "class": "MatchServer",
+                    "method": "join",
+                    "message": f"Player {player_index} has already been taken.",
+                }
+            )
+        match.seats[player_index] = connection
+        return {}
+
+    def _subscribe(
+        self, connection: Connection, message: dict[str, Any]
+    ) -> dict[str, Any]:
+        match: _Match = self._match(message)
+        if all(
+            subscriber is not connection for subscriber in match.subscribers
+        ):
+            match.subscribers.append(connection)
+        # The subscriber starts from the state the next diff is taken against.
+        return {"version": match.version, "state": _encode_state(match.state)}
+
+    def _unsubscribe(
+        self, connection: Connection, message: dict[str, Any]
+    ) -> dict[str, Any]:
+        match: _Match = self._match(message)
+        match.subscribers = [
+            subscriber
+            for subscriber in match.subscribers
+            if subscriber is not connection
+        ]
+        return {}
+
+    def _state(
+        self, connection: Connection, message: dict[str, Any]
+    ) -> dict[str, Any]:
+        match: _Match = self._match(message)
+        return {"version": match.version, "state": _encode_state(match.state)}
+
+    def _move(
+        self, connection: Connection, message: dict[str, Any]
+    ) -> dict[str, Any]:
+        match: _Match = self._match(message)
+        # Validation to ensure the match is still being played, and that the client plays the seat whose turn it is.
+        if match.finished:
+            raise RuleError(
+                {
+                    "class": "MatchServer",
+                    "method": "move",
+                    "message": "The match has already finished.",
+                }
+            )
+        game: Game = match.game
+        if match.seats[game.return_current_player()] is not connection:
+            raise RuleError(
+                {
+                    "class": "MatchServer",
+                    "method": "move",
+                    "message": "It isn't the turn of a player you've joined as.",
+                }
+            )
+        move: Move = Move(
+            self._field(message, "source", int),
+            self._field(message, "tile_type", str),
+            self._field(message, "destination", int),
+        )
+        game.apply_move(move)
+
+        event: dict[str, Any] = {}
+        # Once there are no tiles left to take, the round ends, and the next one starts (unless the game has ended).
+        if next(game.legal_moves(), None) is None:
+            summary: RoundSummary = game.end_round()
+            event["score_deltas"] = summary.score_deltas
+            if summary.game_ended or not summary.factories:
+                game.calculate_final_scores()
+                match.finished = True
+                event["winners"] = game.return_winners()
+
+        self._publish(match, message["match"], event)
+        return {"version": match.version}
+
+    def _close(
+        self, connection: Connection, message: dict[str, Any]
+    ) -> dict[str, Any]:
+        match: _Match = self._match(message)
+        # Validation to ensure only the client who created the match closes it.
+        if match.creator is not connection:
+            raise RuleError(
+                {
+                    "class": "MatchServer",
+                    "method": "close",
+                    "message": "Only the client who created the match can close it.",
+                }
+            )
+        del self.__matches[message["match"]]
+        return {}
+
+    def _publish(
+        self, match: _Match, match_id: int, event: dict[str, Any]
+    ) -> None:
+        """
+        Method that takes a match that has changed, its id, and anything else the event should hold, and sends the fields of its
+        state that changed to its subscribers.
+        """
+        state: GameState = match.game.snapshot()
+        changes: dict[str, Any] = _diff_states(match.state, state)
+        match.state = state
+        match.version += 1
+        if not match.subscribers:
+            return
+        message: dict[str, Any] = {
+            "event": "diff",
+            "match": match_id,
+            "version": match.version,
+            "changes": changes,
+            "finished": match.finished,
+            **event,
+        }
+        for subscriber in match.subscribers:
+            subscriber.send(message)
+
+    def handle_message(
+        self, connection: Connection, message: Any
+    ) -> dict[str, Any]:
+        """
+        Method that takes the client a request came from and the request, handles it, and returns the response.
+
+        Errors raised by the request are returned in the response, rather than raised.
+        """
+        if not isinstance(message, dict):
+            message = {}
+        request_id: Any = message.get("id")
+        op: Any = message.get("op")
+        try:
+            # Validation to ensure the request is an object with a known op.
+            handler: Callable[[Connection, dict[str, Any]], dict] | None = (
+                self.__handlers.get(op) if isinstance(op, str) else None
+            )
+            if handler is None:
+                raise ValueError(
+                    {
+                        "class": "MatchServer",
+                        "method": "handle_message",
+                        "message": f"Please provide an 'op' from {', '.join(self.__handlers)}.",
+                    }
+                )
+            response: dict[str, Any] = handler(connection, message)
+        except (RuleError, ValueError, IndexError) as error:
+            details: Any = error.args[0] if error.args else str(error)
+            return {
+                "id": request_id,
+                "ok": False,
+                "error": (
+                    details
+                    if isinstance(details, dict)
+                    else {
+                        "class": type(error).__name__,
+                        "method": str(op),
+                        "message": str(details),
+                    }
+                ),
+            }
+        return {"id": request_id, "ok": True, **response}
+
+    def disconnect(self, connection: Connection) -> None:
+        """
+        Method that takes a client that has gone away, and unsubscribes it from every match, and frees the seats it played.
+
+        The matches it created carry on, so the other players can finish them.
+        """
+        for match in self.__matches.values():
+            if any(
+                subscriber is connection for subscriber in match.subscribers
+            ):
+                match.subscribers = [
+                    subscriber
+                    for subscriber in match.subscribers
+                    if subscriber is not connection
+                ]
+            for player_index, seat in enumerate(match.seats):
+                if seat is connection:
+                    match.seats[player_index] = None
+
+    async def _serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Method that takes the streams of a client, and handles its requests, one per line, until it disconnects.
+        """
+        connection: _StreamConnection = _StreamConnection(writer)
+        try:
+            while not writer.is_closing():
+                try:
+                    line: bytes = await reader.readline()
+                except ValueError:
+                    # The line was longer than the stream's limit, so the client is disconnected.
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    message: Any = json.loads(line)
+                except ValueError:
+                    message = None
+                connection.send(self.handle_message(connection, message))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.disconnect(connection)
+            writer.close()
+
+    async def serve_tcp(
+        self, host: str = "127.0.0.1", port: int = 0
+    ) -> asyncio.Server:
+        """
+        Method that takes a host and port (any free port by default), and starts serving on them.
+
+        It returns the asyncio Server, whose sockets hold the port it's serving on.
+        """
+        return await asyncio.start_server(self._serve_connection, host, port)
+
+    async def serve_unix(self, path: str) -> asyncio.Server:
+        """
+        Method that takes the path of a Unix socket, and starts serving on it.
+
+        It returns the asyncio Server.
+        """
+        return await asyncio.start_unix_server(self._serve_connection, path)
+
+    def connect_local(self) -> "LocalClient":
+        """
+        Method that returns a client connected to the server in-process, without a socket.
+        """
+        return LocalClient(self)
+
+
+class LocalClient:
+    """
+    Class that stands in for a client connected over a socket, for tests and for running matches in-process.
+
+    Requests and events go through JSON just as they would over a socket, so anything that can't be sent is caught, but they're
+    handled straight away. The events of the matches it's subscribed to are queued, to be read with next_event.
+    """
+
+    __server: MatchServer
+    __events: asyncio.Queue
+    __next_request_id: int
+
+    def __init__(self, server: MatchServer) -> None:
+        self.__server = server
+        self.__events = asyncio.Queue()
+        self.__next_request_id = 1
+
+    def send(self, message: dict[str, Any]) -> None:
+        """
+        Method that takes an event from the server, and queues it.
+        """
+        self.__events.put_nowait(json.loads(json.dumps(message)))
+
+    async def request(self, op: str, **fields: Any) -> dict[str, Any]:
+        """
+        Method that takes an op and the fields of the request, sends it to the server, and returns the response.
+        """
+        request_id: int = self.__next_request_id
+        self.__next_request_id += 1
+        message: Any = json.loads(
+            json.dumps({"id": request_id, "op": op, **fields})
+        )
+        response: dict[str, Any] = self.__server.handle_message(self, message)
+        return json.loads(json.dumps(response))
+
+    async def next_event(self) -> dict[str, Any]:
+        """
+        Method that waits for the next event of a match the client is subscribed to, and returns it.
+        """
+        return await self.__events.get()
+
+    def return_num_of_events(self) -> int:
+        """
+        Method that returns the number of events waiting to be read.
+        """
+        return self.__events.qsize()
+
+    def close(self) -> None:
+        """
+        Method that disconnects the client from the server.
+        """
+        self.__server.disconnect(self)
+
+
+async def _serve(arguments: argparse.Namespace) -> None:
+    server: MatchServer = MatchServer(max_matches=arguments.max_matches)
+    asyncio_server: asyncio.Server = (
+        await server.serve_unix(arguments.unix)
+        if arguments.unix is not None
+        else await server.serve_tcp(arguments.host, arguments.port)
+    )
+    for server_socket in asyncio_server.sockets:
+        print(f"Serving on {server_socket.getsockname()}")
+    async with asyncio_server:
+        await asyncio_server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", default=None)
+    parser.add_argument("--max-matches", type=int, default=100_000)
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
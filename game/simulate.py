@@ -0,0 +1,196 @@
+"""
+Module containing the headless simulation engine, which plays games through the Game library without any I/O.
+
+Run it directly to report the games per second of a random policy:
+
+    python3 -m game.simulate --games 1000 --players 2 --seed 0
+"""
+
+import argparse
+import hashlib
+import time
+from collections.abc import Callable
+from random import Random
+from typing import NamedTuple
+from .game import Game
+from .move import Move, FLOOR
+from .rules import MAX_ROUNDS
+from .tile import Tile
+
+# A policy takes the game, the index of the player whose turn it is, the legal moves, and a random number generator, and returns a move.
+Policy = Callable[[Game, int, list[Move], Random], Move]
+# A move callback takes the game and the move chosen by the policy, before the move is played.
+MoveCallback = Callable[[Game, Move], None]
+
+
+class GameResult(NamedTuple):
+    """
+    Class that holds the compact result of a single game.
+    """
+
+    scores: tuple[int, ...]
+    winners: tuple[int, ...]
+    rounds: int
+    turns: int
+
+
+class SimulationReport(NamedTuple):
+    """
+    Class that holds the results of a batch of games, and how quickly they were played.
+    """
+
+    results: list[GameResult]
+    elapsed: float
+    games_per_second: float
+
+
+def random_policy(
+    game: Game, player_index: int, moves: list[Move], rng: Random
+) -> Move:
+    """
+    Policy that picks one of the legal moves at random.
+    """
+    return moves[rng.randrange(len(moves))]
+
+
+def heuristic_policy(
+    game: Game, player_index: int, moves: list[Move], rng: Random
+) -> Move:
+    """
+    Policy that picks one of the moves onto a pattern line at random, and only places tiles straight onto the floor line if it
+    has to.
+    """
+    pattern_line_moves: list[Move] = [
+        move for move in moves if move.destination != FLOOR
+    ]
+    if pattern_line_moves:
+        return pattern_line_moves[rng.randrange(len(pattern_line_moves))]
+    return moves[rng.randrange(len(moves))]
+
+
+def game_seed(seed: int, game_index: int) -> int:
+    """
+    Function that takes the seed of a batch and the index of a game in it, and returns the seed of that game.
+
+    The seed only depends on the game index, so a game is played the same way however the batch is split up. It's the first 8
+    bytes of the SHA-256 of the pair, so it's an integer that fits in a GameRecord, and every game of a batch can be recorded.
+    """
+    return int.from_bytes(
+        hashlib.sha256(f"{seed}:{game_index}".encode()).digest()[:8], "little"
+    )
+
+
+def play_rounds(
+    game: Game,
+    policy: Policy,
+    policy_rng: Random,
+    max_rounds: int | None = MAX_ROUNDS,
+    *,
+    max_turns: int | None = None,
+    on_move: MoveCallback | None = None,
+) -> tuple[int, int]:
+    """
+    Function that takes a game with its players added, and plays it round by round with the policy, starting by filling the
+    factories for the first round. It stops when the game ends, or once max_rounds rounds or max_turns moves have been played
+    (None is no limit). on_move is called with each move before it's played, i.e. to record the positions.
+
+    It returns the number of rounds and turns played. The final scores aren't added, so the caller can score the game or carry
+    on with it. If it stops after the last move of a round, the walls are tiled, but the factories aren't filled again.
+    """
+    rounds: int = 0
+    turns: int = 0
+    # If there are no tiles left to fill the factories with, the game ends.
+    factories: list[list[Tile]] = (
+        game.initalise_factories()
+        if max_rounds is None or max_rounds > 0
+        else []
+    )
+    while factories:
+        # Factory Offer: the players take turns, starting with the player who took the start marker last round, until there are
+        # no tiles left to take.
+        moves: list[Move] = list(game.legal_moves())
+        while moves:
+            if max_turns is not None and turns >= max_turns:
+                return rounds, turns
+            move: Move = policy(
+                game, game.return_current_player(), moves, policy_rng
+            )
+            if on_move is not None:
+                on_move(game, move)
+            game.apply_move(move)
+            turns += 1
+            moves = list(game.legal_moves())
+
+        # Wall Tiling: each player places the tiles from their full pattern lines onto the wall, and the factories are filled for
+        # the next round, unless the game has ended or either limit has been reached.
+        rounds += 1
+        factories = game.end_round(
+            refill=(max_rounds is None or rounds < max_rounds)
+            and (max_turns is None or turns < max_turns)
+        ).factories
+
+    return rounds, turns
+
+
+def play_game(
+    num_of_players: int,
+    policy: Policy,
+    seed: int | str,
+    max_rounds: int = MAX_ROUNDS,
+) -> GameResult:
+    """
+    Function that plays a single game between policies, and returns its result.
+
+    The same seed always plays the same game. If the game hasn't ended after max_rounds rounds, it's stopped and scored as it is.
+    """
+    game: Game = Game(seed=seed)
+    # The policy gets its own stream, spawned from the seed, so its choices don't change which tiles are drawn. This means
+    # policies compared on the same seeds start from the same tiles.
+    (policy_rng,) = game.spawn_rngs(1)
+    game.initialise_players(num_of_players=num_of_players)
+
+    rounds, turns = play_rounds(game, policy, policy_rng, max_rounds)
+
+    scores: tuple[int, ...] = tuple(game.calculate_final_scores())
+    winners: tuple[int, ...] = tuple(game.return_winners())
+    return GameResult(scores, winners, rounds, turns)
+
+
+def run_games(
+    n: int,
+    num_of_players: int = 2,
+    policy: Policy = random_policy,
+    seed: int = 0,
+    max_rounds: int = MAX_ROUNDS,
+) -> SimulationReport:
+    """
+    Function that plays n games between policies, and returns their results along with the number of games played per second.
+    """
+    start: float = time.perf_counter()
+    results: list[GameResult] = [
+        play_game(
+            num_of_players, policy, game_seed(seed, game_index), max_rounds
+        )
+        for game_index in range(n)
+    ]
+    elapsed: float = time.perf_counter() - start
+
+    return SimulationReport(
+        results, elapsed, n / elapsed if elapsed > 0 else 0.0
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    report: SimulationReport = run_games(
+        arguments.games, arguments.players, random_policy, arguments.seed
+    )
+    print(
+        f"{len(report.results)} games in {report.elapsed:.2f}s "
+        f"({report.games_per_second:.1f} games/sec)"
+    )
@@ -0,0 +1,31 @@
+"""
+Module containing the GameState class implementation.
+"""
+
+from typing import NamedTuple
+
+
+class GameState(NamedTuple):
+    """
+    Class that holds a compact, immutable and hashable snapshot of a game, made up of flat tuples of integers.
+
+    Tile types are stored as their index in TILE_TYPES, and the counts of tiles are stored in the same order. The center also
+    counts the start marker in its last slot. A pattern line is stored as its tile type index (or -1 if it's empty) followed by
+    the number of tiles on it. A wall is stored as a 25-bit integer, where bit (row * 5 + column) is set if a tile is on the wall.
+    The first player is the player who plays first in the next round.
+    """
+
+    num_of_players: int
+    num_of_factories: int
+    factories: tuple[tuple[int, ...], ...]
+    center: tuple[int, ...]
+    start_marker_holder: int
+    pattern_lines: tuple[tuple[int, ...], ...]
+    walls: tuple[int, ...]
+    floor_lines: tuple[tuple[int, ...], ...]
+    scores: tuple[int, ...]
+    bag: tuple[int, ...]
+    lid: tuple[int, ...]
+    final_scores: tuple[int, ...]
+    current_player: int
+    first_player: int
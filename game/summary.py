@@ -0,0 +1,19 @@
+"""
+Module containing the RoundSummary class implementation.
+"""
+
+from typing import NamedTuple
+from .tile import Tile
+
+
+class RoundSummary(NamedTuple):
+    """
+    Class that holds what happened at the end of a round: the change in each player's score from placing their tiles onto the wall
+    (and the penalty of their floor line), whether the game has ended, and the factories filled for the next round.
+
+    The factories are empty if they weren't filled, i.e. the game ended, filling them wasn't asked for, or there were no tiles left.
+    """
+
+    score_deltas: tuple[int, ...]
+    game_ended: bool
+    factories: list[list[Tile]]
@@ -4,24 +4,85 @@ Module containing the Tile class implementation.
 
 from typing import Any
 
+# The five tile types, in the order they appear on the first row of the wall.
+TILE_TYPES: tuple[str, ...] = ("blue", "yellow", "red", "black", "ice")
+# Lookup of tile type -> index of the tile type in TILE_TYPES.
+TILE_INDEXES: dict[str, int] = {
+    tile_type: index for index, tile_type in enumerate(TILE_TYPES)
+}
+
 
 class Tile:
     """
     Class responsible for the creation of Tiles.
+
+    Tiles are flyweights: there is only one Tile of each tile type (and one start marker), which is returned every time a Tile of
+    that type is created. This means two Tiles are equal only if they're the same Tile, so the engine compares them with 'is'.
+
+    A Tile still compares equal to its tile type as a string, and hashes the same way, so it can be used wherever a tile type is
+    expected. Its index is the index of its tile type in TILE_TYPES, or -1 for the start marker.
     """
 
-    def __init__(self, colour: str) -> None:
-        self.colour = colour
+    __slots__ = ("colour", "index")
+    __tiles: dict[str, "Tile"] = {}
+
+    colour: str
+    index: int
+
+    def __new__(cls, colour: str) -> "Tile":
+        tile: Tile | None = cls.__tiles.get(colour)
+        # The Tile of each tile type is only created the first time it's asked for.
+        if tile is None:
+            # Validation to ensure only the tile types and the start marker are made into Tiles.
+            if colour not in TILE_INDEXES and colour != "start":
+                raise ValueError(
+                    {
+                        "class": "Tile",
+                        "method": "__new__",
+                        "message": f"'{colour}' isn't a tile type. Please choose from {', '.join(TILE_TYPES)}, or 'start'.",
+                    }
+                )
+            tile = super().__new__(cls)
+            object.__setattr__(tile, "colour", colour)
+            object.__setattr__(tile, "index", TILE_INDEXES.get(colour, -1))
+            cls.__tiles[colour] = tile
+        return tile
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Every Tile of a tile type is the same Tile, so changing one would change them all.
+        raise AttributeError(
+            {
+                "class": "Tile",
+                "method": "__setattr__",
+                "message": "Tiles can't be changed once they're created.",
+            }
+        )
+
+    def __reduce__(self) -> tuple[type["Tile"], tuple[str]]:
+        # Copying or unpickling a Tile returns the Tile of that tile type.
+        return (Tile, (self.colour,))
 
     def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, str):
-            return NotImplemented
-        return self.colour == other
+        if isinstance(other, str):
+            return self.colour == other
+        if isinstance(other, Tile):
+            return self is other
+        return NotImplemented
 
     def __ne__(self, other: Any) -> bool:
-        if not isinstance(other, str):
-            return NotImplemented
-        return self.colour != other
+        if isinstance(other, str):
+            return self.colour != other
+        if isinstance(other, Tile):
+            return self is not other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.colour)
 
     def __repr__(self) -> str:
         return self.colour
+
+
+# The Tile of each tile type, in the order of TILE_TYPES, and the start marker.
+TILES: tuple[Tile, ...] = tuple(Tile(tile_type) for tile_type in TILE_TYPES)
+START_MARKER: Tile = Tile("start")
@@ -0,0 +1,250 @@
+"""
+Module containing the parallel tournament runner, which shards games across processes and merges their results.
+
+Run it directly to report the stats of a random policy against itself:
+
+    python3 -m game.tournament --games 10000 --players 2 --seed 0 --workers 4
+"""
+
+import argparse
+import math
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+from .simulate import (
+    GameResult,
+    Policy,
+    MAX_ROUNDS,
+    game_seed,
+    play_game,
+    random_policy,
+)
+
+
+class ChunkStats(NamedTuple):
+    """
+    Class that holds the running totals of a chunk of games.
+
+    The totals are all integers, so chunks can be merged in any order and always give the same stats.
+    """
+
+    games: int
+    wins: tuple[int, ...]
+    score_totals: tuple[int, ...]
+    score_squares: tuple[int, ...]
+    rounds: int
+
+    @classmethod
+    def from_results(
+        cls, num_of_players: int, results: list[GameResult]
+    ) -> "ChunkStats":
+        """
+        Method that takes the number of players and the results of a chunk of games, and returns their totals.
+
+        A tied game counts as a win for every winner.
+        """
+        return cls(
+            len(results),
+            tuple(
+                sum(1 for result in results if seat in result.winners)
+                for seat in range(num_of_players)
+            ),
+            tuple(
+                sum(result.scores[seat] for result in results)
+                for seat in range(num_of_players)
+            ),
+            tuple(
+                sum(result.scores[seat] ** 2 for result in results)
+                for seat in range(num_of_players)
+            ),
+            sum(result.rounds for result in results),
+        )
+
+    def merge(self, other: "ChunkStats") -> "ChunkStats":
+        """
+        Method that adds the totals of another chunk to these totals, and returns the merged totals.
+        """
+        return ChunkStats(
+            self.games + other.games,
+            tuple(map(sum, zip(self.wins, other.wins))),
+            tuple(map(sum, zip(self.score_totals, other.score_totals))),
+            tuple(map(sum, zip(self.score_squares, other.score_squares))),
+            self.rounds + other.rounds,
+        )
+
+
+class TournamentStats(NamedTuple):
+    """
+    Class that holds the aggregate stats of a tournament.
+    """
+
+    games: int
+    win_rates: tuple[float, ...]
+    mean_scores: tuple[float, ...]
+    stdev_scores: tuple[float, ...]
+    first_player_advantage: float
+    mean_rounds: float
+    elapsed: float
+    games_per_second: float
+
+    @classmethod
+    def from_totals(
+        cls, totals: ChunkStats, elapsed: float
+    ) -> "TournamentStats":
+        """
+        Method that takes the merged totals of every chunk and the time taken, and returns the aggregate stats.
+
+        The first player advantage is the win rate of the first seat minus the mean win rate of the other seats.
+        """
+        games: int = max(totals.games, 1)
+        win_rates: tuple[float, ...] = tuple(
+            wins / games for wins in totals.wins
+        )
+        mean_scores: tuple[float, ...] = tuple(
+            total / games for total in totals.score_totals
+        )
+        # The variance is calculated from the integer totals, so it doesn't depend on the order the chunks were merged in.
+        stdev_scores: tuple[float, ...] = tuple(
+            math.sqrt(max(games * squares - total**2, 0)) / games
+            for total, squares in zip(
+                totals.score_totals, totals.score_squares
+            )
+        )
+        first_player_advantage: float = win_rates[0] - sum(
+            win_rates[1:]
+        ) / max(len(win_rates) - 1, 1)
+
+        return cls(
+            totals.games,
+            win_rates,
+            mean_scores,
+            stdev_scores,
+            first_player_advantage,
+            totals.rounds / games,
+            elapsed,
+            totals.games / elapsed if elapsed > 0 else 0.0,
+        )
+
+
+def _play_chunk(
+    num_of_players: int,
+    policy: Policy,
+    seed: int,
+    first_game_index: int,
+    last_game_index: int,
+    max_rounds: int,
+) -> list[GameResult]:
+    """
+    Function that runs in a worker process, and plays the games from first_game_index up to (but not including) last_game_index.
+
+    Each game is seeded from the tournament seed and its game index, so it's played the same way whichever worker plays it.
+    """
+    return [
+        play_game(
+            num_of_players, policy, game_seed(seed, game_index), max_rounds
+        )
+        for game_index in range(first_game_index, last_game_index)
+    ]
+
+
+def iter_results(
+    n: int,
+    num_of_players: int = 2,
+    policy: Policy = random_policy,
+    seed: int = 0,
+    *,
+    workers: int | None = None,
+    chunk_size: int = 100,
+    max_rounds: int = MAX_ROUNDS,
+) -> Iterator[tuple[int, list[GameResult]]]:
+    """
+    Function that shards n games into chunks across a pool of worker processes, and yields the index of the first game in each
+    chunk along with the chunk's results, as each chunk finishes.
+
+    The policy is sent to the workers, so it must be picklable (i.e. a function defined at the top level of a module).
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                _play_chunk,
+                num_of_players,
+                policy,
+                seed,
+                first_game_index,
+                min(first_game_index + chunk_size, n),
+                max_rounds,
+            ): first_game_index
+            for first_game_index in range(0, n, chunk_size)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def run_tournament(
+    n: int,
+    num_of_players: int = 2,
+    policy: Policy = random_policy,
+    seed: int = 0,
+    *,
+    workers: int | None = None,
+    chunk_size: int = 100,
+    max_rounds: int = MAX_ROUNDS,
+) -> TournamentStats:
+    """
+    Function that plays n games across a pool of worker processes, and returns their aggregate stats.
+
+    The stats only depend on the seed, not on the number of workers or the size of the chunks.
+    """
+    start: float = time.perf_counter()
+    totals: ChunkStats = ChunkStats(
+        0,
+        (0,) * num_of_players,
+        (0,) * num_of_players,
+        (0,) * num_of_players,
+        0,
+    )
+    # As each chunk of results comes back, it's merged into the running totals.
+    for _, results in iter_results(
+        n,
+        num_of_players,
+        policy,
+        seed,
+        workers=workers,
+        chunk_size=chunk_size,
+        max_rounds=max_rounds,
+    ):
+        totals = totals.merge(ChunkStats.from_results(num_of_players, results))
+
+    return TournamentStats.from_totals(totals, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=100)
+    arguments = parser.parse_args()
+
+    stats: TournamentStats = run_tournament(
+        arguments.games,
+        arguments.players,
+        random_policy,
+        arguments.seed,
+        workers=arguments.workers,
+        chunk_size=arguments.chunk_size,
+    )
+    for seat in range(arguments.players):
+        print(
+            f"Seat {seat + 1}: win rate {stats.win_rates[seat]:.3f}, "
+            f"score {stats.mean_scores[seat]:.2f} "
+            f"± {stats.stdev_scores[seat]:.2f}"
+        )
+    print(f"First player advantage: {stats.first_player_advantage:+.3f}")
+    print(
+        f"{stats.games} games in {stats.elapsed:.2f}s "
+        f"({stats.games_per_second:.1f} games/sec)"
+    )
@@ -0,0 +1,237 @@
+"""
+Module containing the read-only views of a game, which read the live state of the game without copying it.
+
+A view is created once by each part of the game, and reads through to its current state on every access, so it can be kept and
+polled without building new lists.
+"""
+
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any
+from .tile import Tile, TILES, TILE_TYPES
+
+
+class SequenceView(Sequence[Any]):
+    """
+    Class that exposes a list (or any other sequence) as a read-only sequence, reading it through a function on every access, so
+    the list can be replaced by its owner and the view still reads the current one.
+
+    If nested is True, the items are themselves sequences, and each one is exposed as a read-only SequenceView, which is created
+    the first time it's accessed and kept. Otherwise, if item_view is given, each item is passed through it before being returned.
+    """
+
+    __slots__ = ("__source", "__nested", "__item_view", "__item_views")
+
+    def __init__(
+        self,
+        source: Callable[[], Sequence[Any]],
+        nested: bool = False,
+        item_view: Callable[[Any], Any] | None = None,
+    ) -> None:
+        self.__source = source
+        self.__nested = nested
+        self.__item_view = item_view
+        self.__item_views: dict[int, SequenceView] = {}
+
+    def _nested_view(self, index: int) -> "SequenceView":
+        # Each nested view reads the item at its index, so it still reads the current item if the item is replaced.
+        nested_view: SequenceView | None = self.__item_views.get(index)
+        if nested_view is None:
+            source: Callable[[], Sequence[Any]] = self.__source
+            nested_view = SequenceView(lambda: source()[index])
+            self.__item_views[index] = nested_view
+        return nested_view
+
+    def __getitem__(self, index: Any) -> Any:
+        # Slices are returned as a list, as they're a copy either way.
+        if isinstance(index, slice):
+            return list(self)[index]
+        if self.__nested:
+            return self._nested_view(range(len(self))[index])
+        item: Any = self.__source()[index]
+        if self.__item_view is not None:
+            return self.__item_view(item)
+        return item
+
+    def __len__(self) -> int:
+        return len(self.__source())
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.__nested:
+            for index in range(len(self)):
+                yield self._nested_view(index)
+        elif self.__item_view is not None:
+            yield from map(self.__item_view, self.__source())
+        else:
+            yield from self.__source()
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class WallView(Sequence[Sequence[Tile | None]]):
+    """
+    Class that exposes a wall as a read-only 5 x 5 grid, where each cell is the Tile on the wall, or None if there isn't one.
+
+    The tile type each cell holds is given by tile_type.
+    """
+
+    __slots__ = ("__occupancy", "__rows")
+
+    def __init__(self, occupancy: Callable[[], int]) -> None:
+        self.__occupancy = occupancy
+        self.__rows: tuple[_WallRowView, ...] = tuple(
+            _WallRowView(occupancy, row) for row in range(5)
+        )
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.__rows[index]
+
+    def __len__(self) -> int:
+        return len(self.__rows)
+
+    def return_occupancy(self) -> int:
+        """
+        Method that returns the occupancy of the wall as a 25-bit integer, where bit (row * 5 + column) is set if a tile is on the
+        wall.
+        """
+        return self.__occupancy()
+
+    def tile_type(self, row: int, column: int) -> str:
+        """
+        Method that takes the row and column of a cell, and returns the type of tile that goes there.
+        """
+        return TILE_TYPES[(column - row) % 5]
+
+    def __repr__(self) -> str:
+        return repr([list(row) for row in self.__rows])
+
+
+class _WallRowView(Sequence[Tile | None]):
+    """
+    Class that exposes a row of a wall as a read-only sequence of 5 cells.
+    """
+
+    __slots__ = ("__occupancy", "__row")
+
+    def __init__(self, occupancy: Callable[[], int], row: int) -> None:
+        self.__occupancy = occupancy
+        self.__row = row
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return list(self)[index]
+        column: int = range(5)[index]
+        # If the bit is set, the Tile of that cell's type is on the wall. Otherwise, it's None.
+        if self.__occupancy() >> (self.__row * 5 + column) & 1:
+            return TILES[(column - self.__row) % 5]
+        return None
+
+    def __len__(self) -> int:
+        return 5
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class BoardView:
+    """
+    Class that exposes a player's board as read-only views of its pattern lines, floor line and wall, along with its score.
+    """
+
+    __slots__ = ("pattern_lines", "floor_line", "wall", "__score")
+
+    pattern_lines: SequenceView
+    floor_line: SequenceView
+    wall: WallView
+
+    def __init__(
+        self,
+        pattern_lines: SequenceView,
+        floor_line: SequenceView,
+        wall: WallView,
+        score: Callable[[], int],
+    ) -> None:
+        self.pattern_lines = pattern_lines
+        self.floor_line = floor_line
+        self.wall = wall
+        self.__score = score
+
+    @property
+    def score(self) -> int:
+        return self.__score()
+
+
+class GameView:
+    """
+    Class that exposes a game as read-only views of its factories, center of the table, lid, bag and boards, along with the
+    number of players, whose turn it is, and which player holds the start marker (-1 if no player holds it).
+
+    Each factory, the center, the lid and the bag are memoryviews of the count of each tile type, in the order of TILE_TYPES. The
+    center has a sixth slot, which is 1 while the start marker is in the center.
+    """
+
+    __slots__ = (
+        "factories",
+        "center",
+        "lid",
+        "bag",
+        "boards",
+        "final_scores",
+        "__num_of_players",
+        "__num_of_factories",
+        "__current_player",
+        "__start_marker_holder",
+    )
+
+    factories: SequenceView
+    center: memoryview
+    lid: memoryview
+    bag: memoryview
+    boards: SequenceView
+    final_scores: SequenceView
+
+    def __init__(
+        self,
+        *,
+        factories: SequenceView,
+        center: memoryview,
+        lid: memoryview,
+        bag: memoryview,
+        boards: SequenceView,
+        final_scores: SequenceView,
+        num_of_players: Callable[[], int],
+        num_of_factories: Callable[[], int],
+        current_player: Callable[[], int],
+        start_marker_holder: Callable[[], int],
+    ) -> None:
+        self.factories = factories
+        self.center = center
+        self.lid = lid
+        self.bag = bag
+        self.boards = boards
+        self.final_scores = final_scores
+        self.__num_of_players = num_of_players
+        self.__num_of_factories = num_of_factories
+        self.__current_player = current_player
+        self.__start_marker_holder = start_marker_holder
+
+    @property
+    def num_of_players(self) -> int:
+        return self.__num_of_players()
+
+    @property
+    def num_of_factories(self) -> int:
+        return self.__num_of_factories()
+
+    @property
+    def current_player(self) -> int:
+        return self.__current_player()
+
+    @property
+    def start_marker_holder(self) -> int:
+        return self.__start_marker_holder()
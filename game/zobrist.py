@@ -0,0 +1,212 @@
+"""
+Module containing the Zobrist keys the parts of a game are hashed with, and the transposition table that search agents share.
+
+Every part of the game (the count of each tile type in each factory, each pattern line, the floor line, each cell of the wall, the
+score, and so on) has a random 64-bit key for each value it can hold. The hash of a game is the XOR of the keys of the values it
+holds, so when a part changes, its old key is XORed out and its new key is XORed in, without hashing the rest of the game again.
+
+The keys are drawn from a fixed seed, so a game has the same hash in every process.
+"""
+
+from collections.abc import Sequence
+from typing import Any, NamedTuple
+import numpy as np
+
+_GENERATOR: np.random.Generator = np.random.default_rng(0x41A2_5EED)
+
+
+def _keys(*shape: int) -> Any:
+    # The keys are converted to Python ints, as they're XORed one at a time.
+    return _GENERATOR.integers(
+        0, 1 << 64, size=shape, dtype=np.uint64, endpoint=False
+    ).tolist()
+
+
+def _with_empty_key(keys: list[list[int]]) -> tuple[tuple[int, ...], ...]:
+    # A count of 0 has a key of 0, so an empty factory or line doesn't change the hash.
+    return tuple(tuple([0] + row[1:]) for row in keys)
+
+
+# The key of each count (0 to 4) of each tile type in each factory, indexed by factory index * 5 + tile type index.
+FACTORY_KEYS: tuple[tuple[int, ...], ...] = _with_empty_key(_keys(9 * 5, 5))
+# The key of each count (0 to 5) of each tile type on each pattern line, indexed by line index * 5 + tile type index.
+PATTERN_LINE_KEYS: tuple[tuple[int, ...], ...] = _with_empty_key(
+    _keys(5 * 5, 6)
+)
+# The key of each count (0 to 7) of each tile type on the floor line, followed by the start marker.
+FLOOR_LINE_KEYS: tuple[tuple[int, ...], ...] = _with_empty_key(_keys(6, 8))
+# The key of each cell of the wall, indexed by row * 5 + column.
+WALL_KEYS: tuple[int, ...] = tuple(_keys(25))
+# The key of each score. Scores past the end of the keys wrap around.
+SCORE_KEYS: tuple[int, ...] = tuple(_keys(512))
+# The key of each count of each tile type in the center of the table (followed by the start marker), the lid and the bag.
+CENTER_KEYS: tuple[tuple[int, ...], ...] = _with_empty_key(_keys(6, 256))
+LID_KEYS: tuple[tuple[int, ...], ...] = _with_empty_key(_keys(5, 256))
+BAG_KEYS: tuple[tuple[int, ...], ...] = _with_empty_key(_keys(5, 256))
+# The key of each player being the current player, and being the first player of the next round.
+CURRENT_PLAYER_KEYS: tuple[int, ...] = tuple(_keys(4))
+FIRST_PLAYER_KEYS: tuple[int, ...] = tuple(_keys(4))
+
+_MASK: int = (1 << 64) - 1
+
+
+def player_key(key: int, player_index: int) -> int:
+    """
+    Function that takes the hash of a board and the index of the player it belongs to, and returns the hash rotated by 16 bits
+    per player, so the same board hashes differently for each player.
+
+    Rotating keeps the hash a XOR of keys, so it's still updated one key at a time.
+    """
+    shift: int = player_index * 16
+    return ((key << shift) | (key >> (64 - shift))) & _MASK
+
+
+def counts_key(
+    keys: Sequence[Sequence[int]], counts: Sequence[int], offset: int = 0
+) -> int:
+    """
+    Function that takes a table of keys and the count of each tile type, and returns the XOR of the key of each count, starting
+    at row offset of the table.
+    """
+    key: int = 0
+    for index, count in enumerate(counts):
+        key ^= keys[offset + index][count]
+    return key
+
+
+class TableStats(NamedTuple):
+    """
+    Class that holds how many times a transposition table was probed, how many probes found an entry, and how many entries were
+    stored and replaced.
+    """
+
+    probes: int
+    hits: int
+    stores: int
+    replacements: int
+
+
+class TranspositionTable:
+    """
+    Class that holds a bounded table of values keyed by the hash of a game, so positions reached through different orders of
+    moves are only searched once.
+
+    The table is split into buckets of two entries. The first entry of a bucket keeps the entry with the highest depth (the one
+    that took the most search to produce), and the second is always replaced, so new entries are never turned away. An entry that
+    loses the first slot to a deeper one moves into the second.
+    """
+
+    __mask: int
+    __keys: list[int]
+    __depths: list[int]
+    __values: list[Any]
+    __num_of_entries: int
+    __probes: int
+    __hits: int
+    __stores: int
+    __replacements: int
+
+    def __init__(self, size: int = 1 << 16) -> None:
+        """
+        Constructor method that takes the number of entries the table can hold, which is rounded up to a power of two.
+        """
+        # Validation to ensure the table can hold at least one bucket.
+        if size < 2:
+            raise ValueError(
+                {
+                    "class": "TranspositionTable",
+                    "method": "__init__",
+                    "message": "The table must hold at least 2 entries.",
+                }
+            )
+        # Each bucket holds 2 entries, so an odd size needs one more bucket than half of it.
+        num_of_buckets: int = 1 << ((size + 1) // 2 - 1).bit_length()
+        self.__mask = num_of_buckets - 1
+        # An empty entry has a key of -1, as every hash is positive.
+        self.__keys = [-1] * (num_of_buckets * 2)
+        self.__depths = [0] * (num_of_buckets * 2)
+        self.__values = [None] * (num_of_buckets * 2)
+        self.__num_of_entries = 0
+        self.__probes = 0
+        self.__hits = 0
+        self.__stores = 0
+        self.__replacements = 0
+
+    def __len__(self) -> int:
+        return self.__num_of_entries
+
+    def __contains__(self, key: int) -> bool:
+        slot: int = (key & self.__mask) * 2
+        return key in (self.__keys[slot], self.__keys[slot + 1])
+
+    def probe(self, key: int) -> Any | None:
+        """
+        Method that takes the hash of a game, and returns the value stored for it, or None if there isn't one.
+        """
+        self.__probes += 1
+        slot: int = (key & self.__mask) * 2
+        keys: list[int] = self.__keys
+        if keys[slot] == key:
+            self.__hits += 1
+            return self.__values[slot]
+        if keys[slot + 1] == key:
+            self.__hits += 1
+            return self.__values[slot + 1]
+        return None
+
+    def store(self, key: int, value: Any, depth: int = 0) -> None:
+        """
+        Method that takes the hash of a game, the value to store for it, and the depth it was searched to, and stores it.
+
+        If the game is already in the table, its entry is replaced.
+        """
+        self.__stores += 1
+        slot: int = (key & self.__mask) * 2
+        keys: list[int] = self.__keys
+        depths: list[int] = self.__depths
+        values: list[Any] = self.__values
+
+        old_keys: tuple[int, int] = (keys[slot], keys[slot + 1])
+
+        if keys[slot] == key or keys[slot] == -1 or depth >= depths[slot]:
+            # The deeper entry takes the first slot, and the entry it displaces moves into the second (unless it's the same game).
+            if keys[slot] not in (-1, key):
+                keys[slot + 1] = keys[slot]
+                depths[slot + 1] = depths[slot]
+                values[slot + 1] = values[slot]
+            elif keys[slot + 1] == key:
+                keys[slot + 1] = -1
+                values[slot + 1] = None
+            keys[slot] = key
+            depths[slot] = depth
+            values[slot] = value
+        else:
+            keys[slot + 1] = key
+            depths[slot + 1] = depth
+            values[slot + 1] = value
+
+        # The entries that are no longer in the bucket were replaced.
+        self.__num_of_entries += (keys[slot] != -1) + (keys[slot + 1] != -1)
+        self.__num_of_entries -= (old_keys[0] != -1) + (old_keys[1] != -1)
+        self.__replacements += sum(
+            old_key not in (-1, key, keys[slot], keys[slot + 1])
+            for old_key in old_keys
+        )
+
+    def clear(self) -> None:
+        """
+        Method that removes every entry from the table.
+        """
+        self.__keys = [-1] * len(self.__keys)
+        self.__depths = [0] * len(self.__depths)
+        self.__values = [None] * len(self.__values)
+        self.__num_of_entries = 0
+
+    def return_stats(self) -> TableStats:
+        """
+        Method that returns how many times the table was probed, how many probes found an entry, and how many entries were stored
+        and replaced.
+        """
+        return TableStats(
+            self.__probes, self.__hits, self.__stores, self.__replacements
+        )
@@ -6,13 +6,23 @@ This file contains the implementation that sets the game's parameters and plays
 
 # Please note, the script doesn't play the game very well, so the simulated scores are horribly low. :D
 
-from random import randrange
+from random import Random
 import logging
 from game import Game
 from game import Tile
 from game import RuleError
+from game import Move
+from game.mcts import Budget, choose_move
 
-game: Game = Game()
+# Set the seed to an integer to replay the same game every time.
+SEED: int | None = None
+# Set the budget to a Budget (e.g. Budget(iterations=200)) to have the simulated user pick their moves with the Monte Carlo tree
+# search agent, instead of picking them at random.
+MCTS_BUDGET: Budget | None = None
+
+game: Game = Game(seed=SEED)
+# The simulated user picks tiles with their own stream, so their choices don't change which tiles are drawn.
+user_rng: Random = game.spawn_rngs(1)[0]
 
 def get_available_pattern_line_index(returned_tiles: list[list[Tile]],
 tile_type: str, selected_player_index: int) -> int | None:
@@ -54,7 +64,7 @@ def play_turn_factory(selected_player_index: int, factory_index: int) -> None:
     Method that takes in the player_index and factory_index and selects tiles from the specified factory and places them onto the pattern line.
     """
     # Now, the user starts to play. They start by selecting a random tile index (from 0 to 3) from the selected factory index.
-    tile: str = str(factories[factory_index][randrange(0, 3)])
+    tile: str = str(factories[factory_index][user_rng.randrange(0, 3)])
 
     # The below method returns a list which contains two lists: tile(s) selected from the factory, and tiles to be discarded to the center of the table.
     tiles: list[list[Tile]] = game.select_from_factory(tile_type=tile, factory_index=factory_index)
@@ -112,6 +122,35 @@ def play_turn_center(selected_player_index: int) -> None:
     print(f"Floor Line: {game.return_floor_line(player_index=selected_player_index)}")
     print("\n\n")
 
+def play_turn_mcts(selected_player_index: int) -> None:
+    """
+    Method that takes in the player_index, asks the Monte Carlo tree search agent for a move, and plays it.
+    """
+    # The agent searches a copy of the game, so the game only changes when the move is played.
+    move: Move = choose_move(game, selected_player_index, MCTS_BUDGET)
+    game.apply_move(move)
+
+    print(f"\nPlayer {selected_player_index+1}:\n")
+    # The move the agent chose is returned.
+    print(f"Move: {move}")
+    # The factories are returned.
+    print(f"Factories: {game.return_factories()}")
+    # The pattern lines are returned.
+    print(f"Pattern Lines: {game.return_pattern_lines(player_index=selected_player_index)}")
+    # The center is returned.
+    print(f"Center: {game.return_center()}")
+    # The floor line is returned.
+    print(f"Floor Line: {game.return_floor_line(player_index=selected_player_index)}")
+    print("\n\n")
+
+def play_mcts_turns() -> None:
+    """
+    Method that, while there are tiles left in the factories or the center, plays a turn chosen by the agent for the player whose turn it is.
+    """
+    # The agent picks from the legal moves, so the players take their turns in the order the game says, starting with the player who took the start marker.
+    while next(game.legal_moves(), None) is not None:
+        play_turn_mcts(game.return_current_player())
+
 def play_factory_turns() -> None:
     """
     Method that loops through each factory and alternates between the number of players, each taking tiles from a factory.
@@ -141,20 +180,20 @@ def play_center_turns() -> None:
 
 def place_tiles_onto_wall() -> None:
     """
-    Method that loops through each player, and for each player places the tiles from each pattern line onto the wall.
+    Method that places the tiles from each pattern line onto the wall for every player, then prints each player's wall and score.
     """
+    # Every player places the tiles that have a full pattern line onto the wall at once. The factories are filled at the start of the next round.
+    score_deltas: tuple[int, ...] = game.end_round(refill=False).score_deltas
+
     # For each player in the list of players.
     for player in players:
-        # The player places the tiles that have a full pattern line onto the wall.
-        game.place_onto_wall(player_index=player)
-
         print(f"\nPlayer {player+1}:\n")
         # The wall is returned.
         wall: list[list[list[str | Tile | None]]] = game.return_wall(player_index=player)
         for wall_row in wall:
             print(f"{wall_row}\n")
         # The score is returned.
-        print(f"Score: {game.return_score(player_index=player)}\n")
+        print(f"Score: {game.return_score(player_index=player)} ({score_deltas[player]:+})\n")
         # The pattern lines are returned.
         print(f"Pattern Lines: {game.return_pattern_lines(player_index=player)}")
         # The lid is returned.
@@ -204,13 +243,18 @@ try:
         print(f"Round {round_index+1}: \n\n")
 
         # Factory Offer:
-        print("Taking from factories:\n\n")
-        ## This method plays a turn for each player until the factories are empty.
-        play_factory_turns()
-
-        print("Now taking from center:\n\n")
-        ## This method plays a turn for each player until the center is empty.
-        play_center_turns()
+        if MCTS_BUDGET is not None:
+            print("Taking tiles picked by the agent:\n\n")
+            ## This method plays a turn picked by the agent for each player until the factories and center are empty.
+            play_mcts_turns()
+        else:
+            print("Taking from factories:\n\n")
+            ## This method plays a turn for each player until the factories are empty.
+            play_factory_turns()
+
+            print("Now taking from center:\n\n")
+            ## This method plays a turn for each player until the center is empty.
+            play_center_turns()
         
         ## Wall Tiling
         # Now that both the factories and center is empty, the players start to place tiles onto the wall from the pattern lines.